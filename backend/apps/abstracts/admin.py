@@ -1,3 +1,36 @@
 from django.contrib import admin
+from unfold.admin import ModelAdmin
 
-# Register your models here.
+from apps.abstracts.models import JobLease
+
+
+@admin.register(JobLease)
+class JobLeaseAdmin(ModelAdmin):
+    list_display = ('name', 'owner', 'expires_at', 'last_started_at', 'last_finished_at')
+    search_fields = ('name', 'owner')
+
+
+class SoftDeleteAdminMixin:
+    """
+    Admin for AbstractBaseModel subclasses: lists soft-deleted rows too
+    and adds bulk soft delete/restore actions, one UPDATE per action.
+    """
+
+    actions = ('soft_delete_selected', 'restore_selected')
+
+    def get_queryset(self, request):
+        queryset = self.model.all_objects.get_queryset()
+        ordering = self.get_ordering(request)
+        if ordering:
+            queryset = queryset.order_by(*ordering)
+        return queryset
+
+    @admin.action(description='Soft delete selected')
+    def soft_delete_selected(self, request, queryset):
+        count = queryset.soft_delete()
+        self.message_user(request, f'{count} soft deleted.')
+
+    @admin.action(description='Restore selected')
+    def restore_selected(self, request, queryset):
+        count = queryset.restore()
+        self.message_user(request, f'{count} restored.')
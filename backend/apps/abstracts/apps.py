@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class AbstractsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.abstracts'
+
+    def ready(self):
+        from apps.abstracts.db import apply_sqlite_pragmas
+
+        connection_created.connect(apply_sqlite_pragmas, dispatch_uid="abstracts.sqlite_pragmas")
@@ -0,0 +1,148 @@
+# Python modules
+import base64
+import gzip
+import hashlib
+import io
+import json
+import os
+from typing import Any, Iterator, Optional
+
+# Third-party modules
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Headers describing the wire encoding, which no longer applies to the
+# decoded body stored in the archive
+_TRANSPORT_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+class HttpArchive:
+    """Directory of gzip-compressed HTTP responses keyed by URL.
+
+    Every response is stored as ``<sha1(url)>.json.gz`` holding the URL,
+    status code, headers and base64-encoded body.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    def path_for(self, url: str) -> str:
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json.gz")
+
+    def store(
+        self,
+        url: str,
+        status: int,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> None:
+        """Write one response, replacing any earlier recording of the URL."""
+        os.makedirs(self.directory, exist_ok=True)
+        entry = {
+            "url": url,
+            "status": status,
+            "headers": {
+                key: value
+                for key, value in headers.items()
+                if key.lower() not in _TRANSPORT_HEADERS
+            },
+            "body": base64.b64encode(body).decode("ascii"),
+        }
+        path = self.path_for(url)
+        with gzip.open(f"{path}.tmp", "wt", encoding="utf-8") as fh:
+            json.dump(entry, fh, ensure_ascii=False)
+        os.replace(f"{path}.tmp", path)
+
+    def load(self, url: str) -> Optional[dict[str, Any]]:
+        """Return the stored entry for a URL, or None if it was never recorded."""
+        path = self.path_for(url)
+        if not os.path.exists(path):
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            entry = json.load(fh)
+        entry["body"] = base64.b64decode(entry["body"])
+        return entry
+
+    def entries(self) -> Iterator[dict[str, Any]]:
+        """Yield every stored entry, in file name order."""
+        if not os.path.isdir(self.directory):
+            return
+        for name in sorted(os.listdir(self.directory)):
+            if name.endswith(".json.gz"):
+                with gzip.open(os.path.join(self.directory, name), "rt", encoding="utf-8") as fh:
+                    entry = json.load(fh)
+                entry["body"] = base64.b64decode(entry["body"])
+                yield entry
+
+    def __len__(self) -> int:
+        if not os.path.isdir(self.directory):
+            return 0
+        return sum(1 for name in os.listdir(self.directory) if name.endswith(".json.gz"))
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Transport adapter that performs real requests and archives the responses."""
+
+    def __init__(self, archive: HttpArchive, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.archive = archive
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        response = super().send(request, **kwargs)
+        self.archive.store(
+            request.url,
+            response.status_code,
+            dict(response.headers),
+            response.content,
+        )
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """Local stand-in transport serving responses from an archive."""
+
+    def __init__(self, archive: HttpArchive) -> None:
+        super().__init__()
+        self.archive = archive
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        entry = self.archive.load(request.url)
+        if entry is None:
+            # Like a server that never had the page: a plain, final 404
+            entry = {"url": request.url, "status": 404, "headers": {}, "body": b""}
+
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = entry["body"]
+        response._content_consumed = True
+        # Streaming callers read and close raw like a real connection's
+        response.raw = io.BytesIO(entry["body"])
+        response.url = entry["url"]
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def record_session(session: requests.Session, directory: str) -> HttpArchive:
+    """Route all session traffic through a RecordingAdapter."""
+    archive = HttpArchive(directory)
+    adapter = RecordingAdapter(archive)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return archive
+
+
+def replay_session(session: requests.Session, directory: str) -> HttpArchive:
+    """Serve all session traffic from a previously recorded archive."""
+    archive = HttpArchive(directory)
+    adapter = ReplayAdapter(archive)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return archive
@@ -0,0 +1,77 @@
+# Python modules
+import time
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Iterable, Optional
+
+# Django modules
+from django.db.models import Model
+
+DEFAULT_BATCH_SIZE = 500
+
+
+@dataclass
+class UpsertStats:
+    """Rows written to one table and how long it took."""
+
+    table: str
+    rows: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.table}: {self.rows} rows in {self.seconds * 1000:.1f} ms "
+            f"({self.rows_per_second:,.0f} rows/sec)"
+        )
+
+
+def bulk_upsert(
+    model: type[Model],
+    rows: Iterable[dict[str, Any]],
+    unique_fields: list[str],
+    update_fields: Optional[list[str]] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> UpsertStats:
+    """
+    Insert or update rows (dicts of field values) keyed by a unique
+    constraint, one INSERT ... ON CONFLICT DO UPDATE per chunk instead of
+    a SELECT plus INSERT/UPDATE per row.
+
+    ``update_fields`` defaults to every non-key field present in the first
+    row. Rows are consumed lazily, ``batch_size`` at a time. As with any
+    bulk_create, save() and signals are bypassed; auto_now fields are
+    still set.
+    """
+    stats = UpsertStats(model._meta.db_table)
+    iterator = iter(rows)
+    started = time.perf_counter()
+    while True:
+        chunk = list(islice(iterator, batch_size))
+        if not chunk:
+            break
+        if update_fields is None:
+            update_fields = [field for field in chunk[0] if field not in unique_fields]
+            # Keep auto_now columns (updated_at) current on update too
+            update_fields += [
+                field.name
+                for field in model._meta.concrete_fields
+                if getattr(field, "auto_now", False) and field.name not in update_fields
+            ]
+        objs = [model(**row) for row in chunk]
+        if update_fields:
+            model.objects.bulk_create(
+                objs,
+                update_conflicts=True,
+                unique_fields=unique_fields,
+                update_fields=update_fields,
+            )
+        else:
+            # Nothing to update: existing rows are left alone
+            model.objects.bulk_create(objs, ignore_conflicts=True)
+        stats.rows += len(chunk)
+    stats.seconds = time.perf_counter() - started
+    return stats
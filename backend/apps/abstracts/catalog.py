@@ -0,0 +1,152 @@
+# Python modules
+import json
+import os
+import time
+from datetime import datetime
+from typing import Any, Iterator, Optional
+
+# Django modules
+from django.apps import apps
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Model, Q
+from django.utils import timezone
+
+# Project modules
+from apps.abstracts.bulk import UpsertStats
+from apps.abstracts.seeds import MANIFEST_VERSION
+
+CATALOG_SET = "catalog"
+EXPORT_CHUNK_SIZE = 2000
+
+# Events are matched on their link: ids differ once the fetcher has run
+# in both environments, and foreign keys to events carry the link instead
+EVENT_REF = ("events.Event", "link")
+
+# Tables in dependency order: (model, upsert key, lookups that mark a row
+# as changed since a point in time, {foreign key column: (model, natural
+# key)}). Tables without timestamps are small and always exported in
+# full. Users and calendars are not catalogue data.
+CATALOG = [
+    ("events.PosterImage", ["id"], ["created_at"], {}),
+    ("places.Place", ["id"], ["updated_at", "deleted_at"], {}),
+    (
+        "places.PlaceTranslation",
+        ["place_id", "language_id"],
+        ["place__updated_at", "place__deleted_at"],
+        {},
+    ),
+    ("events.Event", ["link"], ["updated_at", "deleted_at"], {"duplicate_of_id": EVENT_REF}),
+    (
+        "events.EventTranslation",
+        ["event_id", "language_id"],
+        ["event__updated_at", "event__deleted_at"],
+        {"event_id": EVENT_REF},
+    ),
+    ("info.Souvenir", ["id"], [], {}),
+    ("info.App", ["id"], [], {}),
+    ("info.Advertisement", ["id"], ["updated_at"], {}),
+    (
+        "info.AdvertisementTranslation",
+        ["advertisement_id", "language_id"],
+        ["advertisement__updated_at"],
+        {},
+    ),
+]
+
+
+def export_fields(model: type[Model], key: list[str]) -> list[str]:
+    """
+    Columns worth copying: everything but auto_now(_add) timestamps, which
+    the importing side sets itself, and surrogate ids of rows keyed on
+    something else (translation ids differ between environments).
+    """
+    fields = []
+    for field in model._meta.concrete_fields:
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+            continue
+        if field.primary_key and field.attname not in key:
+            continue
+        fields.append(field.attname)
+    return fields
+
+
+def iter_rows(
+    model: type[Model],
+    fields: list[str],
+    since_lookups: list[str],
+    since: Optional[datetime] = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+    refs: Optional[dict[str, tuple[str, str]]] = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Rows as dicts, streamed from the database ``chunk_size`` at a time.
+    Foreign key columns in ``refs`` hold the target's natural key.
+    """
+    columns = {
+        name: f"{model._meta.get_field(name).name}__{refs[name][1]}" if name in (refs or {}) else name
+        for name in fields
+    }
+    queryset = model._base_manager.order_by("pk").values(*columns.values())
+    if since is not None and since_lookups:
+        changed = Q()
+        for lookup in since_lookups:
+            changed |= Q(**{f"{lookup}__gte": since})
+        queryset = queryset.filter(changed)
+    for row in queryset.iterator(chunk_size=chunk_size):
+        yield {name: row[column] for name, column in columns.items()}
+
+
+def export_catalog(
+    directory: str,
+    since: Optional[datetime] = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> Iterator[UpsertStats]:
+    """
+    Write every catalogue table to ``directory`` as NDJSON plus a seed
+    manifest, so the dump loads with the seed loader (see import_catalog).
+    Yields per-table stats as each file is finished.
+
+    With ``since``, soft deletions are exported like any other change
+    (``deleted_at``), but rows deleted outright or moved to the archive
+    tables are not: a dump never removes rows on the importing side.
+    """
+    os.makedirs(directory, exist_ok=True)
+    manifest_path = os.path.join(directory, "manifest.json")
+    if os.path.exists(manifest_path):
+        os.remove(manifest_path)
+    entries = []
+    for label, key, since_lookups, refs in CATALOG:
+        model = apps.get_model(label)
+        filename = f"{model._meta.db_table}.ndjson"
+        stats = UpsertStats(model._meta.db_table)
+        started = time.perf_counter()
+
+        path = os.path.join(directory, filename)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            rows = iter_rows(
+                model, export_fields(model, key), since_lookups, since, chunk_size, refs
+            )
+            for row in rows:
+                fh.write(json.dumps(row, cls=DjangoJSONEncoder, ensure_ascii=False))
+                fh.write("\n")
+                stats.rows += 1
+        os.replace(tmp_path, path)
+
+        stats.seconds = time.perf_counter() - started
+        entry = {"model": label, "file": filename, "key": key}
+        if refs:
+            entry["refs"] = {column: list(target) for column, target in refs.items()}
+        entries.append(entry)
+        yield stats
+
+    # Written last: a directory without a manifest is an unfinished export
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "exported_at": timezone.now().isoformat(),
+        "since": since.isoformat() if since else None,
+        "sets": {CATALOG_SET: entries},
+    }
+    with open(manifest_path, "w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=2)
+        fh.write("\n")
@@ -0,0 +1,103 @@
+# Python modules
+import os
+import re
+import sqlite3
+from typing import Any, Callable, Optional
+
+# Django modules
+from django.conf import settings
+from django.db.backends.base.base import BaseDatabaseWrapper
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations import RunPython
+
+# Pragmas that may be set from settings; values are interpolated into SQL
+ALLOWED_PRAGMAS = frozenset(
+    {
+        "auto_vacuum",
+        "journal_mode",
+        "synchronous",
+        "busy_timeout",
+        "mmap_size",
+        "cache_size",
+        "temp_store",
+    }
+)
+PRAGMA_VALUE = re.compile(r"^-?\w+$")
+READ_WRITE_PRAGMAS = frozenset({"auto_vacuum", "journal_mode", "synchronous"})
+
+
+def sqlite_pragma_statements(pragmas: dict[str, Any]) -> list[str]:
+    statements = []
+    for name, value in pragmas.items():
+        if name not in ALLOWED_PRAGMAS:
+            raise ValueError(f"Unsupported SQLite pragma {name!r}")
+        if not PRAGMA_VALUE.match(str(value)):
+            raise ValueError(f"Invalid value {value!r} for SQLite pragma {name!r}")
+        statements.append(f"PRAGMA {name} = {value}")
+    return statements
+
+
+def apply_sqlite_pragmas(sender: Any, connection: BaseDatabaseWrapper, **kwargs: Any) -> None:
+    """connection_created receiver: tune each new SQLite connection."""
+    if connection.vendor != "sqlite":
+        return
+    pragmas = settings.SQLITE_PRAGMAS
+    if "mode=ro" in str(connection.settings_dict["NAME"]):
+        # A read-only copy (the SQLite replica) cannot switch journal mode
+        pragmas = {name: value for name, value in pragmas.items() if name not in READ_WRITE_PRAGMAS}
+    with connection.cursor() as cursor:
+        for statement in sqlite_pragma_statements(pragmas):
+            cursor.execute(statement)
+
+
+def postgres_only(sql: list[str], reverse_sql: list[str]) -> RunPython:
+    """
+    Migration operation running raw SQL on PostgreSQL only, for features
+    SQLite lacks (extensions, GIN indexes); a no-op on other backends.
+    """
+
+    def run(statements: list[str]) -> Callable[..., None]:
+        def apply(apps: Any, schema_editor: BaseDatabaseSchemaEditor) -> None:
+            if schema_editor.connection.vendor != "postgresql":
+                return
+            for statement in statements:
+                schema_editor.execute(statement)
+
+        return apply
+
+    return RunPython(run(sql), run(reverse_sql), elidable=False)
+
+
+def sqlite_replica_path() -> Optional[str]:
+    """File of the SQLite replica copy, or None when there is none."""
+    replica = settings.DATABASES.get(settings.REPLICA_DB)
+    if replica is None or replica["ENGINE"] != "django.db.backends.sqlite3":
+        return None
+    return replica["NAME"].removeprefix("file:").split("?", 1)[0]
+
+
+def refresh_sqlite_replica() -> str:
+    """
+    Replace the SQLite replica with a consistent snapshot of the primary.
+    The copy is written next to the replica and renamed over it, so
+    readers see either the old or the new file, never a partial one;
+    connections opened before the rename keep reading the old file.
+    """
+    path = sqlite_replica_path()
+    if path is None:
+        raise ValueError("No SQLite replica is configured")
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    source = sqlite3.connect(settings.DATABASES["default"]["NAME"])
+    target = sqlite3.connect(tmp_path)
+    try:
+        # The online backup API reads a consistent snapshot without
+        # blocking writers in WAL mode
+        source.backup(target)
+        # Rollback journal: a WAL file could outlive the rename and be
+        # applied to the wrong copy
+        target.execute("PRAGMA journal_mode = DELETE")
+    finally:
+        target.close()
+        source.close()
+    os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,126 @@
+# Python modules
+import fcntl
+import hashlib
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+
+class DiskLRUCache:
+    """
+    Size-bounded cache of immutable blobs in a directory, shared by every
+    process that points at it (e.g. all Gunicorn workers).
+
+    Reads bump a file's mtime, and writes that push the total over
+    ``max_bytes`` evict the least recently used files down to
+    ``low_water`` of the limit. Each process keeps a running size estimate
+    and only rescans the directory when it crosses the limit, so the
+    estimate never drifts far even with several writers.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, low_water: float = 0.9) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.low_water = low_water
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def path_for(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def get(self, key: str) -> Optional[str]:
+        """Path of the cached blob, or None."""
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, key: str, data: bytes) -> str:
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._size = self._evict()
+        return path
+
+    def get_or_create(self, key: str, produce: Callable[[], bytes]) -> str:
+        """
+        Cached blob for ``key``, produced at most once even when many
+        threads or processes ask for it at the same time: the first caller
+        produces it under a per-key file lock, the others wait and read it.
+        """
+        path = self.get(key)
+        if path is not None:
+            return path
+        with self._key_lock(key):
+            path = self.get(key)
+            if path is not None:
+                return path
+            return self.put(key, produce())
+
+    @contextmanager
+    def _key_lock(self, key: str) -> Iterator[None]:
+        lock_path = self.path_for(key) + ".lock"
+        os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+        with open(lock_path, "a") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+                # A waiter still holding the old file re-checks the cache
+                # first, so removing it cannot cause a second produce()
+                try:
+                    os.remove(lock_path)
+                except FileNotFoundError:
+                    pass
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        entries = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if name.endswith((".tmp", ".lock")):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> int:
+        """Delete least recently used blobs; returns the remaining size."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * self.low_water
+        # Never evict what was written a moment ago by a concurrent request
+        recent = time.time() - 1
+        for mtime, size, path in entries:
+            if total <= target:
+                break
+            if mtime > recent:
+                continue
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+        return total
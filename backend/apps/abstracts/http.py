@@ -0,0 +1,193 @@
+# Python modules
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional
+from urllib.parse import urlsplit
+
+# Third-party modules
+import requests
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised without a network call while a host's circuit breaker is open."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Bounded retries with exponential backoff and full jitter."""
+
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    retry_statuses: tuple[int, ...] = (429, 500, 502, 503, 504)
+    # Longest Retry-After we are willing to wait before giving up
+    max_retry_after: float = 120.0
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """Per-host breaker: opens after consecutive failed requests.
+
+    While open, requests fail fast with CircuitOpenError. After
+    ``reset_timeout`` seconds a single trial request is let through
+    (half-open) while every other caller still fails fast; its success
+    closes the breaker, its failure re-opens it. A trial that never
+    reports back (e.g. its thread died) is replaced by a new one after
+    another ``reset_timeout``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self._failures: dict[str, int] = {}
+        self._opened_at: dict[str, float] = {}
+        # Start time of the half-open trial request in flight, per host
+        self._trial_started_at: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _refuses(self, host: str, now: float) -> bool:
+        opened_at = self._opened_at.get(host)
+        if opened_at is None:
+            return False
+        if now - opened_at < self.reset_timeout:
+            return True
+        trial_started_at = self._trial_started_at.get(host)
+        return trial_started_at is not None and now - trial_started_at < self.reset_timeout
+
+    def is_open(self, host: str) -> bool:
+        """Whether a request to ``host`` would be refused right now."""
+        with self._lock:
+            return self._refuses(host, self.clock())
+
+    def before_request(self, host: str) -> None:
+        with self._lock:
+            now = self.clock()
+            if self._refuses(host, now):
+                raise CircuitOpenError(f"Circuit open for {host}: too many consecutive failures")
+            if host in self._opened_at:
+                # Half-open: this caller is the trial request
+                self._trial_started_at[host] = now
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            self._failures.pop(host, None)
+            self._opened_at.pop(host, None)
+            self._trial_started_at.pop(host, None)
+
+    def record_failure(self, host: str) -> None:
+        with self._lock:
+            failures = self._failures.get(host, 0) + 1
+            self._failures[host] = failures
+            # A failed trial re-opens the breaker at once
+            if failures >= self.failure_threshold or self._trial_started_at.pop(host, None) is not None:
+                self._opened_at[host] = self.clock()
+
+
+class HttpClient:
+    """requests.Session wrapper for management commands.
+
+    Adds bounded retries with backoff (honouring Retry-After on 429/503),
+    a per-host circuit breaker and an optional minimum interval between
+    requests to the same host. Non-retryable responses (e.g. 404) are
+    returned as is; callers decide whether to raise_for_status().
+    """
+
+    def __init__(
+        self,
+        headers: Optional[dict[str, str]] = None,
+        timeout: float = 15.0,
+        retry: RetryPolicy = RetryPolicy(),
+        breaker: Optional[CircuitBreaker] = None,
+        min_interval: float = 0.0,
+        session: Optional[requests.Session] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.session = session or requests.Session()
+        if headers:
+            self.session.headers.update(headers)
+        self.timeout = timeout
+        self.retry = retry
+        self.breaker = breaker or CircuitBreaker(clock=clock)
+        self.min_interval = min_interval
+        self.sleep = sleep
+        self.clock = clock
+        self._last_request: dict[str, float] = {}
+        self._throttle_lock = threading.Lock()
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        host = urlsplit(url).netloc
+        self.breaker.before_request(host)
+        kwargs.setdefault("timeout", self.timeout)
+
+        for attempt in range(self.retry.max_retries + 1):
+            self._throttle(host)
+            retry_after: Optional[float] = None
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error: requests.RequestException = e
+            else:
+                if response.status_code not in self.retry.retry_statuses:
+                    self.breaker.record_success(host)
+                    return response
+                error = requests.HTTPError(
+                    f"{response.status_code} Server Error for url: {url}",
+                    response=response,
+                )
+                if response.status_code in (429, 503):
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+            if attempt == self.retry.max_retries:
+                break
+            if retry_after is not None:
+                if retry_after > self.retry.max_retry_after:
+                    break
+                self.sleep(retry_after)
+            else:
+                self.sleep(self.retry.backoff(attempt))
+
+        self.breaker.record_failure(host)
+        raise error
+
+    def _throttle(self, host: str) -> None:
+        """Keep at least min_interval seconds between requests to a host."""
+        if self.min_interval <= 0:
+            return
+        with self._throttle_lock:
+            now = self.clock()
+            ready_at = self._last_request.get(host, now - self.min_interval) + self.min_interval
+            self._last_request[host] = max(now, ready_at)
+        if ready_at > now:
+            self.sleep(ready_at - now)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
@@ -0,0 +1,182 @@
+# Python modules
+import base64
+import hashlib
+import io
+import os
+from typing import Any, Iterable, Optional
+
+# Third-party modules
+from PIL import Image, ImageFilter, ImageOps
+
+# Django modules
+from django.conf import settings
+
+# File suffix of each original image format we keep
+FORMAT_SUFFIXES = {
+    "JPEG": ".jpg",
+    "PNG": ".png",
+    "WEBP": ".webp",
+    "GIF": ".gif",
+}
+
+# Refuse decompression bombs well before Pillow's own warning threshold
+MAX_PIXELS = 40_000_000
+
+# Responsive renditions: name -> (Pillow format, file suffix, quality)
+VARIANT_FORMATS = {
+    "webp": ("WEBP", ".webp", 80),
+    "jpeg": ("JPEG", ".jpg", 82),
+}
+VARIANTS_DIR = "variants"
+
+# Width of the inline blur placeholder; clients stretch and blur it
+PLACEHOLDER_WIDTH = 16
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def hashed_path(prefix: str, digest: str, suffix: str) -> str:
+    """MEDIA_ROOT-relative path of immutable content, fanned out by hash prefix."""
+    return f"{prefix}/{digest[:2]}/{digest}{suffix}"
+
+
+def media_url(path: str) -> str:
+    return f"{settings.MEDIA_URL}{path}"
+
+
+def write_immutable(path: str, data: bytes) -> None:
+    """
+    Store content under MEDIA_ROOT unless the (content-addressed) file
+    already exists. Written atomically, so concurrent writers of the same
+    content and readers never see a partial file.
+    """
+    full_path = os.path.join(settings.MEDIA_ROOT, path)
+    if os.path.exists(full_path):
+        return
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    tmp_path = f"{full_path}.{os.getpid()}.{id(data)}.tmp"
+    with open(tmp_path, "wb") as fh:
+        fh.write(data)
+    os.replace(tmp_path, full_path)
+
+
+def load_image(data: bytes) -> Image.Image:
+    """
+    Decode image bytes, upright according to EXIF orientation.
+    Raises ValueError for data that is not a supported, sane image.
+    """
+    try:
+        image = Image.open(io.BytesIO(data))
+        if image.format not in FORMAT_SUFFIXES:
+            raise ValueError(f"Unsupported image format: {image.format}")
+        if image.width * image.height > MAX_PIXELS:
+            raise ValueError(f"Image too large: {image.width}x{image.height}")
+        image.load()
+    except (OSError, Image.DecompressionBombError) as e:
+        raise ValueError(f"Not a valid image: {e}") from e
+    # In place, so image.format survives
+    ImageOps.exif_transpose(image, in_place=True)
+    return image
+
+
+def render_variants(
+    image: Image.Image,
+    widths: Iterable[int],
+    image_format: str = "WEBP",
+    quality: int = 80,
+) -> dict[int, bytes]:
+    """
+    Renditions of an image at each width narrower than the original (or a
+    single one at the original width if it is narrower than all of them).
+    """
+    if image_format == "JPEG":
+        image = _flatten(image)
+    elif image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+    targets = sorted({width for width in widths if width < image.width}) or [image.width]
+    variants: dict[int, bytes] = {}
+    for width in targets:
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        buffer = io.BytesIO()
+        if image_format == "WEBP":
+            resized.save(buffer, image_format, quality=quality, method=4)
+        else:
+            resized.save(buffer, image_format, quality=quality, optimize=True, progressive=True)
+        variants[width] = buffer.getvalue()
+    return variants
+
+
+def webp_variants(
+    image: Image.Image,
+    widths: Iterable[int],
+    quality: int = 80,
+) -> dict[int, bytes]:
+    return render_variants(image, widths, "WEBP", quality)
+
+
+def placeholder_data_uri(image: Image.Image) -> str:
+    """A few hundred bytes of blurred WebP to show while the real image loads."""
+    height = max(1, round(image.height * PLACEHOLDER_WIDTH / image.width))
+    tiny = _flatten(image).resize((PLACEHOLDER_WIDTH, height), Image.BILINEAR)
+    tiny = tiny.filter(ImageFilter.GaussianBlur(1))
+    buffer = io.BytesIO()
+    tiny.save(buffer, "WEBP", quality=40)
+    return "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode("ascii")
+
+
+def build_image_variants(path: str, widths: Iterable[int]) -> Optional[dict[str, Any]]:
+    """
+    Responsive variants of a MEDIA_ROOT-relative image, written next to
+    the other content-addressed files. Returns None when the path is a
+    remote URL or the file does not exist; raises ValueError for files
+    that are not images. Touches no database, so it is safe on threads.
+    """
+    if not path or path.startswith(("http://", "https://", "//")):
+        return None
+    full_path = os.path.join(settings.MEDIA_ROOT, path.lstrip("/"))
+    if not os.path.isfile(full_path):
+        return None
+
+    with open(full_path, "rb") as fh:
+        data = fh.read()
+    image = load_image(data)
+    digest = content_hash(data)
+
+    variants: dict[str, dict[str, str]] = {}
+    for name, (image_format, suffix, quality) in VARIANT_FORMATS.items():
+        variants[name] = {}
+        for width, content in render_variants(image, widths, image_format, quality).items():
+            variant_path = hashed_path(VARIANTS_DIR, digest, f"-w{width}{suffix}")
+            write_immutable(variant_path, content)
+            variants[name][str(width)] = variant_path
+
+    return {
+        "width": image.width,
+        "height": image.height,
+        "placeholder": placeholder_data_uri(image),
+        "variants": variants,
+    }
+
+
+def srcset(paths: dict[str, str], url: Any = media_url) -> str:
+    """``{"320": path, ...}`` as an HTML srcset attribute value."""
+    return ", ".join(
+        f"{url(path)} {width}w"
+        for width, path in sorted(paths.items(), key=lambda item: int(item[0]))
+    )
+
+
+def _flatten(image: Image.Image) -> Image.Image:
+    """RGB copy of an image, with any transparency composited onto white."""
+    if image.mode == "RGB":
+        return image
+    if image.mode in ("RGBA", "LA") or "transparency" in image.info:
+        rgba = image.convert("RGBA")
+        background = Image.new("RGB", rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        return background
+    return image.convert("RGB")
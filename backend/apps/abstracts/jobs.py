@@ -0,0 +1,25 @@
+"""
+Periodic database jobs run by ``python manage.py run_scheduler``.
+"""
+
+from django.conf import settings
+from django.core.management import call_command
+
+from apps.abstracts.db import refresh_sqlite_replica, sqlite_replica_path
+from apps.abstracts.scheduler import register
+
+if sqlite_replica_path() is not None:
+
+    @register(
+        "refresh_replica",
+        interval=settings.SQLITE_REPLICA_REFRESH_SECONDS,
+        lease_seconds=10 * 60,
+    )
+    def refresh_replica() -> None:
+        refresh_sqlite_replica()
+
+
+# After the nightly archive_events run has deleted its rows
+@register("db_maintenance", cron="0 3 * * *", jitter=5 * 60, lease_seconds=60 * 60)
+def db_maintenance() -> None:
+    call_command("db_maintenance", vacuum=True)
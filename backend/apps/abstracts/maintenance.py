@@ -0,0 +1,197 @@
+# Python modules
+import os
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+# Django modules
+from django.db import OperationalError
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+# Rows ANALYZE samples per index; approximate statistics are enough for the
+# planner and keep the write lock short on large tables (0 = read everything)
+ANALYSIS_LIMIT = 1000
+# Free pages returned per write transaction by the incremental vacuum
+VACUUM_BATCH_PAGES = 1000
+CHECKPOINT_MODES = ("passive", "full", "restart", "truncate")
+AUTO_VACUUM_MODES = {0: "none", 1: "full", 2: "incremental"}
+
+
+@dataclass
+class TableSize:
+    """Rows and on-disk size of one table and its indexes."""
+
+    table: str
+    rows: int
+    # None where the backend cannot tell (SQLite built without dbstat)
+    pages: Optional[int] = None
+    bytes: Optional[int] = None
+    indexes: dict[str, tuple[int, int]] = field(default_factory=dict)  # name: (pages, bytes)
+
+    @property
+    def index_pages(self) -> Optional[int]:
+        return sum(pages for pages, _ in self.indexes.values()) if self.pages is not None else None
+
+    @property
+    def index_bytes(self) -> Optional[int]:
+        return sum(size for _, size in self.indexes.values()) if self.bytes is not None else None
+
+
+def _pragma(connection: BaseDatabaseWrapper, name: str) -> Any:
+    with connection.cursor() as cursor:
+        cursor.execute(f"PRAGMA {name}")
+        return cursor.fetchone()[0]
+
+
+def database_info(connection: BaseDatabaseWrapper) -> dict[str, Any]:
+    """File-level figures for the report: sizes, free pages, journal/vacuum modes."""
+    if connection.vendor != "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_database_size(current_database())")
+            return {"size": cursor.fetchone()[0]}
+    path = connection.settings_dict["NAME"]
+    page_size = _pragma(connection, "page_size")
+    pages = _pragma(connection, "page_count")
+    return {
+        "size": pages * page_size,
+        "page_size": page_size,
+        "pages": pages,
+        "free_pages": _pragma(connection, "freelist_count"),
+        "auto_vacuum": AUTO_VACUUM_MODES.get(_pragma(connection, "auto_vacuum"), "unknown"),
+        "journal_mode": _pragma(connection, "journal_mode"),
+        "wal_size": os.path.getsize(f"{path}-wal") if os.path.exists(f"{path}-wal") else 0,
+    }
+
+
+def table_sizes(connection: BaseDatabaseWrapper) -> list[TableSize]:
+    """Row counts and table/index sizes of every table, largest first."""
+    quote = connection.ops.quote_name
+    with connection.cursor() as cursor:
+        tables = connection.introspection.table_names(cursor)
+        sizes = {}
+        for table in tables:
+            cursor.execute(f"SELECT count(*) FROM {quote(table)}")
+            sizes[table] = TableSize(table, cursor.fetchone()[0])
+        if connection.vendor == "sqlite":
+            _sqlite_sizes(cursor, sizes)
+        elif connection.vendor == "postgresql":
+            _postgres_sizes(cursor, sizes)
+    return sorted(
+        sizes.values(),
+        key=lambda size: ((size.bytes or 0) + (size.index_bytes or 0), size.rows),
+        reverse=True,
+    )
+
+
+def _sqlite_sizes(cursor: Any, sizes: dict[str, TableSize]) -> None:
+    try:
+        # Aggregate mode: one row per table or index, pageno is its page count
+        cursor.execute("SELECT name, pageno, pgsize FROM dbstat WHERE aggregate = TRUE")
+    except OperationalError:
+        # SQLite compiled without SQLITE_ENABLE_DBSTAT_VTAB: row counts only
+        return
+    pages = {name: (count, size) for name, count, size in cursor.fetchall()}
+    cursor.execute("SELECT name, tbl_name FROM sqlite_schema WHERE type = 'index'")
+    owners = dict(cursor.fetchall())
+    for table, size in sizes.items():
+        size.pages, size.bytes = pages.get(table, (0, 0))
+    for index, table in owners.items():
+        if table in sizes:
+            sizes[table].indexes[index] = pages.get(index, (0, 0))
+
+
+def _postgres_sizes(cursor: Any, sizes: dict[str, TableSize]) -> None:
+    cursor.execute("SELECT current_setting('block_size')::int")
+    block_size = cursor.fetchone()[0]
+    cursor.execute(
+        "SELECT relname, pg_relation_size(relid) FROM pg_stat_user_tables "
+        "WHERE schemaname = current_schema()"
+    )
+    for table, size in cursor.fetchall():
+        if table in sizes:
+            sizes[table].pages, sizes[table].bytes = size // block_size, size
+    cursor.execute(
+        "SELECT relname, indexrelname, pg_relation_size(indexrelid) FROM pg_stat_user_indexes "
+        "WHERE schemaname = current_schema()"
+    )
+    for table, index, size in cursor.fetchall():
+        if table in sizes:
+            sizes[table].indexes[index] = (size // block_size, size)
+
+
+def analyze(connection: BaseDatabaseWrapper, analysis_limit: int = ANALYSIS_LIMIT) -> None:
+    """
+    Refresh the planner statistics. On SQLite ``PRAGMA optimize`` alone only
+    re-analyzes tables that this connection's own queries flagged, which a
+    fresh connection has none of, so a bounded ANALYZE runs first.
+    """
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            cursor.execute(f"PRAGMA analysis_limit = {int(analysis_limit)}")
+            cursor.execute("ANALYZE")
+            cursor.execute("PRAGMA optimize")
+        else:
+            cursor.execute("ANALYZE")
+
+
+def vacuum(
+    connection: BaseDatabaseWrapper,
+    max_pages: int = 0,
+    batch_pages: int = VACUUM_BATCH_PAGES,
+) -> Optional[int]:
+    """
+    Give free space back without blocking the site. SQLite: return up to
+    ``max_pages`` free pages (0 = all) to the file system, ``batch_pages``
+    per write transaction so other writers get the lock in between; needs
+    auto_vacuum=INCREMENTAL and returns None otherwise. PostgreSQL: a plain
+    (non-FULL) VACUUM, which does not lock out reads or writes.
+    Returns the number of pages freed, where known.
+    """
+    if connection.vendor != "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute("VACUUM")
+        return None
+    if AUTO_VACUUM_MODES.get(_pragma(connection, "auto_vacuum")) != "incremental":
+        return None
+
+    connection.ensure_connection()
+    freed = 0
+    while not max_pages or freed < max_pages:
+        free = _pragma(connection, "freelist_count")
+        step = min(batch_pages, free, max_pages - freed if max_pages else free)
+        if step <= 0:
+            break
+        # executescript steps the pragma to completion; cursor.execute()
+        # would free a single page
+        connection.connection.executescript(f"PRAGMA incremental_vacuum({int(step)})")
+        done = free - _pragma(connection, "freelist_count")
+        if done <= 0:
+            break
+        freed += done
+    return freed
+
+
+def enable_incremental_vacuum(connection: BaseDatabaseWrapper) -> None:
+    """
+    Switch an existing SQLite file to auto_vacuum=INCREMENTAL. This needs a
+    full VACUUM, which rewrites the whole file and holds the write lock
+    until it is done: run it in a maintenance window, not from the scheduler.
+    """
+    connection.ensure_connection()
+    connection.connection.executescript("PRAGMA auto_vacuum = INCREMENTAL; VACUUM;")
+
+
+def checkpoint(connection: BaseDatabaseWrapper, mode: str = "passive") -> Optional[tuple[int, int, int]]:
+    """
+    Copy the SQLite write-ahead log into the database file. PASSIVE never
+    waits for readers or writers; TRUNCATE also shrinks the -wal file but
+    waits (up to busy_timeout) for readers to finish. Returns (busy,
+    log frames, checkpointed frames), or None when there is no WAL to
+    checkpoint (PostgreSQL checkpoints on its own).
+    """
+    if mode not in CHECKPOINT_MODES:
+        raise ValueError(f"Checkpoint mode must be one of {', '.join(CHECKPOINT_MODES)}")
+    if connection.vendor != "sqlite" or _pragma(connection, "journal_mode") != "wal":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(f"PRAGMA wal_checkpoint({mode.upper()})")
+        return tuple(cursor.fetchone())
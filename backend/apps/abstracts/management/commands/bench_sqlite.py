@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmark concurrent SQLite throughput with SQLite's defaults against the
+tuned connection settings (settings.SQLITE_PRAGMAS, IMMEDIATE transactions).
+
+Reader processes stand in for Gunicorn workers serving the event list;
+writer processes stand in for the scraper and API writes, upserting
+batches in read-then-write transactions. Each profile runs on a fresh
+database file in a scratch directory; the project database is not used.
+
+Usage:
+    python manage.py bench_sqlite
+    python manage.py bench_sqlite --readers 6 --writers 2 --seconds 10
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.abstracts.db import sqlite_pragma_statements
+
+ROWS = 20_000
+BATCH = 200
+# Python's sqlite3 default, which is also what Django uses unless told otherwise
+DEFAULT_TIMEOUT = 5.0
+
+PROFILES = {
+    "default": {"pragmas": {}, "begin": "BEGIN"},
+    "tuned": {"pragmas": None, "begin": "BEGIN IMMEDIATE"},  # None: settings.SQLITE_PRAGMAS
+}
+
+
+def _connect(path: str, pragmas: dict[str, Any]) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=DEFAULT_TIMEOUT, isolation_level=None)
+    for statement in sqlite_pragma_statements(pragmas):
+        conn.execute(statement)
+    return conn
+
+
+def _reader(path: str, pragmas: dict[str, Any], deadline: float, results: Any) -> None:
+    conn = _connect(path, pragmas)
+    rng = random.Random(os.getpid())
+    ops = errors = 0
+    latencies = []
+    while time.monotonic() < deadline:
+        day = f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        started = time.perf_counter()
+        try:
+            # One page of the event list plus its count, as the API does
+            conn.execute(
+                "SELECT id, name, date, cost FROM bench_event "
+                "WHERE date >= ? AND category = ? ORDER BY date, id LIMIT 24",
+                (day, rng.randrange(4)),
+            ).fetchall()
+            conn.execute("SELECT count(*) FROM bench_event WHERE date >= ?", (day,)).fetchone()
+            ops += 1
+            latencies.append(time.perf_counter() - started)
+        except sqlite3.OperationalError:
+            errors += 1
+    conn.close()
+    results.put(("read", ops, errors, latencies))
+
+
+def _writer(path: str, pragmas: dict[str, Any], begin: str, deadline: float, results: Any) -> None:
+    conn = _connect(path, pragmas)
+    rng = random.Random(os.getpid())
+    ops = errors = 0
+    latencies = []
+    while time.monotonic() < deadline:
+        ids = [rng.randrange(ROWS * 2) for _ in range(BATCH)]
+        started = time.perf_counter()
+        try:
+            conn.execute(begin)
+            # Read-then-write, like the scraper's diff before its upsert
+            conn.execute(
+                f"SELECT id, cost FROM bench_event WHERE id IN ({','.join('?' * len(ids))})", ids
+            ).fetchall()
+            conn.executemany(
+                "INSERT INTO bench_event (id, name, date, category, cost) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET cost = excluded.cost",
+                [(i, f"Event {i}", _date(i), i % 4, rng.randrange(20) * 500) for i in ids],
+            )
+            conn.execute("COMMIT")
+            ops += 1
+            latencies.append(time.perf_counter() - started)
+        except sqlite3.OperationalError:
+            errors += 1
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+    conn.close()
+    results.put(("write", ops, errors, latencies))
+
+
+def _date(i: int) -> str:
+    return f"2026-{i % 12 + 1:02d}-{i % 28 + 1:02d}"
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+class Command(BaseCommand):
+    help = "Benchmark concurrent SQLite reads/writes: default vs tuned connection settings"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--readers", type=int, default=3, help="Reader processes (default: 3)")
+        parser.add_argument("--writers", type=int, default=2, help="Writer processes (default: 2)")
+        parser.add_argument("--seconds", type=float, default=5.0, help="Duration per profile (default: 5)")
+
+    def handle(self, *args: Any, **kwargs: Any) -> None:
+        self.stdout.write(
+            f"{kwargs['readers']} readers, {kwargs['writers']} writers, "
+            f"{kwargs['seconds']:g} s per profile, {ROWS} rows, {BATCH}-row write transactions"
+        )
+        with tempfile.TemporaryDirectory(prefix="bench_sqlite") as directory:
+            for name, profile in PROFILES.items():
+                pragmas = settings.SQLITE_PRAGMAS if profile["pragmas"] is None else profile["pragmas"]
+                path = os.path.join(directory, f"{name}.sqlite3")
+                self._setup(path, pragmas)
+                self._report(name, self._run(path, pragmas, profile["begin"], **kwargs))
+
+    def _setup(self, path: str, pragmas: dict[str, Any]) -> None:
+        conn = _connect(path, pragmas)
+        conn.execute(
+            "CREATE TABLE bench_event (id INTEGER PRIMARY KEY, name TEXT NOT NULL, "
+            "date TEXT NOT NULL, category INTEGER NOT NULL, cost INTEGER NOT NULL)"
+        )
+        conn.execute("CREATE INDEX bench_event_date ON bench_event (date)")
+        conn.execute("BEGIN")
+        conn.executemany(
+            "INSERT INTO bench_event VALUES (?, ?, ?, ?, ?)",
+            [(i, f"Event {i}", _date(i), i % 4, i % 20 * 500) for i in range(ROWS)],
+        )
+        conn.execute("COMMIT")
+        conn.close()
+
+    def _run(self, path: str, pragmas: dict[str, Any], begin: str, **kwargs: Any) -> dict[str, list]:
+        context = multiprocessing.get_context("fork")
+        results = context.Queue()
+        deadline = time.monotonic() + kwargs["seconds"]
+        processes = [
+            context.Process(target=_reader, args=(path, pragmas, deadline, results))
+            for _ in range(kwargs["readers"])
+        ] + [
+            context.Process(target=_writer, args=(path, pragmas, begin, deadline, results))
+            for _ in range(kwargs["writers"])
+        ]
+        for process in processes:
+            process.start()
+        totals: dict[str, list] = {"read": [0, 0, []], "write": [0, 0, []]}
+        for _ in processes:
+            kind, ops, errors, latencies = results.get()
+            totals[kind][0] += ops
+            totals[kind][1] += errors
+            totals[kind][2].extend(latencies)
+        for process in processes:
+            process.join()
+        totals["seconds"] = kwargs["seconds"]
+        return totals
+
+    def _report(self, name: str, totals: dict[str, Any]) -> None:
+        seconds = totals["seconds"]
+        self.stdout.write(self.style.MIGRATE_HEADING(f"{name}:"))
+        for kind in ("read", "write"):
+            ops, errors, latencies = totals[kind]
+            self.stdout.write(
+                f"  {kind + 's':<6} {ops / seconds:>9,.0f}/sec  "
+                f"p50 {_percentile(latencies, 0.5) * 1000:7.2f} ms  "
+                f"p99 {_percentile(latencies, 0.99) * 1000:7.2f} ms  "
+                f"{errors} 'database is locked' errors"
+            )
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Build responsive image variants (WebP/JPEG renditions, intrinsic size and
+blur placeholder) for every model using ImageVariantsMixin. New or
+changed images get theirs on save; this backfills existing rows.
+
+Usage:
+    python manage.py build_image_variants
+    python manage.py build_image_variants --model places.Place
+    python manage.py build_image_variants --force       # rebuild rows that already have variants
+    python manage.py build_image_variants --workers 8
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.abstracts.images import build_image_variants
+from apps.abstracts.models import ImageVariantsMixin
+
+
+class Command(BaseCommand):
+    help = "Build resized WebP/JPEG variants, sizes and placeholders for model images"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            default=[],
+            help="Only this model, as app_label.ModelName (repeatable; default: all)",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Rebuild variants even for rows that already have them",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Images resized in parallel (default: 4)",
+        )
+
+    def handle(self, *args: Any, **kwargs: Any) -> None:
+        models = [
+            model
+            for model in apps.get_models()
+            if issubclass(model, ImageVariantsMixin)
+        ]
+        if kwargs["model"]:
+            labels = {label.lower() for label in kwargs["model"]}
+            unknown = labels - {model._meta.label_lower for model in models}
+            if unknown:
+                raise CommandError(
+                    f"No image models named {', '.join(sorted(unknown))}; choose from "
+                    + ", ".join(model._meta.label for model in models)
+                )
+            models = [model for model in models if model._meta.label_lower in labels]
+
+        started = time.perf_counter()
+        totals = dict.fromkeys(("built", "missing", "failed"), 0)
+        with ThreadPoolExecutor(max_workers=max(1, kwargs["workers"])) as pool:
+            for model in models:
+                counts = self._build(model, pool, kwargs["force"])
+                self.stdout.write(
+                    f"{model._meta.label}: {counts['built']} built, "
+                    f"{counts['missing']} without a local file, {counts['failed']} failed"
+                )
+                for key in totals:
+                    totals[key] += counts[key]
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\nDone! Built: {totals['built']}, Missing: {totals['missing']}, "
+                f"Failed: {totals['failed']} in {time.perf_counter() - started:.1f} s"
+            )
+        )
+
+    def _build(self, model: Any, pool: ThreadPoolExecutor, force: bool) -> dict[str, int]:
+        rows = model.objects.exclude(image__isnull=True).exclude(image="")
+        if not force:
+            rows = rows.filter(image_variants={})
+        rows = list(rows.values_list("pk", "image"))
+        widths = model.IMAGE_WIDTHS
+
+        def build(row: tuple[Any, str]) -> tuple[Any, str, Optional[dict[str, Any]], str]:
+            pk, image = row
+            try:
+                return pk, image, build_image_variants(image, widths), ""
+            except (ValueError, OSError) as e:
+                return pk, image, None, str(e)
+
+        counts = dict.fromkeys(("built", "missing", "failed"), 0)
+        for pk, image, built, error in pool.map(build, rows):
+            if error:
+                counts["failed"] += 1
+                self.stderr.write(f"  {model._meta.label} #{pk} {image}: {error}")
+                continue
+            if built is None:
+                counts["missing"] += 1
+                continue
+            # update() rather than save(): no timestamps, no save-time rebuild
+            model.objects.filter(pk=pk, image=image).update(
+                image_width=built["width"],
+                image_height=built["height"],
+                image_placeholder=built["placeholder"],
+                image_variants=built["variants"],
+            )
+            counts["built"] += 1
+        return counts
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+Routine database upkeep: refresh the query planner statistics (bounded
+ANALYZE + PRAGMA optimize), optionally give free pages back to the file
+system (incremental vacuum), checkpoint the SQLite write-ahead log and
+report per-table row counts, page counts and index sizes.
+
+Every step is short or done in small transactions, so this is safe to
+run while the site is serving; the scheduler runs it nightly. The one
+exception is --enable-incremental-vacuum, a one-off full VACUUM for
+database files created before auto_vacuum was set.
+
+Usage:
+    python manage.py db_maintenance
+    python manage.py db_maintenance --vacuum --checkpoint truncate
+    python manage.py db_maintenance --report-only -v 2      # also list each index
+    python manage.py db_maintenance --enable-incremental-vacuum   # maintenance window only
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Optional
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from apps.abstracts.maintenance import (
+    ANALYSIS_LIMIT,
+    CHECKPOINT_MODES,
+    analyze,
+    checkpoint,
+    database_info,
+    enable_incremental_vacuum,
+    table_sizes,
+    vacuum,
+)
+
+
+def _size(value: Optional[int]) -> str:
+    if value is None:
+        return "?"
+    for unit in ("B", "KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+class Command(BaseCommand):
+    help = "Analyze, vacuum and checkpoint the database and report table sizes"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help=f"Database alias (default: {DEFAULT_DB_ALIAS})",
+        )
+        parser.add_argument(
+            "--vacuum",
+            action="store_true",
+            help="Return free pages to the file system (SQLite incremental vacuum, PostgreSQL VACUUM)",
+        )
+        parser.add_argument(
+            "--max-vacuum-pages",
+            type=int,
+            default=0,
+            help="Stop the incremental vacuum after this many pages (default: 0, all free pages)",
+        )
+        parser.add_argument(
+            "--analysis-limit",
+            type=int,
+            default=ANALYSIS_LIMIT,
+            help=f"Rows SQLite's ANALYZE samples per index, 0 for all (default: {ANALYSIS_LIMIT})",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            choices=CHECKPOINT_MODES,
+            default="passive",
+            help="SQLite WAL checkpoint mode (default: passive, never waits for other connections)",
+        )
+        parser.add_argument(
+            "--report-only",
+            action="store_true",
+            help="Only print the size report",
+        )
+        parser.add_argument(
+            "--enable-incremental-vacuum",
+            action="store_true",
+            help="Switch an existing SQLite file to auto_vacuum=INCREMENTAL with a full, blocking VACUUM",
+        )
+
+    def handle(self, *args: Any, **kwargs: Any) -> None:
+        if kwargs["database"] not in connections:
+            raise CommandError(f"Unknown database {kwargs['database']!r}")
+        if kwargs["max_vacuum_pages"] < 0 or kwargs["analysis_limit"] < 0:
+            raise CommandError("--max-vacuum-pages and --analysis-limit must be >= 0")
+        connection = connections[kwargs["database"]]
+        self.verbosity = kwargs["verbosity"]
+
+        if kwargs["enable_incremental_vacuum"]:
+            if connection.vendor != "sqlite":
+                raise CommandError("--enable-incremental-vacuum only applies to SQLite")
+            self._step("VACUUM (auto_vacuum = INCREMENTAL)", enable_incremental_vacuum, connection)
+        elif not kwargs["report_only"]:
+            self._step("ANALYZE", analyze, connection, kwargs["analysis_limit"])
+            if kwargs["vacuum"]:
+                freed = self._step("VACUUM", vacuum, connection, kwargs["max_vacuum_pages"])
+                if connection.vendor == "sqlite":
+                    self._write(
+                        f"  {freed} free pages returned"
+                        if freed is not None
+                        else self.style.WARNING(
+                            "  skipped: auto_vacuum is not INCREMENTAL "
+                            "(run once with --enable-incremental-vacuum)"
+                        )
+                    )
+            result = self._step("WAL checkpoint", checkpoint, connection, kwargs["checkpoint"])
+            if result is not None:
+                busy, log, done = result
+                self._write(
+                    f"  {done} of {log} frames checkpointed" + (" (busy, retry later)" if busy else "")
+                )
+
+        self._report(connection)
+
+    def _write(self, message: str) -> None:
+        if self.verbosity > 0:
+            self.stdout.write(message)
+
+    def _step(self, name: str, func: Any, *args: Any) -> Any:
+        started = time.perf_counter()
+        result = func(*args)
+        self._write(
+            self.style.SUCCESS(f"{name} done in {(time.perf_counter() - started) * 1000:.0f} ms")
+        )
+        return result
+
+    def _report(self, connection: Any) -> None:
+        if self.verbosity < 1:
+            return
+        info = database_info(connection)
+        self.stdout.write(self.style.MIGRATE_HEADING(f"Database {connection.alias} ({connection.vendor}):"))
+        if connection.vendor == "sqlite":
+            self.stdout.write(
+                f"  {_size(info['size'])} in {info['pages']} pages of {info['page_size']} B, "
+                f"{info['free_pages']} free; journal_mode={info['journal_mode']}, "
+                f"auto_vacuum={info['auto_vacuum']}, WAL {_size(info['wal_size'])}"
+            )
+        else:
+            self.stdout.write(f"  {_size(info['size'])}")
+
+        self.stdout.write(
+            f"  {'table':<40} {'rows':>10} {'pages':>8} {'size':>10} {'idx pages':>10} {'idx size':>10}"
+        )
+        for table in table_sizes(connection):
+            self.stdout.write(
+                f"  {table.table:<40} {table.rows:>10,} {table.pages if table.pages is not None else '?':>8} "
+                f"{_size(table.bytes):>10} "
+                f"{table.index_pages if table.index_pages is not None else '?':>10} "
+                f"{_size(table.index_bytes):>10}"
+            )
+            if self.verbosity > 1:
+                for index, (pages, size) in sorted(table.indexes.items()):
+                    self.stdout.write(f"    {index:<38} {'':>10} {pages:>8} {_size(size):>10}")
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Refresh the SQLite read replica (SQLITE_REPLICA=True) from the primary
+database. The scheduler runs this every SQLITE_REPLICA_REFRESH_SECONDS;
+a PostgreSQL replica is kept current by streaming replication instead.
+
+Usage:
+    python manage.py refresh_replica
+    python manage.py refresh_replica --if-enabled   # no-op without a SQLite replica
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.abstracts.db import refresh_sqlite_replica, sqlite_replica_path
+
+
+class Command(BaseCommand):
+    help = "Copy the primary SQLite database to the read replica file"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--if-enabled",
+            action="store_true",
+            help="Exit quietly instead of failing when no SQLite replica is configured",
+        )
+
+    def handle(self, *args: Any, **kwargs: Any) -> None:
+        if sqlite_replica_path() is None:
+            if kwargs["if_enabled"]:
+                return
+            raise CommandError("No SQLite replica configured (set SQLITE_REPLICA=True)")
+        started = time.perf_counter()
+        path = refresh_sqlite_replica()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Replica {path} refreshed ({os.path.getsize(path) / 1024 / 1024:.1f} MiB) "
+                f"in {(time.perf_counter() - started) * 1000:.0f} ms"
+            )
+        )
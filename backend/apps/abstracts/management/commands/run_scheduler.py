@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Long-running scheduler for the periodic jobs declared in the apps'
+``jobs`` modules: the sxodim crawl, deactivation of past events and
+cache warming.
+
+Usage:
+    python manage.py run_scheduler
+    python manage.py run_scheduler --list
+    python manage.py run_scheduler --only warm_event_cache warm_place_cache
+    python manage.py run_scheduler --run-now crawl_events
+
+Every job run holds a database lease, so two schedulers (or a scheduler
+and a --run-now) never run the same job at the same time. Cron
+expressions are evaluated in settings.TIME_ZONE.
+"""
+
+from __future__ import annotations
+
+import os
+import signal
+import socket
+import threading
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from django.utils import timezone
+from django.utils.module_loading import autodiscover_modules
+
+from apps.abstracts.scheduler import Job, acquire_lease, registry, release_lease
+
+
+class Command(BaseCommand):
+    help = "Run periodic jobs (crawl, past-event deactivation, cache warming) in one process"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--list",
+            action="store_true",
+            help="Show the registered jobs and their schedules, then exit",
+        )
+        parser.add_argument(
+            "--only",
+            nargs="+",
+            metavar="JOB",
+            default=[],
+            help="Schedule only these jobs",
+        )
+        parser.add_argument(
+            "--run-now",
+            nargs="+",
+            metavar="JOB",
+            default=[],
+            help="Run these jobs once (under their lease) and exit",
+        )
+        parser.add_argument(
+            "--run-at-start",
+            action="store_true",
+            help="Run every job right away instead of waiting for its first slot",
+        )
+
+    def handle(self, *args: Any, **kwargs: Any) -> None:
+        autodiscover_modules("jobs")
+
+        unknown = set(kwargs["only"] + kwargs["run_now"]) - set(registry)
+        if unknown:
+            raise CommandError(f"Unknown jobs: {', '.join(sorted(unknown))}")
+
+        jobs = {
+            name: job
+            for name, job in registry.items()
+            if not kwargs["only"] or name in kwargs["only"]
+        }
+        owner = f"{socket.gethostname()}:{os.getpid()}"
+
+        if kwargs["list"]:
+            for job in jobs.values():
+                every = f"cron '{job.cron}'" if job.cron else f"every {job.interval:g}s"
+                self.stdout.write(
+                    f"{job.name}: {every}, jitter {job.jitter:g}s, lease {job.lease_seconds}s"
+                )
+            return
+
+        if kwargs["run_now"]:
+            for name in kwargs["run_now"]:
+                self._run(registry[name], owner)
+            return
+
+        if not jobs:
+            raise CommandError("No jobs to schedule")
+
+        stop = threading.Event()
+
+        def request_stop(signum: int, frame: Any) -> None:
+            self.stdout.write(self.style.WARNING("Stopping after the current job..."))
+            stop.set()
+
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+
+        now = timezone.localtime()
+        next_runs = {
+            name: now if kwargs["run_at_start"] else job.next_run(now)
+            for name, job in jobs.items()
+        }
+        self.stdout.write(self.style.NOTICE(f"Scheduler {owner} started"))
+        for name, run_at in sorted(next_runs.items(), key=lambda item: item[1]):
+            self.stdout.write(f"  {name}: next run at {run_at:%Y-%m-%d %H:%M:%S %Z}")
+
+        while not stop.is_set():
+            name = min(next_runs, key=next_runs.__getitem__)
+            wait = (next_runs[name] - timezone.localtime()).total_seconds()
+            if wait > 0:
+                stop.wait(wait)
+                continue
+
+            self._run(jobs[name], owner)
+            # Counted from the end of the run, so a slow job cannot pile up
+            next_runs[name] = jobs[name].next_run(timezone.localtime())
+
+        self.stdout.write(self.style.SUCCESS("Scheduler stopped"))
+
+    def _run(self, job: Job, owner: str) -> None:
+        """Run one job under its lease; failures are reported, not raised."""
+        # The process lives for days: drop connections the DB may have closed
+        close_old_connections()
+
+        if not acquire_lease(job.name, owner, job.lease_seconds):
+            self.stdout.write(
+                self.style.WARNING(f"[{job.name}] still running elsewhere, skipped")
+            )
+            return
+
+        self.stdout.write(self.style.NOTICE(f"[{job.name}] started"))
+        started = time.monotonic()
+        try:
+            job.func()
+        except Exception as e:
+            self.stderr.write(self.style.ERROR(f"[{job.name}] failed: {e!r}"))
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"[{job.name}] finished in {time.monotonic() - started:.1f}s"
+                )
+            )
+        finally:
+            release_lease(job.name, owner)
+            close_old_connections()
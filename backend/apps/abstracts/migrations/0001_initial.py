@@ -0,0 +1,30 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobLease',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64, unique=True, verbose_name='Job')),
+                ('owner', models.CharField(blank=True, default='', max_length=128, verbose_name='Owner')),
+                ('expires_at', models.DateTimeField(blank=True, null=True, verbose_name='Expires at')),
+                ('last_started_at', models.DateTimeField(blank=True, null=True, verbose_name='Last started at')),
+                ('last_finished_at', models.DateTimeField(blank=True, null=True, verbose_name='Last finished at')),
+            ],
+            options={
+                'verbose_name': 'Job lease',
+                'verbose_name_plural': 'Job leases',
+                'db_table': 'abstracts_joblease',
+            },
+        ),
+    ]
@@ -1,13 +1,54 @@
 # Python modules
+import logging
 from typing import Any
 
 # Django modules
 from django.db.models import (
+    Manager,
     Model,
-    DateTimeField
+    QuerySet,
+    CharField,
+    DateTimeField,
+    JSONField,
+    PositiveIntegerField,
+    TextField,
 )
 from django.utils import timezone as django_timezone
 
+# Project modules
+from apps.abstracts.images import build_image_variants
+
+logger = logging.getLogger(__name__)
+
+IMAGE_VARIANT_FIELDS = ["image_width", "image_height", "image_placeholder", "image_variants"]
+
+
+class SoftDeleteQuerySet(QuerySet):
+    """QuerySet of models with a ``deleted_at`` soft-delete marker."""
+
+    def alive(self) -> "SoftDeleteQuerySet":
+        return self.filter(deleted_at__isnull=True)
+
+    def dead(self) -> "SoftDeleteQuerySet":
+        return self.filter(deleted_at__isnull=False)
+
+    def soft_delete(self) -> int:
+        """Mark every alive row deleted in one UPDATE; returns the row count."""
+        now = django_timezone.now()
+        # updated_at too, so incremental exports pick the change up
+        return self.alive().update(deleted_at=now, updated_at=now)
+
+    def restore(self) -> int:
+        """Undelete every soft-deleted row in one UPDATE; returns the row count."""
+        return self.dead().update(deleted_at=None, updated_at=django_timezone.now())
+
+
+class AliveManager(Manager.from_queryset(SoftDeleteQuerySet)):
+    """``objects`` manager: hides soft-deleted rows."""
+
+    def get_queryset(self) -> SoftDeleteQuerySet:
+        return super().get_queryset().alive()
+
 
 class AbstractBaseModel(Model):
     """Abstract Base Model with common fields."""
@@ -20,6 +61,12 @@ class AbstractBaseModel(Model):
         verbose_name="Deleted at"
     )
 
+    # ``all_objects`` is declared first so it is the default manager:
+    # unique validation (forms, admin), dumpdata and related managers must
+    # see soft-deleted rows too. ``objects`` skips them, for everyday reads.
+    all_objects = Manager.from_queryset(SoftDeleteQuerySet)()
+    objects = AliveManager()
+
     class Meta:
         """Meta class."""
 
@@ -31,4 +78,84 @@ class AbstractBaseModel(Model):
     ) -> None:
         """Soft delete the model's object."""
         self.deleted_at = django_timezone.now()
-        self.save(update_fields=["deleted_at"])
+        self.save(update_fields=["deleted_at", "updated_at"])
+
+    def restore(self) -> None:
+        """Undo soft_delete()."""
+        self.deleted_at = None
+        self.save(update_fields=["deleted_at", "updated_at"])
+
+
+class ImageVariantsMixin(Model):
+    """
+    Responsive variants of the model's ``image`` (a MEDIA_ROOT-relative
+    path or a remote URL): intrinsic size, an inline blur placeholder and
+    WebP/JPEG renditions at IMAGE_WIDTHS. Rebuilt on save whenever the
+    image changes; ``build_image_variants`` backfills existing rows.
+    """
+
+    IMAGE_WIDTHS: tuple[int, ...] = (320, 640, 1280)
+
+    image_width = PositiveIntegerField(null=True, blank=True, editable=False)
+    image_height = PositiveIntegerField(null=True, blank=True, editable=False)
+    image_placeholder = TextField(blank=True, default="", editable=False)
+    # {"webp": {"<width>": "<path>"}, "jpeg": {...}}, paths relative to MEDIA_ROOT
+    image_variants = JSONField(default=dict, blank=True, editable=False)
+
+    class Meta:
+        """Meta class."""
+
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db: Any, field_names: Any, values: Any) -> Any:
+        instance = super().from_db(db, field_names, values)
+        instance._built_image = getattr(instance, "image", None)
+        return instance
+
+    def build_image_variants(self) -> bool:
+        """
+        Recompute the variant fields from the current image.
+        Returns whether the image could be processed.
+        """
+        try:
+            built = build_image_variants(self.image or "", self.IMAGE_WIDTHS)
+        except (ValueError, OSError) as e:
+            logger.warning("No variants for %s image %r: %s", self, self.image, e)
+            built = None
+
+        self.image_width = built["width"] if built else None
+        self.image_height = built["height"] if built else None
+        self.image_placeholder = built["placeholder"] if built else ""
+        self.image_variants = built["variants"] if built else {}
+        self._built_image = self.image
+        return built is not None
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        update_fields = kwargs.get("update_fields")
+        image_saved = update_fields is None or "image" in update_fields
+        if image_saved and self.image != getattr(self, "_built_image", None):
+            self.build_image_variants()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, *IMAGE_VARIANT_FIELDS}
+        super().save(*args, **kwargs)
+
+
+class JobLease(Model):
+    """Lease held while a scheduled job runs, so it never runs twice at once."""
+
+    name = CharField(max_length=64, unique=True, verbose_name="Job")
+    owner = CharField(max_length=128, blank=True, default="", verbose_name="Owner")
+    expires_at = DateTimeField(null=True, blank=True, verbose_name="Expires at")
+    last_started_at = DateTimeField(null=True, blank=True, verbose_name="Last started at")
+    last_finished_at = DateTimeField(null=True, blank=True, verbose_name="Last finished at")
+
+    class Meta:
+        """Meta class."""
+
+        db_table = "abstracts_joblease"
+        verbose_name = "Job lease"
+        verbose_name_plural = "Job leases"
+
+    def __str__(self) -> str:
+        return self.name
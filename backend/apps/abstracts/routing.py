@@ -0,0 +1,101 @@
+# Python modules
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+# Django modules
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+# Third-party modules
+from rest_framework.permissions import SAFE_METHODS
+
+PIN_COOKIE = "db_pin"
+
+
+@dataclass
+class RoutingState:
+    """Where the current request may read from."""
+
+    # Set by ReplicaReadMixin for safe requests to public viewsets
+    replica_reads: bool = False
+    # Set by any write, or by the pin cookie of a client that wrote recently
+    pinned: bool = False
+    wrote: bool = False
+
+
+# A mutable object rather than two variables, so a flag set in a copied
+# context (e.g. a sync view run from ASGI) is still seen by the middleware
+_state: ContextVar[Optional[RoutingState]] = ContextVar("db_routing_state", default=None)
+
+
+def replica_enabled() -> bool:
+    return settings.REPLICA_DB in settings.DATABASES
+
+
+class ReplicaRouter:
+    """
+    Sends reads to the replica only inside requests that opted in (see
+    ReplicaReadMixin) and have not written anything; everything else,
+    including management commands and the scheduler, uses the primary.
+    """
+
+    def db_for_read(self, model: Any, **hints: Any) -> Optional[str]:
+        state = _state.get()
+        if state is not None and state.replica_reads and not state.pinned and replica_enabled():
+            return settings.REPLICA_DB
+        return "default"
+
+    def db_for_write(self, model: Any, **hints: Any) -> Optional[str]:
+        state = _state.get()
+        if state is not None:
+            # Reads after a write must see it
+            state.pinned = state.wrote = True
+        return "default"
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> Optional[bool]:
+        # Both aliases hold the same data
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, **hints: Any) -> Optional[bool]:
+        # The replica gets its schema from the primary (replication or copy)
+        return db != settings.REPLICA_DB
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Per-request routing state. A request that wrote gets a short-lived
+    cookie that keeps the client's next requests on the primary until
+    the replica has caught up.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        state = RoutingState(pinned=PIN_COOKIE in request.COOKIES)
+        token = _state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _state.reset(token)
+        if state.wrote and replica_enabled():
+            response.set_cookie(
+                PIN_COOKIE,
+                "1",
+                max_age=settings.REPLICA_PIN_SECONDS,
+                httponly=True,
+                samesite="Lax",
+            )
+        return response
+
+
+class ReplicaReadMixin:
+    """Viewset mixin: serve GET/HEAD/OPTIONS requests from the replica."""
+
+    def initial(self, request: Any, *args: Any, **kwargs: Any) -> None:
+        # Authentication (in super().initial) still reads from the primary
+        super().initial(request, *args, **kwargs)
+        state = _state.get()
+        if state is not None and request.method in SAFE_METHODS:
+            state.replica_reads = True
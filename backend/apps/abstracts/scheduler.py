@@ -0,0 +1,167 @@
+# Python modules
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+# Django modules
+from django.db import IntegrityError, models
+from django.utils import timezone
+
+# Project modules
+from apps.abstracts.models import JobLease
+
+
+class CronSchedule:
+    """Five-field cron expression: minute hour day-of-month month day-of-week.
+
+    Supports ``*``, numbers, ranges (``1-5``), lists (``0,30``) and steps
+    (``*/15``, ``0-30/10``). Day-of-week is 0-6 with 0 = Sunday. When both
+    day fields are restricted, either may match, as in cron.
+    """
+
+    _BOUNDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 6))
+
+    def __init__(self, expression: str) -> None:
+        parts = expression.split()
+        if len(parts) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression!r}")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, self.weekdays = (
+            self._parse_field(part, low, high)
+            for part, (low, high) in zip(parts, self._BOUNDS)
+        )
+        self._any_day = parts[2] == "*"
+        self._any_weekday = parts[4] == "*"
+
+    @staticmethod
+    def _parse_field(part: str, low: int, high: int) -> frozenset[int]:
+        values: set[int] = set()
+        for item in part.split(","):
+            item_range, _, step = item.partition("/")
+            if item_range == "*":
+                start, end = low, high
+            elif "-" in item_range:
+                start, end = (int(value) for value in item_range.split("-", 1))
+            else:
+                start = end = int(item_range)
+                if step:
+                    end = high
+            if not low <= start <= end <= high:
+                raise ValueError(f"Cron field {part!r} is out of range {low}-{high}")
+            values.update(range(start, end + 1, int(step) if step else 1))
+        return frozenset(values)
+
+    def _day_matches(self, moment: datetime) -> bool:
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self._any_day:
+            return weekday_ok
+        if self._any_weekday:
+            return day_ok
+        return day_ok or weekday_ok
+
+    def next_after(self, moment: datetime) -> datetime:
+        """First matching minute strictly after ``moment``."""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        # Four years covers every valid day/month combination (29 February)
+        limit = candidate + timedelta(days=4 * 366)
+        while candidate < limit:
+            if candidate.month not in self.months or not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+            elif candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+            else:
+                return candidate
+        raise ValueError(f"Cron expression never matches: {self.expression!r}")
+
+
+@dataclass
+class Job:
+    """A periodic task run by ``run_scheduler``.
+
+    Exactly one of ``interval`` (seconds) or ``cron`` (evaluated in
+    settings.TIME_ZONE) must be given. Each
+    run is delayed by a random 0..``jitter`` seconds and holds a database
+    lease of ``lease_seconds``, so the job never runs twice at once even
+    with several schedulers. The lease should outlast the longest run.
+    """
+
+    name: str
+    func: Callable[[], None]
+    interval: Optional[float] = None
+    cron: Optional[str] = None
+    jitter: float = 0.0
+    lease_seconds: int = 3600
+    schedule: Optional[CronSchedule] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if (self.interval is None) == (self.cron is None):
+            raise ValueError(f"Job {self.name!r} needs either interval or cron")
+        if self.cron is not None:
+            self.schedule = CronSchedule(self.cron)
+
+    def next_run(self, after: datetime) -> datetime:
+        if self.schedule is not None:
+            # Cron fields are wall-clock time in settings.TIME_ZONE
+            run_at = self.schedule.next_after(timezone.localtime(after))
+        else:
+            run_at = after + timedelta(seconds=self.interval)
+        return run_at + timedelta(seconds=random.uniform(0, self.jitter))
+
+
+# Jobs registered by the apps' ``jobs`` modules, keyed by name
+registry: dict[str, Job] = {}
+
+
+def register(
+    name: str,
+    *,
+    interval: Optional[float] = None,
+    cron: Optional[str] = None,
+    jitter: float = 0.0,
+    lease_seconds: int = 3600,
+) -> Callable[[Callable[[], None]], Callable[[], None]]:
+    """Decorator adding a function to the scheduler registry."""
+
+    def decorator(func: Callable[[], None]) -> Callable[[], None]:
+        registry[name] = Job(
+            name=name,
+            func=func,
+            interval=interval,
+            cron=cron,
+            jitter=jitter,
+            lease_seconds=lease_seconds,
+        )
+        return func
+
+    return decorator
+
+
+def acquire_lease(name: str, owner: str, seconds: int) -> bool:
+    """Take the named lease unless another owner holds an unexpired one."""
+    try:
+        JobLease.objects.get_or_create(name=name)
+    except IntegrityError:
+        # Another scheduler created the row first
+        pass
+
+    now = timezone.now()
+    taken = (
+        JobLease.objects.filter(name=name)
+        .filter(
+            models.Q(expires_at__isnull=True)
+            | models.Q(expires_at__lte=now)
+            | models.Q(owner=owner)
+        )
+        .update(owner=owner, expires_at=now + timedelta(seconds=seconds), last_started_at=now)
+    )
+    return taken == 1
+
+
+def release_lease(name: str, owner: str) -> None:
+    JobLease.objects.filter(name=name, owner=owner).update(
+        expires_at=None, last_finished_at=timezone.now()
+    )
@@ -0,0 +1,30 @@
+# Python modules
+from typing import Iterable
+
+# Django modules
+from django.db import connections
+from django.db.models import Q, QuerySet
+
+
+def search(queryset: QuerySet, query: str, fields: Iterable[str]) -> QuerySet:
+    """
+    Rows of ``queryset`` where any of ``fields`` (lookups, may span
+    relations such as ``translations__name``) contains ``query``.
+
+    On PostgreSQL word similarity is matched too, so small typos still
+    find results, and both lookups use the pg_trgm GIN indexes. Elsewhere
+    this is a plain case-insensitive substring match.
+    """
+    query = query.strip()
+    if not query:
+        return queryset
+    trigram = connections[queryset.db].vendor == "postgresql"
+    condition = Q()
+    for field in fields:
+        condition |= Q(**{f"{field}__icontains": query})
+        if trigram:
+            condition |= Q(**{f"{field}__trigram_word_similar": query})
+    # A subquery rather than a join, so a match in several translations
+    # does not repeat the row
+    matches = queryset.model._base_manager.filter(condition).values("pk")
+    return queryset.filter(pk__in=matches)
@@ -0,0 +1,245 @@
+# Python modules
+import json
+import os
+import time
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Iterable, Iterator, Optional
+
+# Django modules
+from django.apps import apps
+from django.conf import settings
+from django.core.management.color import no_style
+from django.db import connection
+from django.db.models import Model, Q
+
+# Project modules
+from apps.abstracts.bulk import DEFAULT_BATCH_SIZE, bulk_upsert
+
+SEEDS_DIR = os.path.join(settings.BASE_DIR, "seeds")
+MANIFEST_VERSION = 1
+
+
+class SeedError(Exception):
+    """Raised for a missing or malformed seed manifest or data file."""
+
+
+@dataclass
+class SeedStats:
+    """What loading one seed file changed."""
+
+    table: str
+    rows: int = 0
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    seconds: float = 0.0
+
+    def __str__(self) -> str:
+        rate = self.rows / self.seconds if self.seconds > 0 else 0.0
+        return (
+            f"{self.table}: {self.rows} rows ({self.created} created, "
+            f"{self.updated} updated, {self.unchanged} unchanged) "
+            f"in {self.seconds * 1000:.1f} ms ({rate:,.0f} rows/sec)"
+        )
+
+
+def read_manifest(seeds_dir: str = SEEDS_DIR) -> dict[str, Any]:
+    path = os.path.join(seeds_dir, "manifest.json")
+    try:
+        with open(path, encoding="utf-8") as fh:
+            manifest = json.load(fh)
+    except (OSError, ValueError) as e:
+        raise SeedError(f"Cannot read {path}: {e}") from e
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise SeedError(
+            f"{path} has version {manifest.get('version')!r}, expected {MANIFEST_VERSION}"
+        )
+    return manifest
+
+
+def iter_ndjson(path: str) -> Iterator[dict[str, Any]]:
+    """Rows of an NDJSON file, read one line at a time."""
+    try:
+        with open(path, encoding="utf-8") as fh:
+            for number, line in enumerate(fh, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    raise SeedError(f"{path}:{number}: {e}") from e
+    except OSError as e:
+        raise SeedError(f"Cannot read {path}: {e}") from e
+
+
+@dataclass
+class Reference:
+    """A foreign key column holding the target row's natural key, not its id."""
+
+    column: str
+    model: type[Model]
+    field: str
+
+    def ids(self, values: Iterable[Any]) -> dict[Any, int]:
+        return dict(
+            self.model._base_manager.filter(**{f"{self.field}__in": set(values)}).values_list(
+                self.field, "pk"
+            )
+        )
+
+    def resolve(self, rows: list[dict[str, Any]]) -> list[tuple[int, Any]]:
+        """
+        Replace natural keys in ``rows`` with local ids. Values not found
+        are set to None and returned as (row index, value).
+        """
+        ids = self.ids(row[self.column] for row in rows if row.get(self.column) is not None)
+        missing = []
+        for index, row in enumerate(rows):
+            value = row.get(self.column)
+            if value is None:
+                continue
+            if value in ids:
+                row[self.column] = ids[value]
+            else:
+                row[self.column] = None
+                missing.append((index, value))
+        return missing
+
+
+def load_rows(
+    model: type[Model],
+    rows: Iterable[dict[str, Any]],
+    key: list[str],
+    dry_run: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    refs: Optional[dict[str, list[str]]] = None,
+) -> SeedStats:
+    """
+    Bring a table in line with ``rows``, matched on the ``key`` fields.
+    Each chunk of rows is compared with the stored values and only new or
+    changed rows are written, so re-seeding an up-to-date database reads
+    but never writes, and memory use is bounded by ``batch_size``.
+
+    ``refs`` lists foreign key columns whose values are natural keys, as
+    {"event_id": ["events.Event", "link"]}, for data moved between
+    databases whose ids differ. A reference to a row of the same table
+    that is only created by this load is set once that row exists.
+    """
+    stats = SeedStats(model._meta.db_table)
+    references = [
+        Reference(column, apps.get_model(label), field)
+        for column, (label, field) in (refs or {}).items()
+    ]
+    deferred: list[tuple[dict[str, Any], Reference, Any]] = []
+    rows = iter(rows)
+    started = time.perf_counter()
+    while True:
+        raw = list(islice(rows, batch_size))
+        if not raw:
+            break
+        missing = []
+        for reference in references:
+            for index, value in reference.resolve(raw):
+                if reference.model is not model:
+                    raise SeedError(
+                        f"{stats.table}: no {reference.model._meta.label} with "
+                        f"{reference.field} = {value!r}"
+                    )
+                missing.append((index, reference, value))
+        chunk = [_to_python(model, row) for row in raw]
+        deferred += [
+            ({name: chunk[index][name] for name in key}, reference, value)
+            for index, reference, value in missing
+        ]
+        stats.rows += len(chunk)
+
+        fields = list(chunk[0])
+        existing = {
+            tuple(stored[name] for name in key): stored
+            for stored in model._base_manager.filter(_key_filter(chunk, key)).values(*fields)
+        }
+        changed = []
+        for row in chunk:
+            stored = existing.get(tuple(row[name] for name in key))
+            if stored is None:
+                stats.created += 1
+            elif stored != row:
+                stats.updated += 1
+            else:
+                stats.unchanged += 1
+                continue
+            changed.append(row)
+
+        if changed and not dry_run:
+            bulk_upsert(model, changed, unique_fields=key, batch_size=batch_size)
+    if deferred and not dry_run:
+        _set_deferred(model, deferred)
+    stats.seconds = time.perf_counter() - started
+    return stats
+
+
+def _set_deferred(
+    model: type[Model],
+    deferred: list[tuple[dict[str, Any], Reference, Any]],
+) -> None:
+    """Point rows at same-table rows that were written after them."""
+    for lookup, reference, value in deferred:
+        target = reference.ids([value]).get(value)
+        if target is None:
+            raise SeedError(
+                f"{model._meta.db_table}: no {reference.model._meta.label} with "
+                f"{reference.field} = {value!r}"
+            )
+        model._base_manager.filter(**lookup).update(**{reference.column: target})
+
+
+def load_seed_set(
+    name: str,
+    dry_run: bool = False,
+    seeds_dir: str = SEEDS_DIR,
+) -> Iterator[SeedStats]:
+    """Load every file of a manifest set in order, yielding stats per file."""
+    manifest = read_manifest(seeds_dir)
+    entries = manifest["sets"].get(name)
+    if entries is None:
+        raise SeedError(
+            f"Unknown seed set {name!r}; available: {', '.join(sorted(manifest['sets']))}"
+        )
+
+    models = []
+    for entry in entries:
+        try:
+            model = apps.get_model(entry["model"])
+        except LookupError as e:
+            raise SeedError(f"Seed set {name!r}: {e}") from e
+        models.append(model)
+        yield load_rows(
+            model,
+            iter_ndjson(os.path.join(seeds_dir, entry["file"])),
+            entry["key"],
+            dry_run=dry_run,
+            refs=entry.get("refs"),
+        )
+
+    if not dry_run:
+        # Rows carry explicit ids; move sequences past them (no-op on SQLite)
+        statements = connection.ops.sequence_reset_sql(no_style(), models)
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
+
+
+def _to_python(model: type[Model], row: dict[str, Any]) -> dict[str, Any]:
+    """JSON values as the Python values the ORM returns (dates, times, ...)."""
+    return {
+        name: model._meta.get_field(name).to_python(value)
+        for name, value in row.items()
+    }
+
+
+def _key_filter(chunk: list[dict[str, Any]], key: list[str]) -> Q:
+    if len(key) == 1:
+        return Q(**{f"{key[0]}__in": [row[key[0]] for row in chunk]})
+    # A superset of the wanted rows; exact matches are picked in Python
+    return Q(**{f"{name}__in": {row[name] for row in chunk} for name in key})
@@ -0,0 +1,53 @@
+# Python modules
+from typing import Any, Optional
+
+# Third-party modules
+from drf_spectacular.utils import extend_schema_field
+from rest_framework import serializers
+
+# Project modules
+from apps.abstracts.images import media_url, srcset
+
+
+@extend_schema_field(
+    {
+        "type": "object",
+        "nullable": True,
+        "properties": {
+            "width": {"type": "integer"},
+            "height": {"type": "integer"},
+            "placeholder": {"type": "string", "description": "Tiny blurred WebP data URI."},
+            "webp": {"type": "string", "description": "srcset of WebP variants."},
+            "jpeg": {"type": "string", "description": "srcset of JPEG variants."},
+        },
+    }
+)
+class ImageSetField(serializers.Field):
+    """
+    Read-only ``srcset``-style view of an ImageVariantsMixin model:
+    intrinsic size, blur placeholder and one srcset per format.
+    Null until variants have been built for the image.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, instance: Any) -> Optional[dict[str, Any]]:
+        if not instance.image_variants:
+            return None
+        request = self.context.get("request")
+
+        def url(path: str) -> str:
+            return request.build_absolute_uri(media_url(path)) if request else media_url(path)
+
+        return {
+            "width": instance.image_width,
+            "height": instance.image_height,
+            "placeholder": instance.image_placeholder,
+            **{
+                name: srcset(paths, url)
+                for name, paths in instance.image_variants.items()
+            },
+        }
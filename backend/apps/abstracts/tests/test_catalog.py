@@ -0,0 +1,85 @@
+import json
+from datetime import date, time
+
+import pytest
+
+from apps.abstracts.catalog import CATALOG_SET, export_catalog
+from apps.abstracts.seeds import SeedError, load_seed_set
+from apps.events.models import Event, EventTranslation
+
+pytestmark = pytest.mark.django_db
+
+
+def create_event(link, **fields):
+    values = {
+        "image": "https://example.com/poster.jpg",
+        "date": date(2026, 11, 1),
+        "start_time": time(19, 0),
+        "duration": 120,
+        "artist": "Artist",
+        "category": Event.Category.CATEGORY_0,
+        "address": "Abay Opera House",
+        "link": link,
+    }
+    values.update(fields)
+    return Event.objects.create(**values)
+
+
+def load(directory):
+    return {stats.table: stats for stats in load_seed_set(CATALOG_SET, seeds_dir=directory)}
+
+
+def read_rows(path):
+    with open(path, encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh]
+
+
+def test_events_are_exported_by_link(tmp_path):
+    canonical = create_event("https://example.com/a")
+    duplicate = create_event("https://example.com/b", duplicate_of=canonical)
+    EventTranslation.objects.create(event=duplicate, language_id=0, name="B", description="")
+
+    list(export_catalog(str(tmp_path)))
+
+    events = read_rows(tmp_path / "events_event.ndjson")
+    assert all("id" not in row for row in events)
+    assert [row["duplicate_of_id"] for row in events] == [None, "https://example.com/a"]
+    assert read_rows(tmp_path / "events_eventtranslation.ndjson")[0]["event_id"] == "https://example.com/b"
+
+
+def test_import_maps_events_onto_local_ids(tmp_path):
+    canonical = create_event("https://example.com/a", artist="Jazz")
+    duplicate = create_event("https://example.com/b", artist="Jazz", duplicate_of=canonical)
+    EventTranslation.objects.create(event=duplicate, language_id=0, name="Jazz", description="")
+    list(export_catalog(str(tmp_path)))
+
+    # The importing side: other ids, one of them taken by an unrelated event
+    Event.all_objects.all().delete()
+    other = create_event("https://example.com/other")
+    Event.all_objects.filter(pk=other.pk).update(id=canonical.id)
+    create_event("https://example.com/b", artist="Old title")
+
+    stats = load(str(tmp_path))
+
+    assert (stats["events_event"].created, stats["events_event"].updated) == (1, 1)
+    imported = {event.link: event for event in Event.all_objects.all()}
+    assert imported["https://example.com/other"].artist == "Artist"
+    assert imported["https://example.com/b"].artist == "Jazz"
+    assert imported["https://example.com/b"].duplicate_of == imported["https://example.com/a"]
+    translation = EventTranslation.objects.get()
+    assert translation.event == imported["https://example.com/b"]
+
+    again = load(str(tmp_path))
+    assert again["events_event"].unchanged == 2
+    assert again["events_eventtranslation"].unchanged == 1
+
+
+def test_import_rejects_translations_of_unknown_events(tmp_path):
+    event = create_event("https://example.com/a")
+    EventTranslation.objects.create(event=event, language_id=0, name="A", description="")
+    list(export_catalog(str(tmp_path)))
+    (tmp_path / "events_event.ndjson").write_text("")
+
+    Event.all_objects.all().delete()
+    with pytest.raises(SeedError, match="https://example.com/a"):
+        load(str(tmp_path))
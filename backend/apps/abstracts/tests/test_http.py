@@ -0,0 +1,238 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from apps.abstracts.http import (
+    CircuitBreaker,
+    CircuitOpenError,
+    HttpClient,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+class StubServer:
+    """
+    Local HTTP server answering each path from a script of
+    (status, headers) responses; the last one repeats.
+    """
+
+    def __init__(self) -> None:
+        self.scripts: dict[str, list[tuple[int, dict[str, str]]]] = {}
+        self.hits: dict[str, int] = {}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                script = server.scripts.get(self.path, [(404, {})])
+                hit = server.hits.get(self.path, 0)
+                server.hits[self.path] = hit + 1
+                status, headers = script[min(hit, len(script) - 1)]
+                body = b"ok" if status < 400 else b"error"
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(
+            target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self.thread.start()
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_port}{path}"
+
+    def close(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def server():
+    stub = StubServer()
+    yield stub
+    stub.close()
+
+
+@pytest.fixture
+def sleeps():
+    return []
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def make_client(sleeps, clock):
+    clients = []
+
+    def make(**kwargs):
+        kwargs.setdefault("retry", RetryPolicy(max_retries=2))
+        client = HttpClient(sleep=sleeps.append, clock=clock, timeout=5.0, **kwargs)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+def test_retries_server_errors_then_succeeds(server, make_client, sleeps):
+    server.scripts["/flaky"] = [(503, {}), (502, {}), (200, {})]
+
+    response = make_client().get(server.url("/flaky"))
+
+    assert response.status_code == 200
+    assert server.hits["/flaky"] == 3
+    assert len(sleeps) == 2
+
+
+def test_gives_up_after_max_retries(server, make_client):
+    server.scripts["/down"] = [(500, {})]
+
+    with pytest.raises(requests.HTTPError) as excinfo:
+        make_client().get(server.url("/down"))
+
+    assert excinfo.value.response.status_code == 500
+    assert server.hits["/down"] == 3
+
+
+def test_client_errors_are_returned_without_retrying(server, make_client):
+    response = make_client().get(server.url("/missing"))
+
+    assert response.status_code == 404
+    assert server.hits["/missing"] == 1
+
+
+def test_honours_retry_after(server, make_client, sleeps):
+    server.scripts["/busy"] = [(429, {"Retry-After": "7"}), (200, {})]
+
+    response = make_client().get(server.url("/busy"))
+
+    assert response.status_code == 200
+    assert sleeps == [7.0]
+
+
+def test_retry_after_beyond_limit_gives_up_at_once(server, make_client, sleeps):
+    server.scripts["/busy"] = [(503, {"Retry-After": "3600"}), (200, {})]
+
+    with pytest.raises(requests.HTTPError):
+        make_client().get(server.url("/busy"))
+
+    assert server.hits["/busy"] == 1
+    assert sleeps == []
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_breaker_opens_and_fails_fast(server, make_client):
+    server.scripts["/down"] = [(500, {})]
+    client = make_client(
+        retry=RetryPolicy(max_retries=0),
+        breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60.0),
+    )
+
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            client.get(server.url("/down"))
+    with pytest.raises(CircuitOpenError):
+        client.get(server.url("/down"))
+
+    assert server.hits["/down"] == 2
+
+
+def test_breaker_closes_after_successful_trial(server, make_client, clock):
+    server.scripts["/recovering"] = [(500, {}), (500, {}), (200, {})]
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60.0, clock=clock)
+    client = make_client(retry=RetryPolicy(max_retries=0), breaker=breaker)
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            client.get(server.url("/recovering"))
+
+    clock.now += 61
+    assert client.get(server.url("/recovering")).status_code == 200
+    assert client.get(server.url("/recovering")).status_code == 200
+    assert server.hits["/recovering"] == 4
+
+
+def test_half_open_lets_one_trial_through():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0, clock=clock)
+    breaker.record_failure("host")
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("host")
+
+    clock.now += 61
+    breaker.before_request("host")  # the trial
+    # Everyone else keeps failing fast while the trial is in flight
+    for _ in range(3):
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("host")
+
+    breaker.record_success("host")
+    breaker.before_request("host")
+    breaker.before_request("host")
+
+
+def test_failed_trial_reopens_the_breaker():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60.0, clock=clock)
+    for _ in range(3):
+        breaker.record_failure("host")
+
+    clock.now += 61
+    breaker.before_request("host")
+    breaker.record_failure("host")
+
+    clock.now += 30
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request("host")
+    clock.now += 31
+    breaker.before_request("host")
+
+
+def test_lost_trial_is_replaced_after_reset_timeout():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0, clock=clock)
+    breaker.record_failure("host")
+    clock.now += 61
+    breaker.before_request("host")  # never reports back
+
+    clock.now += 30
+    assert breaker.is_open("host")
+    clock.now += 31
+    breaker.before_request("host")
+
+
+def test_min_interval_spaces_requests_to_a_host(server, make_client, sleeps):
+    server.scripts["/page"] = [(200, {})]
+    client = make_client(min_interval=2.0)
+
+    for _ in range(3):
+        client.get(server.url("/page"))
+
+    # The fake clock stands still, so each request waits a full interval more
+    assert sleeps == [2.0, 4.0]
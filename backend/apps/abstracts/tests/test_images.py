@@ -0,0 +1,61 @@
+import os
+
+import pytest
+from PIL import Image
+
+from apps.places.models import Place
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def media(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    return tmp_path
+
+
+def local_image(media, name="places/poster.png", size=(800, 400)):
+    path = media / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", size, (200, 80, 40)).save(path)
+    return name
+
+
+def create_place(image):
+    return Place.objects.create(
+        image=image, category=0, address="Dostyk Avenue 56", link="", lat=43.2, lng=76.9
+    )
+
+
+def test_save_builds_variants_of_a_local_image(media):
+    place = create_place(local_image(media))
+
+    place.refresh_from_db()
+    assert (place.image_width, place.image_height) == (800, 400)
+    assert place.image_placeholder.startswith("data:image/webp;base64,")
+    # Only widths narrower than the original
+    assert {name: sorted(paths) for name, paths in place.image_variants.items()} == {
+        "webp": ["320", "640"],
+        "jpeg": ["320", "640"],
+    }
+    for path in place.image_variants["webp"].values():
+        assert os.path.isfile(media / path)
+    with Image.open(media / place.image_variants["jpeg"]["320"]) as variant:
+        assert variant.size == (320, 160)
+
+
+@pytest.mark.parametrize(
+    "image",
+    ["https://example.com/poster.jpg", "places/missing.png", "places/not-an-image.png"],
+)
+def test_save_clears_variants_when_the_image_cannot_be_processed(media, image):
+    place = create_place(local_image(media))
+    (media / "places" / "not-an-image.png").write_bytes(b"<html></html>")
+
+    place.image = image
+    place.save(update_fields=["image"])
+
+    place.refresh_from_db()
+    assert (place.image_width, place.image_height) == (None, None)
+    assert place.image_placeholder == ""
+    assert place.image_variants == {}
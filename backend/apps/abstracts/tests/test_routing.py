@@ -0,0 +1,146 @@
+import sqlite3
+from datetime import date, time, timedelta
+
+import pytest
+from django.db import connections
+from rest_framework.test import APIClient
+
+from apps.abstracts.routing import PIN_COOKIE, ReplicaRouter, RoutingState, _state
+from apps.events.models import CalendarEvent, Event
+from apps.users.models import CustomUser
+
+EVENTS_URL = "/api/v1/events/events/"
+CALENDAR_URL = "/api/v1/events/calendar/"
+
+
+def create_event(number: int) -> Event:
+    return Event.objects.create(
+        image="",
+        date=date.today() + timedelta(days=7),
+        start_time=time(19, 0),
+        duration=90,
+        artist="Artist",
+        category=Event.Category.CATEGORY_0,
+        address="Abay Opera House",
+        link=f"https://example.com/event/{number}",
+    )
+
+
+@pytest.fixture
+def replica(settings, tmp_path):
+    """
+    A second SQLite file as the "replica" alias: a snapshot of the test
+    database taken when ``refresh()`` is called, opened read-only like the
+    production copy. Rows written afterwards exist on the primary only.
+    """
+    if connections["default"].vendor != "sqlite":
+        pytest.skip("The replica file is a copy of a SQLite primary")
+    path = tmp_path / "replica.sqlite3"
+
+    def refresh() -> None:
+        replica_connection = connections[settings.REPLICA_DB]
+        replica_connection.close()
+        primary = connections["default"]
+        primary.ensure_connection()
+        target = sqlite3.connect(path)
+        try:
+            primary.connection.backup(target)
+        finally:
+            target.close()
+        # Connected here: the test case only refuses *new* connections to
+        # aliases it did not set up, and the test client keeps this one open
+        replica_connection.connect()
+
+    alias_settings = {
+        **connections["default"].settings_dict,
+        "NAME": f"file:{path}?mode=ro",
+        "OPTIONS": {"uri": True},
+        "CONN_MAX_AGE": 0,
+    }
+    settings.DATABASES[settings.REPLICA_DB] = alias_settings
+    yield refresh
+    connections[settings.REPLICA_DB].close()
+    del connections[settings.REPLICA_DB]
+    del settings.DATABASES[settings.REPLICA_DB]
+
+
+@pytest.fixture
+def user(db):
+    return CustomUser.objects.create_user(
+        email="reader@example.com", username="reader", phone="+77010000000", password="secret"
+    )
+
+
+def links(response):
+    return sorted(event["link"] for event in response.json()["results"])
+
+
+@pytest.mark.django_db(transaction=True)
+def test_reads_go_to_the_replica(replica):
+    create_event(1)
+    replica()
+    create_event(2)  # not replicated yet
+
+    response = APIClient().get(EVENTS_URL)
+
+    assert response.status_code == 200
+    assert links(response) == ["https://example.com/event/1"]
+    assert PIN_COOKIE not in response.cookies
+
+
+@pytest.mark.django_db(transaction=True)
+def test_writes_go_to_default_and_pin_the_next_reads(replica, user):
+    event = create_event(1)
+    replica()
+    create_event(2)
+    client = APIClient()
+    client.force_authenticate(user)
+
+    response = client.post(CALENDAR_URL, {"event": event.pk, "status": 0}, format="json")
+
+    assert response.status_code == 201
+    assert CalendarEvent.objects.using("default").filter(user=user).count() == 1
+    assert response.cookies[PIN_COOKIE]["max-age"] > 0
+    # The cookie keeps this client's reads on the primary
+    assert links(client.get(EVENTS_URL)) == [
+        "https://example.com/event/1",
+        "https://example.com/event/2",
+    ]
+    # Other clients still read the replica
+    assert links(APIClient().get(EVENTS_URL)) == ["https://example.com/event/1"]
+
+
+@pytest.mark.django_db
+def test_without_replica_everything_uses_default():
+    create_event(1)
+    router = ReplicaRouter()
+    token = _state.set(RoutingState(replica_reads=True))
+    try:
+        assert router.db_for_read(Event) == "default"
+    finally:
+        _state.reset(token)
+
+    response = APIClient().get(EVENTS_URL)
+    assert links(response) == ["https://example.com/event/1"]
+    assert PIN_COOKIE not in response.cookies
+
+
+def test_router_outside_requests_uses_default(replica):
+    router = ReplicaRouter()
+
+    assert router.db_for_read(Event) == "default"
+    assert router.db_for_write(Event) == "default"
+    assert router.allow_migrate("replica", "events") is False
+
+
+def test_router_pins_a_request_after_a_write(replica):
+    router = ReplicaRouter()
+    state = RoutingState(replica_reads=True)
+    token = _state.set(state)
+    try:
+        assert router.db_for_read(Event) == "replica"
+        assert router.db_for_write(Event) == "default"
+        assert state.pinned and state.wrote
+        assert router.db_for_read(Event) == "default"
+    finally:
+        _state.reset(token)
@@ -0,0 +1,96 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+from zoneinfo import ZoneInfo
+
+import pytest
+import requests
+from django.core.management import call_command
+from django.utils.module_loading import autodiscover_modules
+
+from apps.abstracts.scheduler import CronSchedule, Job, registry
+from apps.events.sources import SxodimSource
+
+ALMATY = ZoneInfo("Asia/Almaty")
+
+
+def at(*args, tz=ALMATY):
+    return datetime(*args, tzinfo=tz)
+
+
+@pytest.mark.parametrize(
+    "expression, after, expected",
+    [
+        ("*/15 * * * *", at(2026, 10, 19, 10, 7), at(2026, 10, 19, 10, 15)),
+        # Strictly after: a matching minute moves on to the next match
+        ("0 3 * * *", at(2026, 10, 19, 3, 0), at(2026, 10, 20, 3, 0)),
+        ("5 0 * * *", at(2026, 10, 19, 23, 59, 30), at(2026, 10, 20, 0, 5)),
+        ("0-30/10 9 * * *", at(2026, 10, 19, 9, 21), at(2026, 10, 19, 9, 30)),
+        # 2026-10-19 is a Monday; 0 = Sunday
+        ("0 12 * * 0", at(2026, 10, 19, 8, 0), at(2026, 10, 25, 12, 0)),
+        ("0 12 * * 1-5", at(2026, 10, 23, 13, 0), at(2026, 10, 26, 12, 0)),
+        ("0 0 29 2 *", at(2026, 10, 19, 0, 0), at(2028, 2, 29, 0, 0)),
+        # Either restricted day field may match
+        ("0 0 1 * 1", at(2026, 10, 20, 0, 0), at(2026, 10, 26, 0, 0)),
+        ("0 0 1 * 1", at(2026, 10, 27, 0, 0), at(2026, 11, 1, 0, 0)),
+    ],
+)
+def test_cron_next_after(expression, after, expected):
+    assert CronSchedule(expression).next_after(after) == expected
+
+
+@pytest.mark.parametrize("expression", ["* * * *", "60 * * * *", "* 24 * * *", "0 0 31 2 *"])
+def test_cron_rejects_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        CronSchedule(expression).next_after(at(2026, 10, 19))
+
+
+def test_cron_job_runs_at_local_time(settings):
+    settings.TIME_ZONE = "Asia/Almaty"
+    job = Job(name="nightly", func=lambda: None, cron="0 3 * * *")
+
+    # 22:30 UTC is already 03:30 local on the next day
+    run_at = job.next_run(datetime(2026, 10, 19, 22, 30, tzinfo=dt_timezone.utc))
+
+    assert run_at == at(2026, 10, 21, 3, 0)
+    assert run_at.astimezone(dt_timezone.utc) == datetime(2026, 10, 20, 22, 0, tzinfo=dt_timezone.utc)
+
+
+def test_interval_job_adds_interval_and_jitter():
+    job = Job(name="poll", func=lambda: None, interval=60, jitter=5)
+    after = at(2026, 10, 19, 10, 0)
+
+    run_at = job.next_run(after)
+
+    assert after + timedelta(seconds=60) <= run_at <= after + timedelta(seconds=65)
+
+
+def test_job_needs_interval_or_cron():
+    with pytest.raises(ValueError):
+        Job(name="broken", func=lambda: None)
+
+
+def offline_send(self, request, **kwargs):
+    """No network in tests: every site answers 404 at once."""
+    response = requests.Response()
+    response.status_code = 404
+    response.url = request.url
+    response.request = request
+    response._content = b""
+    return response
+
+
+@pytest.mark.django_db(transaction=True)
+def test_every_registered_job_runs(settings, tmp_path, monkeypatch):
+    settings.MEDIA_ROOT = str(tmp_path / "media")
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", offline_send)
+    monkeypatch.setattr(SxodimSource, "min_interval", 0.0)
+    monkeypatch.setattr(
+        "apps.events.management.commands.fetch_events.CHECKPOINT_PATH",
+        str(tmp_path / "checkpoint.json"),
+    )
+    call_command("generatedata", stdout=StringIO())
+    autodiscover_modules("jobs")
+
+    assert {"crawl_events", "warm_event_cache", "warm_place_cache"} <= set(registry)
+    for name, job in sorted(registry.items()):
+        job.func()
@@ -0,0 +1,72 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from apps.events.models import Event, EventTranslation
+from apps.events.views import EventViewSet
+from apps.places.models import Place, PlaceTranslation
+from apps.places.views import PlaceViewSet
+
+pytestmark = pytest.mark.django_db
+
+EVENTS_URL = "/api/v1/events/events/"
+PLACES_URL = "/api/v1/places/"
+TRIGRAM = connection.vendor == "postgresql"
+
+
+@pytest.fixture
+def catalogue():
+    for number, (name, artist) in enumerate(
+        [("Kazakh Philharmonic", "State Orchestra"), ("Jazz Night", "EverJazz Quartet")]
+    ):
+        event = Event.objects.create(
+            image="https://example.com/poster.jpg",
+            date=timezone.localdate() + timedelta(days=1),
+            start_time="19:00",
+            duration=120,
+            artist=artist,
+            category=Event.Category.CATEGORY_0,
+            address="Abay Opera House",
+            link=f"https://example.com/event/{number}",
+        )
+        for language_id in (0, 1):
+            EventTranslation.objects.create(
+                event=event, language_id=language_id, name=name, description=""
+            )
+    place = Place.objects.create(
+        image="", category=0, address="Dostyk Avenue 56", link="", lat=43.2, lng=76.9
+    )
+    PlaceTranslation.objects.create(
+        place=place, language_id=0, name="Palace of the Republic", timetable="", description=""
+    )
+
+
+def names(response):
+    assert response.status_code == 200
+    results = response.json()
+    results = results["results"] if isinstance(results, dict) else results
+    return [
+        next(t["name"] for t in item["translations"] if t["language_id"] == 0) for item in results
+    ]
+
+
+def test_search_matches_substrings_once_per_row(client, catalogue):
+    assert names(client.get(EVENTS_URL, {"search": "philharmonic"})) == ["Kazakh Philharmonic"]
+    assert names(client.get(EVENTS_URL, {"search": "everjazz"})) == ["Jazz Night"]
+    assert names(client.get(EVENTS_URL)) == ["Kazakh Philharmonic", "Jazz Night"]
+    assert names(client.get(PLACES_URL, {"search": "dostyk"})) == ["Palace of the Republic"]
+
+
+def test_search_tolerates_typos_on_postgres_only(client, catalogue):
+    # The PostgreSQL CI leg runs the trigram_word_similar path here
+    expected = ["Kazakh Philharmonic"] if TRIGRAM else []
+    assert names(client.get(EVENTS_URL, {"search": "Philharmonc"})) == expected
+    expected = ["Palace of the Republic"] if TRIGRAM else []
+    assert names(client.get(PLACES_URL, {"search": "Republc"})) == expected
+
+
+def test_querysets_build_without_a_request(catalogue):
+    assert EventViewSet().get_queryset().count() == 2
+    assert PlaceViewSet().get_queryset().count() == 1
@@ -1,7 +1,11 @@
 from django.contrib import admin
 from unfold.admin import ModelAdmin, TabularInline
 
-from apps.events.models import Event, EventTranslation, CalendarEvent
+from apps.abstracts.admin import SoftDeleteAdminMixin
+from apps.events.models import (
+    ArchivedCalendarEvent, ArchivedEvent, ArchivedEventTranslation,
+    Event, EventTranslation, CalendarEvent, CrawlRun, CrawlURL, PosterImage,
+)
 
 
 class EventTranslationInline(TabularInline):
@@ -10,10 +14,16 @@ class EventTranslationInline(TabularInline):
 
 
 @admin.register(Event)
-class EventAdmin(ModelAdmin):
-    list_display = ('id', 'date', 'start_time', 'artist', 'category', 'cost', 'currency')
-    list_filter = ('category', 'date')
-    search_fields = ('artist', 'address')
+class EventAdmin(SoftDeleteAdminMixin, ModelAdmin):
+    list_display = ('id', 'date', 'start_time', 'artist', 'category', 'cost', 'currency', 'duplicate_of', 'deleted_at')
+    list_filter = (
+        'category',
+        'date',
+        ('duplicate_of', admin.EmptyFieldListFilter),
+        ('deleted_at', admin.EmptyFieldListFilter),
+    )
+    search_fields = ('artist', 'address', 'link')
+    raw_id_fields = ('duplicate_of', 'poster')
     inlines = [EventTranslationInline]
 
 
@@ -28,3 +38,50 @@ class EventTranslationAdmin(ModelAdmin):
 class CalendarEventAdmin(ModelAdmin):
     list_display = ('id', 'user', 'event', 'status')
     list_filter = ('status',)
+
+
+@admin.register(CrawlURL)
+class CrawlURLAdmin(ModelAdmin):
+    list_display = ('id', 'url', 'kind', 'state', 'lease_owner', 'attempts', 'last_fetched_at')
+    list_filter = ('kind', 'state')
+    search_fields = ('url',)
+
+
+@admin.register(CrawlRun)
+class CrawlRunAdmin(ModelAdmin):
+    list_display = (
+        'id', 'started_at', 'mode', 'outcome', 'pages', 'pages_per_second',
+        'fetch_p50_ms', 'fetch_p99_ms', 'parse_ms_per_page', 'db_seconds',
+        'created', 'updated', 'unchanged', 'errors',
+    )
+    list_filter = ('mode', 'outcome')
+    date_hierarchy = 'started_at'
+    readonly_fields = [field.name for field in CrawlRun._meta.fields]
+
+
+@admin.register(PosterImage)
+class PosterImageAdmin(ModelAdmin):
+    list_display = ('id', 'sha256', 'width', 'height', 'bytes', 'created_at')
+    search_fields = ('sha256', 'file')
+    readonly_fields = [field.name for field in PosterImage._meta.fields]
+
+
+class ArchivedEventTranslationInline(TabularInline):
+    model = ArchivedEventTranslation
+    extra = 0
+
+
+@admin.register(ArchivedEvent)
+class ArchivedEventAdmin(ModelAdmin):
+    list_display = ('id', 'date', 'start_time', 'artist', 'category', 'archived_at')
+    list_filter = ('category', 'date')
+    search_fields = ('artist', 'address', 'link')
+    raw_id_fields = ('poster',)
+    inlines = [ArchivedEventTranslationInline]
+
+
+@admin.register(ArchivedCalendarEvent)
+class ArchivedCalendarEventAdmin(ModelAdmin):
+    list_display = ('id', 'user', 'event', 'status')
+    list_filter = ('status',)
+    raw_id_fields = ('user', 'event')
@@ -0,0 +1,96 @@
+"""
+Moves old events out of the live tables that every listing query reads.
+
+An event is archived once it is more than N days in the past, or was
+soft-deleted more than N days ago. Its row, translations and calendar
+entries are copied to the Archived* tables and then deleted from the
+live ones, one chunk per transaction, so the live tables only hold
+current events while users keep their calendar history. Duplicates go
+with their canonical event, so they never turn canonical again.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Optional
+
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from apps.abstracts.bulk import bulk_upsert
+from apps.events.models import (
+    ArchivedCalendarEvent,
+    ArchivedEvent,
+    ArchivedEventTranslation,
+    CalendarEvent,
+    Event,
+    EventTranslation,
+)
+
+ARCHIVE_CHUNK_SIZE = 500
+
+EVENT_FIELDS = [
+    "id", "image", "poster_id", "date", "start_time", "duration", "artist", "cost",
+    "currency", "category", "address", "link", "duplicate_of_id",
+    "created_at", "updated_at", "deleted_at",
+]
+
+
+@dataclass
+class ArchiveStats:
+    events: int = 0
+    translations: int = 0
+    calendar_entries: int = 0
+    seconds: float = 0.0
+
+    def add(self, other: "ArchiveStats") -> None:
+        self.events += other.events
+        self.translations += other.translations
+        self.calendar_entries += other.calendar_entries
+        self.seconds += other.seconds
+
+
+def archivable_events(older_than_days: int, today: Optional[date] = None) -> QuerySet:
+    """Events dated, or soft-deleted, more than ``older_than_days`` ago."""
+    today = today or timezone.localdate()
+    return Event.all_objects.filter(
+        Q(date__lt=today - timedelta(days=older_than_days))
+        | Q(deleted_at__lt=timezone.now() - timedelta(days=older_than_days))
+    )
+
+
+def archive_chunk(event_ids: list[int]) -> ArchiveStats:
+    """Copy the given events and their duplicates, with translations and
+    calendar entries, to the archive tables and delete them from the live
+    ones, atomically."""
+    started = time.perf_counter()
+    stats = ArchiveStats()
+    with transaction.atomic():
+        events = list(
+            Event.all_objects.filter(
+                Q(id__in=event_ids) | Q(duplicate_of_id__in=event_ids)
+            ).values(*EVENT_FIELDS)
+        )
+        if not events:
+            return stats
+        ids = [row["id"] for row in events]
+        stats.events = bulk_upsert(ArchivedEvent, events, unique_fields=["id"]).rows
+        stats.translations = bulk_upsert(
+            ArchivedEventTranslation,
+            EventTranslation.objects.filter(event_id__in=ids).values(
+                "event_id", "language_id", "name", "description"
+            ),
+            unique_fields=["event_id", "language_id"],
+        ).rows
+        stats.calendar_entries = bulk_upsert(
+            ArchivedCalendarEvent,
+            CalendarEvent.objects.filter(event_id__in=ids).values("user_id", "event_id", "status"),
+            unique_fields=["user_id", "event_id"],
+        ).rows
+        # Cascades to translations and calendar entries
+        Event.all_objects.filter(id__in=ids).delete()
+    stats.seconds = time.perf_counter() - started
+    return stats
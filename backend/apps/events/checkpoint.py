@@ -0,0 +1,80 @@
+"""
+Crawl progress of a ``fetch_events`` run, persisted to a JSON file so an
+interrupted run can continue with ``--resume`` instead of starting over.
+"""
+
+import json
+import os
+from typing import Any, Optional
+
+
+class CrawlCheckpoint:
+    """
+    Discovered event links (with source and category), links already handled,
+    listings walked to the end and the run's counters.
+
+    A link counts as completed only once its event has been written (or
+    deliberately skipped), so nothing buffered at the moment of a crash is
+    lost on resume.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.discovered: dict[str, tuple[str, int]] = {}
+        self.completed: set[str] = set()
+        self.listings_done: set[str] = set()
+        self.counts: dict[str, int] = {}
+
+    @classmethod
+    def load(cls, path: str) -> Optional["CrawlCheckpoint"]:
+        """Read a checkpoint file; None if there is no interrupted run to resume."""
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as fh:
+            state = json.load(fh)
+
+        checkpoint = cls(path)
+        checkpoint.discovered = {
+            link: (source, category) for link, source, category in state["discovered"]
+        }
+        checkpoint.completed = set(state["completed"])
+        checkpoint.listings_done = set(state["listings_done"])
+        checkpoint.counts = state["counts"]
+        return checkpoint
+
+    def discover(self, link: str, source: str, category: int) -> None:
+        self.discovered.setdefault(link, (source, category))
+
+    def complete(self, links: list[str]) -> None:
+        self.completed.update(links)
+
+    def remaining(self) -> dict[str, list[tuple[str, int]]]:
+        """Discovered links not completed yet, per source, in discovery order."""
+        pending: dict[str, list[tuple[str, int]]] = {}
+        for link, (source, category) in self.discovered.items():
+            if link not in self.completed:
+                pending.setdefault(source, []).append((link, category))
+        return pending
+
+    def save(self) -> None:
+        """Write the checkpoint atomically: a kill mid-write keeps the old file."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        state: dict[str, Any] = {
+            "discovered": [
+                [link, source, category]
+                for link, (source, category) in self.discovered.items()
+            ],
+            "completed": sorted(self.completed),
+            "listings_done": sorted(self.listings_done),
+            "counts": self.counts,
+        }
+        with open(f"{self.path}.tmp", "w", encoding="utf-8") as fh:
+            json.dump(state, fh, ensure_ascii=False)
+        os.replace(f"{self.path}.tmp", self.path)
+
+    def clear(self) -> None:
+        """Remove the file once the run has finished."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
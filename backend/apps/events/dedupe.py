@@ -0,0 +1,164 @@
+"""
+Event de-duplication across listings and sources.
+
+The same show often appears under several links (different slugs or
+sites). Candidates are blocked by (date, normalized venue), so only
+events on the same day at the same place are ever compared, and then
+matched on normalized titles. A duplicate keeps its row, so the next
+crawl of its link does not recreate it; it just points to the canonical
+event (the oldest one) through ``duplicate_of`` and is hidden from the
+API. Calendar entries move to the canonical event.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import date
+from difflib import SequenceMatcher
+from typing import Iterable
+
+from django.db import transaction
+
+from apps.events.models import CalendarEvent, Event
+
+# Titles at least this similar (0..1) are considered the same event
+DEFAULT_THRESHOLD = 0.85
+
+_PUNCT_RE = re.compile(r"[^\w\s]+")
+_SPACE_RE = re.compile(r"\s+")
+
+# Address noise that differs between sites for the same venue
+_VENUE_STOPWORDS = frozenset(
+    {
+        "алматы", "almaty", "г", "город", "ул", "улица", "пр", "проспект",
+        "мкр", "д", "дом", "казахстан", "kazakhstan", "рк",
+    }
+)
+
+
+def _normalize(text: str) -> str:
+    text = text.lower().replace("ё", "е")
+    return _SPACE_RE.sub(" ", _PUNCT_RE.sub(" ", text)).strip()
+
+
+def normalize_title(title: str) -> str:
+    return _normalize(title)
+
+
+def normalize_venue(address: str) -> str:
+    """Venue key of an address; "" when only the city is known."""
+    return " ".join(
+        word for word in _normalize(address).split() if word not in _VENUE_STOPWORDS
+    )
+
+
+def similarity(a: str, b: str, threshold: float = 0.0) -> float:
+    """
+    Ratio of matching characters of two normalized titles (0..1).
+    Cheap upper bounds are checked first, so clearly different titles
+    cost almost nothing; anything below ``threshold`` returns 0.0.
+    """
+    if a == b:
+        return 1.0
+    matcher = SequenceMatcher(None, a, b, autojunk=False)
+    if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+        return 0.0
+    ratio = matcher.ratio()
+    return ratio if ratio >= threshold else 0.0
+
+
+@dataclass
+class Candidate:
+    id: int
+    date: date
+    venue: str
+    title: str
+
+    @classmethod
+    def from_row(cls, id: int, event_date: date, address: str, artist: str) -> "Candidate":
+        return cls(id, event_date, normalize_venue(address), normalize_title(artist))
+
+
+def find_duplicates(
+    candidates: Iterable[Candidate],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> tuple[dict[int, int], int]:
+    """
+    Cluster candidates; returns ({duplicate_id: canonical_id}, comparisons).
+
+    Within a (date, venue) block, events are visited oldest first and
+    each joins the first canonical event whose title is similar enough,
+    otherwise it becomes a canonical event itself. Events without a
+    venue are never merged: "somewhere in the city" is not a place.
+    """
+    blocks: dict[tuple[date, str], list[Candidate]] = {}
+    for candidate in sorted(candidates, key=lambda c: c.id):
+        if not candidate.venue:
+            continue
+        blocks.setdefault((candidate.date, candidate.venue), []).append(candidate)
+
+    duplicates: dict[int, int] = {}
+    comparisons = 0
+    for block in blocks.values():
+        canonicals: list[Candidate] = []
+        for candidate in block:
+            for canonical in canonicals:
+                comparisons += 1
+                if similarity(candidate.title, canonical.title, threshold):
+                    duplicates[candidate.id] = canonical.id
+                    break
+            else:
+                canonicals.append(candidate)
+    return duplicates, comparisons
+
+
+def candidates_on(dates: Iterable[date]) -> list[Candidate]:
+    """Canonical (not yet merged) events on the given dates."""
+    return [
+        Candidate.from_row(*row)
+        for row in Event.objects.filter(
+            date__in=set(dates), duplicate_of__isnull=True
+        ).values_list("id", "date", "address", "artist")
+    ]
+
+
+def merge(duplicates: dict[int, int]) -> int:
+    """Point duplicates at their canonical events and move calendar entries."""
+    if not duplicates:
+        return 0
+
+    by_canonical: dict[int, list[int]] = {}
+    for duplicate_id, canonical_id in duplicates.items():
+        by_canonical.setdefault(canonical_id, []).append(duplicate_id)
+
+    with transaction.atomic():
+        for canonical_id, duplicate_ids in by_canonical.items():
+            Event.all_objects.filter(id__in=duplicate_ids).update(duplicate_of_id=canonical_id)
+            # Duplicates merged earlier follow their event to the new canonical one
+            Event.all_objects.filter(duplicate_of_id__in=duplicate_ids).update(
+                duplicate_of_id=canonical_id
+            )
+
+            # A user with entries for several keeps the first one moved
+            # (the canonical event's own entry wins)
+            users = CalendarEvent.objects.filter(event_id=canonical_id).values("user_id")
+            for duplicate_id in duplicate_ids:
+                CalendarEvent.objects.filter(event_id=duplicate_id).exclude(
+                    user_id__in=users
+                ).update(event_id=canonical_id)
+            CalendarEvent.objects.filter(event_id__in=duplicate_ids).delete()
+
+    return len(duplicates)
+
+
+def dedupe_events(event_ids: Iterable[int], threshold: float = DEFAULT_THRESHOLD) -> int:
+    """
+    Merge the given (freshly written) events with existing ones on the
+    same dates. Returns the number of events marked as duplicates.
+    """
+    dates = Event.objects.filter(
+        id__in=list(event_ids), duplicate_of__isnull=True
+    ).values_list("date", flat=True)
+    duplicates, _ = find_duplicates(candidates_on(dates), threshold)
+    return merge(duplicates)
@@ -0,0 +1,457 @@
+# -*- coding: utf-8 -*-
+"""
+Single-pass field extraction for event detail pages.
+
+Structured data (JSON-LD ``Event`` objects, ``og:`` / ``event:`` meta tags)
+is read first from a partial parse of ``<head>``, ``<script>`` and ``<h1>``
+tags.
+Only when fields are missing is the whole document parsed; its text is
+then collected once and matched against precompiled patterns, with all
+Russian month names sharing one alternation.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, replace
+from datetime import date, datetime, time as dtime
+from typing import Any, Iterator, Optional
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, SoupStrainer
+from django.utils import timezone
+
+MONTHS_RU: dict[str, int] = {
+    "января": 1, "февраля": 2, "марта": 3, "апреля": 4,
+    "мая": 5, "июня": 6, "июля": 7, "августа": 8,
+    "сентября": 9, "октября": 10, "ноября": 11, "декабря": 12,
+    "январь": 1, "февраль": 2, "март": 3, "апрель": 4,
+    "май": 5, "июнь": 6, "июль": 7, "август": 8,
+    "сентябрь": 9, "октябрь": 10, "ноябрь": 11, "декабрь": 12,
+}
+
+# Earlier month names win over later ones, regardless of position in text
+_MONTH_PRIORITY = {name: index for index, name in enumerate(MONTHS_RU)}
+
+# Month names that also match as a prefix of a longer one ("март" in "марта")
+_MONTH_PREFIXES = {
+    name: prefix
+    for name in MONTHS_RU
+    for prefix in MONTHS_RU
+    if prefix != name and name.startswith(prefix)
+}
+
+# Zero-width lookahead so matches of different month names may overlap
+# (e.g. "2026 июня" inside "1 сентября 2026 июня"); longest names first
+# so "марта" is preferred over its prefix "март"
+_MONTH_DATE_RE = re.compile(
+    r"(?=(\d{1,2})\s+("
+    + "|".join(re.escape(name) for name in sorted(MONTHS_RU, key=len, reverse=True))
+    + r")(?:\s+(\d{4}))?)",
+    re.IGNORECASE,
+)
+_NUMERIC_DATE_RE = re.compile(r"\b(\d{1,2})\.(\d{1,2})(?:\.(\d{4}))?\b")
+
+_LABELLED_TIME_RE = re.compile(r"(?:в|начало|время|старт)\s*:?\s*(\d{1,2})[:\.](\d{2})")
+_ANY_TIME_RE = re.compile(r"\b(\d{1,2})[:\.](\d{2})\b")
+
+_COST_RES = [
+    re.compile(
+        r"(?:от|from|цена|стоимость|price)\s*:?\s*([\d\s]+)\s*(?:₸|тг|тенге|KZT|kzt)",
+        re.IGNORECASE,
+    ),
+    re.compile(r"([\d\s]+)\s*(?:₸|тг|тенге|KZT|kzt)", re.IGNORECASE),
+    re.compile(r"(?:от|from)\s+([\d\s]+)\b", re.IGNORECASE),
+]
+
+_ADDRESS_RES = [
+    re.compile(r"(?:Место|Адрес|Площадка|Venue|Орын)\s*:?\s*(.+?)(?:\n|$)", re.IGNORECASE),
+    re.compile(r"(?:ул\.|пр\.|проспект|улица|Достык|Гоголя)[^,\n]{3,60}", re.IGNORECASE),
+]
+
+# <h1> too: the title always follows extract_title()'s rules, whichever
+# path a page takes, so titles of stored events never change
+_STRUCTURED_STRAINER = SoupStrainer(["head", "script", "h1"])
+
+# Markers of structured data able to carry an event's date
+_STRUCTURED_MARKERS = ("application/ld+json", "event:start_time")
+
+# Fields that make a full-document parse unnecessary when all are present
+STRUCTURED_FIELDS = ("image", "date", "start_time", "cost", "address")
+
+_TITLE_SITE_SUFFIX_RE = re.compile(r"\s*\|\s*Давай Сходим!?\s*$")
+_TITLE_TICKETS_SUFFIX_RE = re.compile(r"\s*-\s*купить билеты.*$")
+
+
+@dataclass(frozen=True)
+class EventDetails:
+    """Fields extracted from an event detail page."""
+
+    title: str
+    image: str
+    date: Optional[date]
+    start_time: Optional[dtime]
+    cost: int
+    address: str
+    description: str
+
+
+def extract_event_page(html: str, base_url: str) -> EventDetails:
+    """
+    Extract every event field from a detail page's HTML.
+    Structured data wins for the fields it carries (STRUCTURED_FIELDS);
+    text heuristics only fill in missing ones.
+    """
+    if any(marker in html for marker in _STRUCTURED_MARKERS):
+        head = BeautifulSoup(html, "lxml", parse_only=_STRUCTURED_STRAINER)
+        structured = extract_structured_data(head, base_url)
+        if all(field in structured for field in STRUCTURED_FIELDS):
+            return EventDetails(
+                title=extract_title(head),
+                description=extract_description(head),
+                **structured,
+            )
+        soup = BeautifulSoup(html, "lxml")
+    else:
+        # Meta tags alone never cover date and time: skip the partial parse
+        soup = BeautifulSoup(html, "lxml")
+        structured = extract_structured_data(soup, base_url)
+
+    return replace(extract_event_details(soup, base_url), **structured)
+
+
+def extract_event_details(soup: BeautifulSoup, base_url: str) -> EventDetails:
+    """Extract every event field from a parsed detail page."""
+    strings = list(soup.stripped_strings)
+    text = " ".join(strings)
+    lines = "\n".join(strings)
+
+    return EventDetails(
+        title=extract_title(soup),
+        image=extract_image(soup, base_url),
+        date=extract_date(text),
+        start_time=extract_time(text),
+        cost=extract_cost(text),
+        address=extract_address(lines),
+        description=extract_description(soup),
+    )
+
+
+# ----------------------------------------------------------------------
+# Structured data
+# ----------------------------------------------------------------------
+
+def extract_structured_data(soup: BeautifulSoup, base_url: str) -> dict[str, Any]:
+    """
+    Read STRUCTURED_FIELDS from JSON-LD and og:/event: meta tags.
+    Returns only the fields that were found.
+    """
+    found: dict[str, Any] = {}
+
+    event = next(_iter_ld_events(soup), None)
+    if event is not None:
+        found.update(_fields_from_ld_event(event, base_url))
+
+    meta = {
+        tag.get("property") or tag.get("name"): tag["content"].strip()
+        for tag in soup.find_all("meta", content=True)
+        if tag.get("property") or tag.get("name")
+    }
+
+    if "image" not in found and meta.get("og:image"):
+        found["image"] = urljoin(base_url, meta["og:image"])
+    if "date" not in found and meta.get("event:start_time"):
+        found.update(_parse_start(meta["event:start_time"]))
+    if "cost" not in found:
+        for key in ("event:price", "og:price:amount", "product:price:amount"):
+            price = _parse_price(meta.get(key))
+            if price is not None:
+                found["cost"] = price
+                break
+    if "address" not in found and meta.get("event:location"):
+        found["address"] = meta["event:location"][:200]
+
+    return found
+
+
+def _iter_ld_events(soup: BeautifulSoup) -> Iterator[dict[str, Any]]:
+    """Yield schema.org Event objects from all JSON-LD scripts."""
+    for script in soup.find_all("script", type="application/ld+json"):
+        try:
+            data = json.loads(script.string or "")
+        except ValueError:
+            continue
+
+        stack = [data]
+        while stack:
+            node = stack.pop(0)
+            if isinstance(node, list):
+                stack.extend(node)
+            elif isinstance(node, dict):
+                types = node.get("@type", "")
+                types = types if isinstance(types, list) else [types]
+                if any(isinstance(t, str) and t.endswith("Event") for t in types):
+                    yield node
+                elif "@graph" in node:
+                    stack.append(node["@graph"])
+
+
+def _fields_from_ld_event(event: dict[str, Any], base_url: str) -> dict[str, Any]:
+    found: dict[str, Any] = {}
+
+    image = event.get("image")
+    if isinstance(image, list):
+        image = image[0] if image else None
+    if isinstance(image, dict):
+        image = image.get("url")
+    if isinstance(image, str) and image.strip():
+        found["image"] = urljoin(base_url, image.strip())
+
+    if isinstance(event.get("startDate"), str):
+        found.update(_parse_start(event["startDate"]))
+
+    offers = event.get("offers")
+    offers = offers if isinstance(offers, list) else [offers]
+    prices = [
+        price
+        for offer in offers
+        if isinstance(offer, dict)
+        for price in (_parse_price(offer.get("price")), _parse_price(offer.get("lowPrice")))
+        if price is not None
+    ]
+    if prices:
+        found["cost"] = min(prices)
+    elif event.get("isAccessibleForFree") in (True, "true", "True"):
+        found["cost"] = 0
+
+    location = event.get("location")
+    if isinstance(location, list):
+        location = location[0] if location else None
+    address = _format_location(location)
+    if address:
+        found["address"] = address[:200]
+
+    return found
+
+
+def _parse_start(value: str) -> dict[str, Any]:
+    """
+    Split an ISO 8601 start into date and (if given) wall-clock time.
+    A start with ``Z`` or an offset is converted to TIME_ZONE first.
+    """
+    value = value.strip()
+    try:
+        if "T" in value:
+            start = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            if timezone.is_aware(start):
+                start = timezone.localtime(start)
+            return {"date": start.date(), "start_time": start.time().replace(tzinfo=None)}
+        return {"date": date.fromisoformat(value[:10])}
+    except ValueError:
+        return {}
+
+
+def _parse_price(value: Any) -> Optional[int]:
+    if isinstance(value, (int, float)):
+        price = value
+    elif isinstance(value, str):
+        try:
+            price = float(value.replace(" ", "").replace(",", "."))
+        except ValueError:
+            return None
+    else:
+        return None
+    return int(price) if 0 <= price <= 500000 else None
+
+
+def _format_location(location: Any) -> str:
+    """Render a schema.org Place as "Venue, street address"."""
+    if isinstance(location, str):
+        return location.strip()
+    if not isinstance(location, dict):
+        return ""
+
+    address = location.get("address")
+    if isinstance(address, dict):
+        address = address.get("streetAddress") or address.get("name")
+
+    parts = [
+        part.strip()
+        for part in (location.get("name"), address)
+        if isinstance(part, str) and part.strip()
+    ]
+    return ", ".join(dict.fromkeys(parts))
+
+
+# ----------------------------------------------------------------------
+# Text heuristics
+# ----------------------------------------------------------------------
+
+def extract_title(soup: BeautifulSoup) -> str:
+    """Extract event title from the page."""
+    h1 = soup.find("h1")
+    if h1:
+        text = h1.get_text(strip=True)
+        if text:
+            return text
+
+    og_title = soup.find("meta", property="og:title")
+    if og_title and og_title.get("content"):
+        return og_title["content"].strip()
+
+    title_tag = soup.find("title")
+    if title_tag:
+        text = title_tag.get_text(strip=True)
+        text = _TITLE_SITE_SUFFIX_RE.sub("", text)
+        text = _TITLE_TICKETS_SUFFIX_RE.sub("", text)
+        if text:
+            return text.strip()
+
+    return ""
+
+
+def extract_image(soup: BeautifulSoup, base_url: str) -> str:
+    """Extract the main event image URL."""
+    og_img = soup.find("meta", property="og:image")
+    if og_img and og_img.get("content"):
+        return og_img["content"]
+
+    for img in soup.find_all("img"):
+        src = img.get("src", "") or img.get("data-src", "")
+        if src and ("uploads/posts" in src or "optimized" in src):
+            if not src.startswith("http"):
+                src = f"{base_url}{src}"
+            return src
+
+    return ""
+
+
+def extract_date(text: str) -> Optional[date]:
+    """Extract event date from the page text."""
+    today = timezone.localdate()
+
+    # Pattern: "20 февраля" or "20 февраля 2026"
+    best: Optional[tuple[int, date]] = None
+    matched_words: set[int] = set()
+    consumed: dict[str, int] = {}  # month name -> end of its previous match
+    for match in _MONTH_DATE_RE.finditer(text):
+        # Only the leftmost match ending in a given month word counts
+        if match.start(2) in matched_words:
+            continue
+        matched_words.add(match.start(2))
+
+        word = match.group(2).lower()
+        options = [(word, match.group(3))]
+        if word in _MONTH_PREFIXES:
+            options.append((_MONTH_PREFIXES[word], None))
+
+        for name, year_str in options:
+            # Matches of the same month name never overlap
+            if match.start() < consumed.get(name, 0):
+                continue
+            consumed[name] = match.end(3) if year_str else match.start(2) + len(name)
+
+            priority = _MONTH_PRIORITY[name]
+            if best is not None and priority >= best[0]:
+                continue
+            candidate = _build_date(match.group(1), MONTHS_RU[name], year_str, today)
+            if candidate is not None:
+                best = (priority, candidate)
+    if best is not None:
+        return best[1]
+
+    # Pattern: DD.MM.YYYY or DD.MM
+    match = _NUMERIC_DATE_RE.search(text)
+    if match:
+        return _build_date(match.group(1), int(match.group(2)), match.group(3), today)
+
+    return None
+
+
+def _build_date(
+    day_str: str,
+    month: int,
+    year_str: Optional[str],
+    today: date,
+) -> Optional[date]:
+    """Build a date; without an explicit year, past dates roll into next year."""
+    day = int(day_str)
+    year = int(year_str) if year_str else today.year
+    try:
+        candidate = date(year, month, day)
+    except ValueError:
+        return None
+
+    # If year is omitted and parsed date is too far in the past,
+    # assume next year for seasonal listings around year boundaries.
+    if year_str is None and candidate < today:
+        try:
+            candidate = date(today.year + 1, month, day)
+        except ValueError:
+            pass
+
+    return candidate
+
+
+def extract_time(text: str) -> Optional[dtime]:
+    """Extract event start time from the page text."""
+    match = _LABELLED_TIME_RE.search(text)
+    if match:
+        hour = int(match.group(1))
+        minute = int(match.group(2))
+        if 0 <= hour < 24 and 0 <= minute < 60:
+            return dtime(hour, minute)
+
+    for match in _ANY_TIME_RE.finditer(text):
+        h, m = int(match.group(1)), int(match.group(2))
+        if 10 <= h <= 23 and 0 <= m < 60:
+            return dtime(h, m)
+
+    return None
+
+
+def extract_cost(text: str) -> int:
+    """Extract ticket price from the page text."""
+    for pattern in _COST_RES:
+        match = pattern.search(text)
+        if match:
+            price_str = match.group(1).replace(" ", "").strip()
+            try:
+                price = int(price_str)
+                if 100 <= price <= 500000:
+                    return price
+            except ValueError:
+                continue
+
+    return 0
+
+
+def extract_address(lines: str) -> str:
+    """Extract venue / address from the newline-joined page text."""
+    for pattern in _ADDRESS_RES:
+        match = pattern.search(lines)
+        if match:
+            addr = match.group(1) if match.lastindex else match.group(0)
+            addr = addr.strip()
+            if len(addr) > 5:
+                return addr[:200]
+
+    return ""
+
+
+def extract_description(soup: BeautifulSoup) -> str:
+    """Extract event description from the page meta tags."""
+    og_desc = soup.find("meta", property="og:description")
+    if og_desc and og_desc.get("content"):
+        desc = og_desc["content"].strip()
+        if len(desc) > 20:
+            return desc
+
+    meta_desc = soup.find("meta", attrs={"name": "description"})
+    if meta_desc and meta_desc.get("content"):
+        desc = meta_desc["content"].strip()
+        if len(desc) > 20:
+            return desc
+
+    return ""
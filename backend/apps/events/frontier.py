@@ -0,0 +1,191 @@
+"""
+DB-backed crawl frontier shared by fetch_events workers.
+
+Workers claim batches of pending URLs under a time-limited lease. A claim
+is one UPDATE statement whose WHERE clause re-checks claimability, so two
+processes can never lease the same row: SQLite serialises writers, and on
+PostgreSQL a concurrent claim re-evaluates the condition on the locked
+row and skips it. Leases of crashed workers simply expire. A URL that
+failed stays leased to nobody for a back-off delay before it is retried.
+"""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import Iterable, Optional
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from apps.events.models import CrawlURL
+
+# Delay before a failed URL is retried, doubled on every further attempt
+RETRY_BACKOFF_SECONDS = 30
+MAX_RETRY_BACKOFF_SECONDS = 30 * 60
+
+
+def _claimable(now) -> Q:
+    return Q(state=CrawlURL.State.PENDING) | Q(
+        state=CrawlURL.State.LEASED,
+        lease_expires_at__lt=now,
+    )
+
+
+def seed(urls: Iterable[tuple[str, str, int]]) -> int:
+    """
+    Start a new crawl from (source, listing_url, category) triples.
+    Finished rows of the previous crawl are dropped; returns the number enqueued.
+    """
+    with transaction.atomic():
+        CrawlURL.objects.filter(
+            state__in=[CrawlURL.State.DONE, CrawlURL.State.FAILED]
+        ).delete()
+        return sum(
+            enqueue(source, [url], CrawlURL.Kind.LISTING, category)
+            for source, url, category in urls
+        )
+
+
+def enqueue(
+    source: str,
+    urls: Iterable[str],
+    kind: int,
+    category: int,
+    page: int = 1,
+) -> int:
+    """Add URLs not yet in the frontier; returns how many were new."""
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return 0
+
+    existing = set(
+        CrawlURL.objects.filter(url__in=urls).values_list("url", flat=True)
+    )
+    new = [
+        CrawlURL(url=url, source=source, kind=kind, category=category, page=page)
+        for url in urls
+        if url not in existing
+    ]
+    CrawlURL.objects.bulk_create(new, ignore_conflicts=True)
+    return len(new)
+
+
+def _of_sources(sources: Optional[list[str]]) -> Q:
+    return Q(source__in=sources) if sources is not None else Q()
+
+
+def claim(
+    owner: str,
+    limit: int,
+    lease_seconds: int,
+    sources: Optional[list[str]] = None,
+) -> list[CrawlURL]:
+    """Atomically lease up to `limit` pending (or expired) URLs to `owner`."""
+    now = timezone.now()
+    expires_at = now + timedelta(seconds=lease_seconds)
+
+    candidates = (
+        CrawlURL.objects.filter(_claimable(now), _of_sources(sources))
+        .order_by("id")
+        .values("id")[:limit]
+    )
+    with transaction.atomic():
+        CrawlURL.objects.filter(_claimable(now), id__in=candidates).update(
+            state=CrawlURL.State.LEASED,
+            lease_owner=owner,
+            lease_expires_at=expires_at,
+            attempts=F("attempts") + 1,
+        )
+
+    return list(
+        CrawlURL.objects.filter(
+            state=CrawlURL.State.LEASED,
+            lease_owner=owner,
+            lease_expires_at=expires_at,
+        ).order_by("id")
+    )
+
+
+def has_leased(sources: Optional[list[str]] = None) -> bool:
+    """Whether any worker still holds (possibly expired) leases."""
+    return CrawlURL.objects.filter(
+        _of_sources(sources), state=CrawlURL.State.LEASED
+    ).exists()
+
+
+def renew(owner: str, ids: list[int], lease_seconds: int) -> int:
+    """Extend the owner's leases on the given rows."""
+    return CrawlURL.objects.filter(
+        id__in=ids,
+        state=CrawlURL.State.LEASED,
+        lease_owner=owner,
+    ).update(lease_expires_at=timezone.now() + timedelta(seconds=lease_seconds))
+
+
+def complete(owner: str, ids: list[int]) -> int:
+    """Mark leased rows as fetched."""
+    now = timezone.now()
+    return CrawlURL.objects.filter(
+        id__in=ids,
+        state=CrawlURL.State.LEASED,
+        lease_owner=owner,
+    ).update(
+        state=CrawlURL.State.DONE,
+        lease_expires_at=None,
+        last_fetched_at=now,
+    )
+
+
+def retry_delay(attempts: int, backoff_seconds: float = RETRY_BACKOFF_SECONDS) -> timedelta:
+    """Back-off before the next attempt at a URL that failed ``attempts`` times."""
+    return timedelta(
+        seconds=min(backoff_seconds * 2 ** max(attempts - 1, 0), MAX_RETRY_BACKOFF_SECONDS)
+    )
+
+
+def fail(
+    owner: str,
+    ids: list[int],
+    max_attempts: int,
+    backoff_seconds: float = RETRY_BACKOFF_SECONDS,
+) -> int:
+    """
+    Give up on rows after max_attempts; lease the others to nobody until
+    their back-off delay has passed, so they are retried later rather than
+    at once. Returns the number of rows that will be retried.
+    """
+    leased = CrawlURL.objects.filter(
+        id__in=ids,
+        state=CrawlURL.State.LEASED,
+        lease_owner=owner,
+    )
+    now = timezone.now()
+    with transaction.atomic():
+        leased.filter(attempts__gte=max_attempts).update(
+            state=CrawlURL.State.FAILED,
+            lease_expires_at=None,
+            last_fetched_at=now,
+        )
+        retried = 0
+        for attempts in set(leased.values_list("attempts", flat=True)):
+            retried += leased.filter(attempts=attempts).update(
+                lease_owner="",
+                lease_expires_at=now + retry_delay(attempts, backoff_seconds),
+                last_fetched_at=now,
+            )
+    return retried
+
+
+def release(owner: str, ids: list[int]) -> int:
+    """Hand unprocessed rows back without counting the attempt."""
+    return CrawlURL.objects.filter(
+        id__in=ids,
+        state=CrawlURL.State.LEASED,
+        lease_owner=owner,
+    ).update(
+        state=CrawlURL.State.PENDING,
+        lease_owner="",
+        lease_expires_at=None,
+        attempts=F("attempts") - 1,
+    )
@@ -0,0 +1,102 @@
+"""
+Caching proxy for remote event images.
+
+Until a poster is mirrored (see apps.events.posters), clients would load
+``Event.image`` straight from the ticketing site. The proxy fetches each
+remote image once, resizes it to one of IMAGE_PROXY_WIDTHS as WebP on
+demand and keeps both in a size-bounded on-disk LRU cache shared by all
+workers. Concurrent misses for the same image are coalesced, so a burst
+of requests costs one upstream download and one resize.
+
+Only images on IMAGE_PROXY_ALLOWED_HOSTS are fetched, and redirects are
+not followed: ``Event.image`` comes from scraped pages, and the proxy
+must not be usable to reach internal addresses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from functools import lru_cache
+from typing import BinaryIO, Callable
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.urls import reverse
+
+from apps.abstracts.diskcache import DiskLRUCache
+from apps.abstracts.http import HttpClient, RetryPolicy
+from apps.abstracts.images import load_image, webp_variants
+from apps.events.posters import download
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; AlmatourImageProxy/1.0)",
+    "Accept": "image/avif,image/webp,image/*;q=0.8",
+}
+
+
+@lru_cache(maxsize=None)
+def get_cache() -> DiskLRUCache:
+    return DiskLRUCache(settings.IMAGE_PROXY_CACHE_DIR, settings.IMAGE_PROXY_CACHE_BYTES)
+
+
+@lru_cache(maxsize=None)
+def get_client() -> HttpClient:
+    # Short timeout and a single retry: a client is waiting on the response
+    return HttpClient(headers=HEADERS, timeout=10.0, retry=RetryPolicy(max_retries=1))
+
+
+def image_version(url: str) -> str:
+    """Short hash of the remote URL, so a new poster gets a new proxy URL."""
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()[:12]
+
+
+def proxy_url(event_id: int, url: str, width: int) -> str:
+    path = reverse("event-image", kwargs={"pk": event_id})
+    return f"{path}?w={width}&v={image_version(url)}"
+
+
+def is_proxyable(url: str) -> bool:
+    """Whether ``url`` is an http(s) URL on one of IMAGE_PROXY_ALLOWED_HOSTS."""
+    try:
+        parts = urlsplit(url)
+        host = (parts.hostname or "").lower()
+    except ValueError:
+        return False
+    if parts.scheme not in ("http", "https") or not host:
+        return False
+    return any(
+        host == allowed or host.endswith(f".{allowed}")
+        for allowed in settings.IMAGE_PROXY_ALLOWED_HOSTS
+    )
+
+
+def _open_cached(cache: DiskLRUCache, key: str, produce: Callable[[], bytes]) -> BinaryIO:
+    # Another worker may evict the file between get_or_create() and open();
+    # the second get_or_create() then produces it again. An open handle
+    # keeps working after eviction.
+    try:
+        return open(cache.get_or_create(key, produce), "rb")
+    except FileNotFoundError:
+        return open(cache.get_or_create(key, produce), "rb")
+
+
+def open_resized_image(url: str, width: int) -> BinaryIO:
+    """
+    The cached WebP rendition of a remote image at ``width`` (or at its own
+    width if it is narrower), opened for reading. Raises ValueError for
+    URLs that may not be proxied and for non-images, requests exceptions
+    when the upstream fetch fails.
+    """
+    if not is_proxyable(url):
+        raise ValueError(f"Image host not allowed: {url!r}")
+    cache = get_cache()
+
+    def fetch_original() -> bytes:
+        return download(get_client(), url, allow_redirects=False)
+
+    def resize() -> bytes:
+        with _open_cached(cache, f"original {url}", fetch_original) as fh:
+            image = load_image(fh.read())
+        return next(iter(webp_variants(image, [width]).values()))
+
+    return _open_cached(cache, f"w{width} {url}", resize)
@@ -0,0 +1,273 @@
+"""
+Shared ingestion engine: crawls several event sources concurrently.
+
+Each source gets its own rate-limited HttpClient and runs in its own
+thread, so a slow or failing site never holds the others back. Threads
+only do HTTP and parsing; results reach the caller's thread through a
+bounded queue, and all database writes stay there (SQLite allows one
+writer at a time anyway).
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional, Union
+
+import requests
+from bs4 import BeautifulSoup
+
+from apps.abstracts.archive import HttpArchive
+from apps.abstracts.http import CircuitOpenError, HttpClient
+from apps.events.metrics import CrawlMetrics
+from apps.events.sources import EventSource
+
+
+class SourceClient:
+    """
+    A source with its own HttpClient, metrics and scrape counters.
+    Progress messages go to ``log``, fetch and parse errors to ``warn``.
+    """
+
+    def __init__(
+        self,
+        source: EventSource,
+        client: HttpClient,
+        log: Callable[[str], Any] = print,
+        warn: Optional[Callable[[str], Any]] = None,
+    ) -> None:
+        self.source = source
+        self.client = client
+        self.log = log
+        self.warn = warn or log
+        # Set when the client's session records to or replays from an archive
+        self.archive: Optional[HttpArchive] = None
+        self.metrics = CrawlMetrics()
+        self.scraped = 0
+        self.failed = 0
+        self.aborted = False
+
+    def fetch_html(self, url: str) -> Optional[str]:
+        """Fetch a page and return its HTML, or None on error."""
+        started = time.perf_counter()
+        try:
+            resp = self.client.get(url)
+        except CircuitOpenError:
+            raise
+        except requests.RequestException as e:
+            # Retries exhausted on 429/5xx still carry the last response
+            self._record_fetch(time.perf_counter() - started, e.response)
+            self.warn(f"    HTTP error fetching {url}: {e}")
+            return None
+
+        self._record_fetch(time.perf_counter() - started, resp)
+        try:
+            resp.raise_for_status()
+        except requests.HTTPError as e:
+            self.warn(f"    HTTP error fetching {url}: {e}")
+            return None
+        return resp.text
+
+    def _record_fetch(self, seconds: float, resp: Optional[requests.Response]) -> None:
+        if resp is None:
+            self.metrics.record_fetch(seconds, None, 0)
+        else:
+            self.metrics.record_fetch(seconds, resp.status_code, len(resp.content))
+
+    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+        """Fetch a page and return parsed BeautifulSoup, or None on error."""
+        html = self.fetch_html(url)
+        if html is None:
+            return None
+
+        started = time.perf_counter()
+        soup = BeautifulSoup(html, "lxml")
+        self.metrics.parse_seconds += time.perf_counter() - started
+        return soup
+
+    def scrape_event(self, url: str, category: int) -> Optional[dict[str, Any]]:
+        """Fetch and parse an event detail page; None if that failed."""
+        try:
+            html = self.fetch_html(url)
+            if html is not None:
+                started = time.perf_counter()
+                try:
+                    data = self.source.parse_event(html, url, category)
+                finally:
+                    self.metrics.parse_seconds += time.perf_counter() - started
+                if data is None:
+                    self.warn(f"    No event found on {url}")
+                else:
+                    self.scraped += 1
+                    return data
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            self.warn(f"  Error processing {url}: {e}")
+
+        self.failed += 1
+        return None
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self.metrics.summary(),
+            "scraped": self.scraped,
+            "failed": self.failed,
+            "aborted": self.aborted,
+        }
+
+
+@dataclass
+class ScrapedEvent:
+    """An event page of a source; data is None if it could not be scraped."""
+
+    source: str
+    url: str
+    category: int
+    data: Optional[dict[str, Any]]
+
+
+@dataclass
+class ListingDone:
+    """All of a listing's event pages have been handed over."""
+
+    source: str
+    url: str
+
+
+@dataclass
+class SourceFinished:
+    """A source thread ended; error is set if it was aborted."""
+
+    source: str
+    error: Optional[Exception] = None
+
+
+IngestItem = Union[ScrapedEvent, ListingDone, SourceFinished]
+
+
+class IngestionEngine:
+    """
+    Crawl sources concurrently and yield their results in arrival order.
+
+    Links in ``seen`` are skipped, listings in ``listings_done`` are not
+    walked again and ``pending`` links (per source name) are scraped
+    first; together they let an interrupted run resume. Every event
+    link is scraped once even if several listings or sources show it.
+    """
+
+    def __init__(
+        self,
+        clients: list[SourceClient],
+        max_pages: int,
+        pending: Optional[dict[str, list[tuple[str, int]]]] = None,
+        seen: Optional[set[str]] = None,
+        listings_done: Optional[set[str]] = None,
+        queue_size: int = 16,
+    ) -> None:
+        self.clients = clients
+        self.max_pages = max_pages
+        self.pending = pending or {}
+        self.seen = set(seen or ())
+        self.listings_done = set(listings_done or ())
+        self._queue: queue.Queue[IngestItem] = queue.Queue(maxsize=queue_size)
+        self._seen_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def run(self) -> Iterator[IngestItem]:
+        """Start one thread per source; stops them when the caller stops iterating."""
+        threads = [
+            threading.Thread(
+                target=self._crawl,
+                args=(source_client,),
+                name=f"ingest-{source_client.source.name}",
+                daemon=True,
+            )
+            for source_client in self.clients
+        ]
+        for thread in threads:
+            thread.start()
+
+        running = len(threads)
+        try:
+            while running:
+                item = self._queue.get()
+                if isinstance(item, SourceFinished):
+                    running -= 1
+                yield item
+        finally:
+            self._stop.set()
+            for thread in threads:
+                thread.join()
+
+    def _put(self, item: IngestItem) -> bool:
+        """Hand an item to the consumer; False once the engine is stopping."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _claim_link(self, link: str) -> bool:
+        with self._seen_lock:
+            if link in self.seen:
+                return False
+            self.seen.add(link)
+            return True
+
+    def _crawl(self, source_client: SourceClient) -> None:
+        source = source_client.source
+        error: Optional[Exception] = None
+        try:
+            for url, category in self.pending.get(source.name, []):
+                if self._stop.is_set():
+                    return
+                data = source_client.scrape_event(url, category)
+                if not self._put(ScrapedEvent(source.name, url, category, data)):
+                    return
+
+            for listing_url, category in source.listings():
+                if self._stop.is_set():
+                    return
+                if listing_url in self.listings_done:
+                    continue
+                if not self._walk_listing(source_client, listing_url, category):
+                    return
+        except CircuitOpenError as e:
+            # The site is down: stop this source instead of waiting out every URL
+            source_client.aborted = True
+            error = e
+        finally:
+            self._put(SourceFinished(source.name, error))
+
+    def _walk_listing(self, source_client: SourceClient, listing_url: str, category: int) -> bool:
+        """
+        Scrape a listing's new event pages; False once the engine is stopping.
+        The listing only counts as done if its pagination ended normally,
+        so one that failed partway is crawled again on resume.
+        """
+        source = source_client.source
+        source_client.log(f"  Scraping listing: {listing_url}")
+        found = 0
+        try:
+            for link in source.iter_listing(source_client.fetch_page, listing_url, self.max_pages):
+                if self._stop.is_set():
+                    return False
+                found += 1
+                if not self._claim_link(link):
+                    continue
+                data = source_client.scrape_event(link, category)
+                if not self._put(ScrapedEvent(source.name, link, category, data)):
+                    return False
+        except CircuitOpenError:
+            raise
+        except Exception as e:
+            source_client.warn(f"    Error scraping listing {listing_url}: {e}")
+            return not self._stop.is_set()
+
+        source_client.log(f"    Found {found} event links in {listing_url}")
+        return self._put(ListingDone(source.name, listing_url))
@@ -0,0 +1,48 @@
+"""
+Periodic event jobs run by ``python manage.py run_scheduler``.
+"""
+
+from datetime import date
+
+from django.core.management import call_command
+from django.utils import timezone
+
+from apps.abstracts.scheduler import register
+from apps.events.models import Event
+from apps.events.serializers import EventSerializer
+from apps.events.views import EventPagination, listed_events
+
+# A crawl may use most of its lease; the rest is left for the final flush
+CRAWL_LEASE_SECONDS = 3 * 60 * 60
+CRAWL_MAX_RUNTIME = CRAWL_LEASE_SECONDS - 10 * 60
+
+
+def deactivate_past_events(today: date) -> int:
+    """Soft-delete events dated before ``today``; returns how many were marked."""
+    return Event.objects.filter(date__lt=today).soft_delete()
+
+
+@register("crawl_events", interval=6 * 60 * 60, jitter=10 * 60, lease_seconds=CRAWL_LEASE_SECONDS)
+def crawl_events() -> None:
+    # An unfinished crawl continues from its checkpoint on the next run
+    call_command("fetch_events", future_only=True, resume=True, max_runtime=CRAWL_MAX_RUNTIME)
+
+
+@register("deactivate_past_events", cron="5 0 * * *", jitter=60, lease_seconds=10 * 60)
+def deactivate_past() -> None:
+    deactivate_past_events(timezone.localdate())
+
+
+@register("archive_events", cron="30 0 * * *", jitter=60, lease_seconds=60 * 60)
+def archive_events() -> None:
+    call_command("archive_events")
+
+
+@register("warm_event_cache", interval=30 * 60, jitter=60, lease_seconds=10 * 60)
+def warm_event_cache() -> None:
+    """Run the first listing page queries so early visitors hit warm DB pages."""
+    events = listed_events()
+    page_size = EventPagination.page_size
+    EventSerializer(events[:page_size], many=True).data
+    for category in Event.Category.values:
+        EventSerializer(events.filter(category=category)[:page_size], many=True).data
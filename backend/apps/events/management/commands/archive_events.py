@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Move events that are more than --older-than days in the past (or were
+soft-deleted that long ago) to the archive tables, together with their
+translations and users' calendar entries. Calendar history stays
+available at /api/v1/events/calendar/history/.
+
+Usage:
+    python manage.py archive_events
+    python manage.py archive_events --older-than 90
+    python manage.py archive_events --dry-run
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.events.archiving import ARCHIVE_CHUNK_SIZE, ArchiveStats, archivable_events, archive_chunk
+
+
+class Command(BaseCommand):
+    help = "Move old past and soft-deleted events to the archive tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            default=settings.EVENT_ARCHIVE_AFTER_DAYS,
+            metavar="DAYS",
+            help=f"Archive events more than DAYS days old (default: {settings.EVENT_ARCHIVE_AFTER_DAYS})",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=ARCHIVE_CHUNK_SIZE,
+            help=f"Events moved per transaction (default: {ARCHIVE_CHUNK_SIZE})",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the events that would be archived",
+        )
+
+    def handle(self, *args: Any, **kwargs: Any) -> None:
+        days = kwargs["older_than"]
+        chunk_size = kwargs["chunk_size"]
+        if days < 0 or chunk_size < 1:
+            raise CommandError("--older-than must be >= 0 and --chunk-size >= 1")
+
+        queryset = archivable_events(days).order_by("id")
+        if kwargs["dry_run"]:
+            self.stdout.write(
+                self.style.WARNING(f"[DRY RUN] Would archive {queryset.count()} events")
+            )
+            return
+
+        started = timezone.now()
+        total = ArchiveStats()
+        while True:
+            # Archived rows leave the live table, so the first chunk is always new
+            ids = list(queryset.values_list("id", flat=True)[:chunk_size])
+            if not ids:
+                break
+            total.add(archive_chunk(ids))
+            self.stdout.write(f"  {total.events} events archived...")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Done! Archived {total.events} events, {total.translations} translations "
+                f"and {total.calendar_entries} calendar entries "
+                f"in {(timezone.now() - started).total_seconds()} sec"
+            )
+        )
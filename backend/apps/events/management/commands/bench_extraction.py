@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+"""
+Microbenchmark for the event detail extraction engine.
+
+Runs the single-pass extractor and the original per-field extractors
+(one get_text() per field, one regex per month name) over every event
+page of a recorded corpus and reports the time spent per page; that
+both return identical results is asserted by the corpus test in
+apps/events/tests/test_extraction.py. The structured-data-first path
+(partial parse of <head>/<script>, full parse only for missing fields)
+is timed from raw HTML against parsing the whole document.
+
+Usage:
+    python manage.py bench_extraction
+    python manage.py bench_extraction --corpus /tmp/sxodim-corpus --repeat 50
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import time
+from datetime import date, time as dtime
+from typing import Any, Optional
+
+from bs4 import BeautifulSoup
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.abstracts.archive import HttpArchive
+from apps.events import extraction
+from apps.events.sources.sxodim import BASE_URL
+
+DEFAULT_CORPUS = os.path.join(
+    os.path.dirname(extraction.__file__), "corpus", "sxodim_sample"
+)
+
+
+class Command(BaseCommand):
+    help = "Benchmark event detail extraction on a recorded corpus"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--corpus",
+            default=DEFAULT_CORPUS,
+            help="Directory recorded with fetch_events --record",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Number of passes over the corpus (default: 20)",
+        )
+
+    def handle(self, *args: Any, **kwargs: Any) -> None:
+        repeat = max(kwargs["repeat"], 1)
+        documents = [
+            entry["body"].decode("utf-8")
+            for entry in HttpArchive(kwargs["corpus"]).entries()
+            if "/event/" in entry["url"]
+        ]
+        pages = [BeautifulSoup(html, "lxml") for html in documents]
+        if not pages:
+            raise CommandError(f"No event pages found in {kwargs['corpus']}")
+
+        new_ms = self._time(lambda soup: extraction.extract_event_details(soup, BASE_URL), pages, repeat)
+        old_ms = self._time(_legacy_extract, pages, repeat)
+        structured_ms = self._time(
+            lambda html: extraction.extract_event_page(html, BASE_URL), documents, repeat
+        )
+        full_ms = self._time(
+            lambda html: extraction.extract_event_details(BeautifulSoup(html, "lxml"), BASE_URL),
+            documents,
+            repeat,
+        )
+
+        self.stdout.write(
+            f"{len(pages)} pages x {repeat} passes\n"
+            f"Extraction from parsed pages:\n"
+            f"  single-pass: {new_ms:.3f} ms/page\n"
+            f"  legacy:      {old_ms:.3f} ms/page ({old_ms / new_ms:.1f}x)\n"
+            f"Parse + extraction from HTML:\n"
+            f"  structured-first: {structured_ms:.3f} ms/page\n"
+            f"  full parse:       {full_ms:.3f} ms/page ({full_ms / structured_ms:.1f}x)"
+        )
+
+    def _time(self, func, pages: list[Any], repeat: int) -> float:
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for page in pages:
+                func(page)
+        return (time.perf_counter() - started) * 1000 / (len(pages) * repeat)
+
+
+# ----------------------------------------------------------------------
+# Reference implementation: the per-field extractors replaced by
+# apps.events.extraction, kept verbatim for timing and for the
+# equivalence test over the corpus.
+# ----------------------------------------------------------------------
+
+def _legacy_extract(soup: BeautifulSoup) -> extraction.EventDetails:
+    return extraction.EventDetails(
+        title=extraction.extract_title(soup),
+        image=extraction.extract_image(soup, BASE_URL),
+        date=_legacy_extract_date(soup),
+        start_time=_legacy_extract_time(soup),
+        cost=_legacy_extract_cost(soup),
+        address=_legacy_extract_address(soup),
+        description=extraction.extract_description(soup),
+    )
+
+
+def _legacy_extract_date(soup: BeautifulSoup) -> Optional[date]:
+    text = soup.get_text(" ", strip=True)
+    current_year = timezone.localdate().year
+
+    for month_name, month_num in extraction.MONTHS_RU.items():
+        pattern = rf"(\d{{1,2}})\s+{re.escape(month_name)}(?:\s+(\d{{4}}))?"
+        for match in re.finditer(pattern, text, re.IGNORECASE):
+            day = int(match.group(1))
+            year = int(match.group(2)) if match.group(2) else current_year
+            try:
+                candidate = date(year, month_num, day)
+                if match.group(2) is None and candidate < timezone.localdate():
+                    try:
+                        candidate = date(current_year + 1, month_num, day)
+                    except ValueError:
+                        pass
+                return candidate
+            except ValueError:
+                continue
+
+    match = re.search(r"\b(\d{1,2})\.(\d{1,2})(?:\.(\d{4}))?\b", text)
+    if match:
+        day = int(match.group(1))
+        month = int(match.group(2))
+        year = int(match.group(3)) if match.group(3) else current_year
+        try:
+            candidate = date(year, month, day)
+            if match.group(3) is None and candidate < timezone.localdate():
+                try:
+                    candidate = date(current_year + 1, month, day)
+                except ValueError:
+                    pass
+            return candidate
+        except ValueError:
+            pass
+
+    return None
+
+
+def _legacy_extract_time(soup: BeautifulSoup) -> Optional[dtime]:
+    text = soup.get_text(" ", strip=True)
+
+    match = re.search(r"(?:в|начало|время|старт)\s*:?\s*(\d{1,2})[:\.](\d{2})", text)
+    if match:
+        hour = int(match.group(1))
+        minute = int(match.group(2))
+        if 0 <= hour < 24 and 0 <= minute < 60:
+            return dtime(hour, minute)
+
+    for h_str, m_str in re.findall(r"\b(\d{1,2})[:\.](\d{2})\b", text):
+        h, m = int(h_str), int(m_str)
+        if 10 <= h <= 23 and 0 <= m < 60:
+            return dtime(h, m)
+
+    return None
+
+
+def _legacy_extract_cost(soup: BeautifulSoup) -> int:
+    text = soup.get_text(" ", strip=True)
+
+    patterns = [
+        r"(?:от|from|цена|стоимость|price)\s*:?\s*([\d\s]+)\s*(?:₸|тг|тенге|KZT|kzt)",
+        r"([\d\s]+)\s*(?:₸|тг|тенге|KZT|kzt)",
+        r"(?:от|from)\s+([\d\s]+)\b",
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            price_str = match.group(1).replace(" ", "").strip()
+            try:
+                price = int(price_str)
+                if 100 <= price <= 500000:
+                    return price
+            except ValueError:
+                continue
+
+    return 0
+
+
+def _legacy_extract_address(soup: BeautifulSoup) -> str:
+    text = soup.get_text("\n", strip=True)
+
+    patterns = [
+        r"(?:Место|Адрес|Площадка|Venue|Орын)\s*:?\s*(.+?)(?:\n|$)",
+        r"(?:ул\.|пр\.|проспект|улица|Достык|Гоголя)[^,\n]{3,60}",
+    ]
+
+    for pattern in patterns:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            addr = match.group(1) if match.lastindex else match.group(0)
+            addr = addr.strip()
+            if len(addr) > 5:
+                return addr[:200]
+
+    return ""
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Merge Events that describe the same show under different links, using the
+same blocking and title matching as the fetch_events dedupe stage.
+
+Usage:
+    python manage.py dedupe_events
+    python manage.py dedupe_events --dry-run
+    python manage.py dedupe_events --threshold 0.9
+    python manage.py dedupe_events --reset      # recompute all merges from scratch
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.events.dedupe import DEFAULT_THRESHOLD, Candidate, find_duplicates, merge
+from apps.events.models import Event
+
+
+class Command(BaseCommand):
+    help = "Merge duplicate events blocked by (date, venue) and matched on title"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="List the duplicates that would be merged without saving",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=DEFAULT_THRESHOLD,
+            help=f"Minimum title similarity between 0 and 1 (default: {DEFAULT_THRESHOLD})",
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Forget earlier merges and cluster every event again",
+        )
+
+    def handle(self, *args: Any, **kwargs: Any) -> None:
+        dry_run = kwargs["dry_run"]
+        threshold = kwargs["threshold"]
+        reset = kwargs["reset"]
+
+        if not 0 < threshold <= 1:
+            raise CommandError("--threshold must be between 0 and 1")
+
+        events = Event.objects.all()
+        if not reset:
+            events = events.filter(duplicate_of__isnull=True)
+
+        started = time.perf_counter()
+        rows = list(events.values_list("id", "date", "address", "artist"))
+        candidates = [Candidate.from_row(*row) for row in rows]
+        duplicates, comparisons = find_duplicates(candidates, threshold)
+        elapsed = time.perf_counter() - started
+
+        naive = len(candidates) * (len(candidates) - 1) // 2
+        self.stdout.write(
+            f"{len(candidates)} events, {comparisons} title comparisons "
+            f"({naive} without blocking) in {elapsed * 1000:.1f} ms"
+        )
+
+        if dry_run:
+            titles = {row[0]: row[3] for row in rows}
+            for duplicate_id, canonical_id in sorted(duplicates.items()):
+                self.stdout.write(
+                    f"  [DRY RUN] #{duplicate_id} {titles[duplicate_id]} "
+                    f"-> #{canonical_id} {titles[canonical_id]}"
+                )
+            self.stdout.write(
+                self.style.SUCCESS(f"\n[DRY RUN] Would merge {len(duplicates)} duplicates")
+            )
+            return
+
+        with transaction.atomic():
+            if reset:
+                Event.all_objects.filter(duplicate_of__isnull=False).update(duplicate_of=None)
+            merged = merge(duplicates)
+
+        self.stdout.write(self.style.SUCCESS(f"\nDone! Merged {merged} duplicates"))
@@ -1,78 +1,99 @@
 # -*- coding: utf-8 -*-
 """
-Management command to fetch event data from sxodim.com
-and populate the Event / EventTranslation tables.
+Management command to fetch events from the ticketing sites in
+apps.events.sources (sxodim.com so far) and populate the
+Event / EventTranslation tables.
 
 Usage:
     python manage.py fetch_events
+    python manage.py fetch_events --source sxodim
     python manage.py fetch_events --limit 10
     python manage.py fetch_events --dry-run
     python manage.py fetch_events --future-only
     python manage.py fetch_events --future-only --deactivate-past
-
-Designed to be run periodically (e.g. via cron every 6 hours):
+    python manage.py fetch_events --batch-size 100
+    python manage.py fetch_events --max-pages 3
+    python manage.py fetch_events --record /tmp/sxodim-corpus
+    python manage.py fetch_events --replay apps/events/corpus/sxodim_sample --bench
+    python manage.py fetch_events --seed            # enqueue listings in the shared frontier
+    python manage.py fetch_events --worker          # run on each node to drain it
+    python manage.py fetch_events --max-runtime 1800
+    python manage.py fetch_events --resume          # continue an interrupted run
+    python manage.py fetch_events --report /tmp/crawl-report.json
+    python manage.py fetch_events --skip-posters    # keep hotlinking remote posters
+
+Runs periodically under ``python manage.py run_scheduler`` (job "crawl_events"),
+which keeps two crawls from overlapping. A cron entry still works on its own:
     0 */6 * * * cd /path/to/project && python manage.py fetch_events --future-only --deactivate-past
 """
 
 from __future__ import annotations
 
+import json
 import logging
-import re
+import os
+import socket
 import time
-from datetime import date, time as dtime
 from typing import Any, Optional
+from urllib.parse import urlsplit, urlunsplit
 
-import requests
-from bs4 import BeautifulSoup
-from django.core.management.base import BaseCommand
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 from django.utils import timezone
 
-from apps.events.models import Event, EventTranslation
+from apps.abstracts.archive import record_session, replay_session
+from apps.abstracts.bulk import bulk_upsert
+from apps.abstracts.http import CircuitOpenError, HttpClient, RetryPolicy
+from apps.events.checkpoint import CrawlCheckpoint
+from apps.events.dedupe import dedupe_events
+from apps.events.ingestion import IngestionEngine, ListingDone, ScrapedEvent, SourceClient
+from apps.events.jobs import deactivate_past_events
+from apps.events import frontier
+from apps.events.metrics import CrawlMetrics
+from apps.events.models import CrawlRun, CrawlURL, Event, EventTranslation
+from apps.events.posters import DEFAULT_WORKERS as POSTER_WORKERS, mirror_posters
+from apps.events.sources import SOURCES, EventSource, get_source
 
 logger = logging.getLogger(__name__)
 
-BASE_URL = "https://sxodim.com"
-ALMATY_URL = f"{BASE_URL}/almaty"
-
-# Category mapping: sxodim URL slug -> Event.Category int
-CATEGORY_MAP: dict[str, int] = {
-    "kontserty": 1,                   # concerts
-    "koncerty-v-everjazz": 1,         # EverJazz concerts
-    "concerty-dvorec-respubliki": 1,  # Palace of Republic concerts
-    "vystavki": 2,                    # exhibitions
-    "screening": 2,                   # movie screenings
-    "standup": 1,                     # stand-up shows
-    "vecherinki": 1,                  # parties
-    "teatr": 2,                       # theatre
-    "razvlecheniya": 3,               # entertainment
-    "detskie-meropriyatiya": 3,       # kids events
-}
-
-LISTING_SLUGS = [
-    "kontserty",
-    "koncerty-v-everjazz",
-    "concerty-dvorec-respubliki",
-    "vystavki",
-    "standup",
-    "vecherinki",
-]
-
-HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    ),
-    "Accept-Language": "ru-RU,ru;q=0.9,en;q=0.8",
-}
+CHECKPOINT_PATH = os.path.join(settings.BASE_DIR, "data", "fetch_events.checkpoint.json")
 
 LANG_EN = 1
 LANG_RU = 2
 LANG_KZ = 3
 
+# Columns refreshed when a scraped event already exists (matched by link)
+EVENT_UPDATE_FIELDS = [
+    "image",
+    "date",
+    "start_time",
+    "duration",
+    "artist",
+    "cost",
+    "currency",
+    "category",
+    "address",
+    "updated_at",
+    "deleted_at",
+]
+
+# Columns compared to tell an unchanged event from an updated one
+EVENT_COMPARE_FIELDS = [
+    "image",
+    "date",
+    "start_time",
+    "duration",
+    "artist",
+    "cost",
+    "currency",
+    "category",
+    "address",
+]
+
 
 class Command(BaseCommand):
-    help = "Fetch events from sxodim.com and populate Event/EventTranslation tables"
+    help = "Fetch events from ticketing sites and populate Event/EventTranslation tables"
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -86,11 +107,23 @@ class Command(BaseCommand):
             action="store_true",
             help="Preview what would be fetched without saving to DB",
         )
+        parser.add_argument(
+            "--source",
+            action="append",
+            choices=sorted(SOURCES),
+            help="Ingest only from this source; repeat for several (default: all)",
+        )
         parser.add_argument(
             "--delay",
             type=float,
-            default=1.0,
-            help="Delay between HTTP requests in seconds (default: 1.0)",
+            default=None,
+            help="Minimum delay between requests to each site in seconds (default: per source, 1.0 for sxodim)",
+        )
+        parser.add_argument(
+            "--retries",
+            type=int,
+            default=3,
+            help="Retries per request on timeouts, 429 and 5xx (default: 3)",
         )
         parser.add_argument(
             "--future-only",
@@ -102,453 +135,721 @@ class Command(BaseCommand):
             action="store_true",
             help="Mark past events in DB as inactive by setting deleted_at",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=50,
+            help="Number of scraped events written per DB batch (default: 50)",
+        )
+        parser.add_argument(
+            "--max-pages",
+            type=int,
+            default=10,
+            help="Maximum number of pages followed per listing (default: 10)",
+        )
+        archive = parser.add_mutually_exclusive_group()
+        archive.add_argument(
+            "--record",
+            metavar="DIR",
+            help="Store every HTTP response in a compressed archive in DIR",
+        )
+        archive.add_argument(
+            "--replay",
+            metavar="DIR",
+            help="Serve HTTP responses from an archive in DIR (implies --delay 0 --retries 0)",
+        )
+        parser.add_argument(
+            "--bench",
+            action="store_true",
+            help="Report pages/sec, parse time per page and DB time",
+        )
+        parser.add_argument(
+            "--report",
+            metavar="PATH",
+            help="Write the run metrics as JSON to PATH",
+        )
+        parser.add_argument(
+            "--seed",
+            action="store_true",
+            help="Start a new shared crawl by enqueuing the listing pages in the frontier",
+        )
+        parser.add_argument(
+            "--worker",
+            action="store_true",
+            help="Drain the shared crawl frontier instead of crawling listings directly",
+        )
+        parser.add_argument(
+            "--worker-id",
+            default="",
+            help="Lease owner name of this worker (default: hostname:pid)",
+        )
+        parser.add_argument(
+            "--lease-seconds",
+            type=int,
+            default=300,
+            help="How long a worker holds claimed URLs before others may take them (default: 300)",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=3,
+            help="Fetch attempts per frontier URL before it is marked failed (default: 3)",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue the interrupted run recorded in the checkpoint file",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            default=CHECKPOINT_PATH,
+            help="Crawl progress file written after each batch (default: data/fetch_events.checkpoint.json)",
+        )
+        parser.add_argument(
+            "--max-runtime",
+            type=int,
+            default=0,
+            help="Stop cleanly after this many seconds and keep the checkpoint (0 = no limit)",
+        )
+        parser.add_argument(
+            "--skip-posters",
+            action="store_true",
+            help="Do not mirror poster images to MEDIA_ROOT after the crawl",
+        )
+        parser.add_argument(
+            "--poster-workers",
+            type=int,
+            default=POSTER_WORKERS,
+            help=f"Concurrent poster downloads (default: {POSTER_WORKERS})",
+        )
+
 
     def handle(self, *args: Any, **kwargs: Any) -> None:
         limit = kwargs["limit"]
         dry_run = kwargs["dry_run"]
         delay = kwargs["delay"]
+        retries = max(kwargs["retries"], 0)
         future_only = kwargs["future_only"]
         deactivate_past = kwargs["deactivate_past"]
+        batch_size = max(kwargs["batch_size"], 1)
+        max_pages = max(kwargs["max_pages"], 1)
+        record_dir = kwargs["record"]
+        replay_dir = kwargs["replay"]
+        bench = kwargs["bench"]
+        seed = kwargs["seed"]
+        worker = kwargs["worker"]
+        resume = kwargs["resume"]
+        max_runtime = kwargs["max_runtime"]
+
+        if resume and (dry_run or worker):
+            # Workers keep their progress in the frontier; dry runs save nothing
+            raise CommandError("--resume cannot be combined with --dry-run or --worker")
+
+        if replay_dir:
+            delay = 0
+            retries = 0
+
+        sources = [get_source(name) for name in kwargs["source"] or sorted(SOURCES)]
+
+        self.metrics = CrawlMetrics()
+        self.worker_name = ""
+        started = time.perf_counter()
+        started_at = timezone.now()
+        self.deadline = time.monotonic() + max_runtime if max_runtime > 0 else None
+        self.out_of_time = False
+        self.aborted = False
 
         today = timezone.localdate()
 
-        self.stdout.write(self.style.NOTICE("Fetching events from sxodim.com..."))
+        self.stdout.write(
+            self.style.NOTICE(
+                f"Fetching events from {', '.join(source.name for source in sources)}..."
+            )
+        )
         self.stdout.write(f"Today boundary: {today}")
 
         if deactivate_past:
             if dry_run:
-                past_count = Event.objects.filter(
-                    date__lt=today,
-                    deleted_at__isnull=True,
-                ).count()
+                past_count = Event.objects.filter(date__lt=today).count()
                 self.stdout.write(
                     self.style.WARNING(
                         f"[DRY RUN] Would mark {past_count} past events as inactive"
                     )
                 )
             else:
-                deactivated_count = self._deactivate_past_events(today)
+                deactivated_count = deactivate_past_events(today)
                 self.stdout.write(
                     self.style.WARNING(
                         f"Marked {deactivated_count} past events as inactive"
                     )
                 )
 
-        session = requests.Session()
-        session.headers.update(HEADERS)
-
-        # Step 1: Collect event links from listing pages
-        event_links: dict[str, int] = {}  # url -> category
-        for slug in LISTING_SLUGS:
-            category = CATEGORY_MAP.get(slug, 1)
-            listing_url = f"{ALMATY_URL}/events/{slug}"
-            self.stdout.write(f"  Scraping listing: {listing_url}")
-            try:
-                links = self._scrape_listing(session, listing_url)
-                for link in links:
-                    if link not in event_links:
-                        event_links[link] = category
-                self.stdout.write(f"    Found {len(links)} event links")
-            except Exception as e:
-                self.stderr.write(f"    Error scraping listing {listing_url}: {e}")
-            time.sleep(delay)
-
-        if limit > 0:
-            items = list(event_links.items())[:limit]
-            event_links = dict(items)
-
-        self.stdout.write(
-            self.style.NOTICE(
-                f"Total unique event links to process: {len(event_links)}"
+        clients = [
+            self._make_client(source, delay, retries, record_dir, replay_dir)
+            for source in sources
+        ]
+        if record_dir:
+            self.stdout.write(f"Recording HTTP responses to {record_dir}")
+        elif replay_dir:
+            self.stdout.write(
+                f"Replaying {len(clients[0].archive)} recorded responses from {replay_dir}"
             )
-        )
-
-        # Step 2: Scrape each event detail page
-        created_count = 0
-        updated_count = 0
-        skipped_past_count = 0
-        skipped_no_date_count = 0
-        error_count = 0
-
-        for event_url, category in event_links.items():
-            try:
-                event_data = self._scrape_event_detail(session, event_url, category)
-                if event_data is None:
-                    error_count += 1
-                    continue
 
-                event_date = event_data.get("date")
+        self.dry_run = dry_run
+        self.future_only = future_only
+        self.today = today
+        self.batch_size = batch_size
+        self.pending: list[dict[str, Any]] = []
+        self.saved_links: set[str] = set()
+        self.counts = dict.fromkeys(
+            (
+                "processed", "created", "updated", "unchanged", "duplicates",
+                "skipped_past", "skipped_no_date", "errors",
+            ),
+            0,
+        )
 
-                if event_date is None:
-                    skipped_no_date_count += 1
+        self.checkpoint: Optional[CrawlCheckpoint] = None
+        if not (dry_run or worker):
+            if resume:
+                self.checkpoint = CrawlCheckpoint.load(kwargs["checkpoint"])
+                if self.checkpoint is None:
                     self.stdout.write(
-                        self.style.WARNING(
-                            f"  [SKIPPED: NO DATE] {event_data['artist']} | {event_url}"
-                        )
+                        self.style.WARNING("No checkpoint to resume, starting a new run")
                     )
-                    time.sleep(delay)
-                    continue
-
-                if future_only and event_date < today:
-                    skipped_past_count += 1
+                else:
+                    self.counts.update(self.checkpoint.counts)
                     self.stdout.write(
-                        self.style.WARNING(
-                            f"  [SKIPPED: PAST] {event_data['artist']} | {event_date}"
-                        )
+                        f"Resuming: {len(self.checkpoint.completed)} of "
+                        f"{len(self.checkpoint.discovered)} discovered links done, "
+                        f"{len(self.checkpoint.listings_done)} listings finished"
                     )
-                    time.sleep(delay)
-                    continue
+            if self.checkpoint is None:
+                self.checkpoint = CrawlCheckpoint(kwargs["checkpoint"])
+            self.checkpoint.counts = self.counts
+        # A resumed run reports only its own share of the work
+        initial_counts = dict(self.counts)
+
+        if seed:
+            seeded = frontier.seed(
+                (source.name, url, category)
+                for source in sources
+                for url, category in source.listings()
+            )
+            self.stdout.write(self.style.SUCCESS(f"Seeded {seeded} listing pages"))
+            if not worker:
+                return
 
-                if dry_run:
-                    self.stdout.write(
-                        f"  [DRY RUN] {event_data['artist']} | "
-                        f"{event_data['date']} | {event_data['cost']} KZT"
-                    )
-                else:
-                    was_created = self._save_event(event_data)
-                    if was_created:
-                        created_count += 1
-                        self.stdout.write(f"  [CREATED] {event_data['artist']}")
-                    else:
-                        updated_count += 1
-                        self.stdout.write(f"  [UPDATED] {event_data['artist']}")
+        try:
+            if worker:
+                self._run_worker(clients, kwargs, limit, max_pages)
+            else:
+                self._run_stream(clients, limit, max_pages)
+        except CircuitOpenError as e:
+            # The site is down: stop instead of waiting out every remaining URL
+            self.aborted = True
+            self.counts["errors"] += 1
+            self.stderr.write(self.style.ERROR(f"Aborting crawl: {e}"))
+
+        self._flush_pending()
+
+        posters: dict[str, Any] = {}
+        if not (dry_run or kwargs["skip_posters"]):
+            posters = self._mirror_posters(
+                sources[0], retries, record_dir, replay_dir, kwargs["poster_workers"]
+            )
 
-            except Exception as e:
-                error_count += 1
-                self.stderr.write(
-                    self.style.ERROR(f"  Error processing {event_url}: {e}")
+        if self.out_of_time:
+            self.stdout.write(self.style.WARNING(f"Stopped after --max-runtime {max_runtime}s"))
+        if self.checkpoint is not None:
+            if self.out_of_time or self.aborted:
+                self.stdout.write(
+                    f"Checkpoint saved to {self.checkpoint.path}; continue with --resume"
                 )
+            else:
+                self.checkpoint.clear()
 
-            time.sleep(delay)
-
+        counts = self.counts
         if dry_run:
             self.stdout.write(
                 self.style.SUCCESS(
-                    f"\n[DRY RUN] Would process {len(event_links)} links | "
-                    f"Skipped past: {skipped_past_count} | "
-                    f"Skipped no date: {skipped_no_date_count} | "
-                    f"Errors: {error_count}"
+                    f"\n[DRY RUN] Would process {counts['processed']} links | "
+                    f"Skipped past: {counts['skipped_past']} | "
+                    f"Skipped no date: {counts['skipped_no_date']} | "
+                    f"Errors: {counts['errors']}"
                 )
             )
         else:
             self.stdout.write(
                 self.style.SUCCESS(
-                    f"\nDone! Created: {created_count}, Updated: {updated_count}, "
-                    f"Skipped past: {skipped_past_count}, "
-                    f"Skipped no date: {skipped_no_date_count}, "
-                    f"Errors: {error_count}"
+                    f"\nDone! Processed: {counts['processed']}, "
+                    f"Created: {counts['created']}, Updated: {counts['updated']}, "
+                    f"Unchanged: {counts['unchanged']}, "
+                    f"Merged duplicates: {counts['duplicates']}, "
+                    f"Skipped past: {counts['skipped_past']}, "
+                    f"Skipped no date: {counts['skipped_no_date']}, "
+                    f"Errors: {counts['errors']}"
                 )
             )
 
-    # ------------------------------------------------------------------
-    # Scraping helpers
-    # ------------------------------------------------------------------
+        elapsed = time.perf_counter() - started
+        if self.aborted:
+            outcome = CrawlRun.Outcome.CIRCUIT_OPEN
+        elif self.out_of_time:
+            outcome = CrawlRun.Outcome.MAX_RUNTIME
+        else:
+            outcome = CrawlRun.Outcome.COMPLETED
+        for source_client in clients:
+            self.metrics.merge(source_client.metrics)
+        report = self.metrics.report(
+            elapsed,
+            {key: counts[key] - initial_counts[key] for key in counts},
+            mode=CrawlRun.Mode.WORKER if worker else CrawlRun.Mode.STREAM,
+            worker=self.worker_name,
+            outcome=outcome,
+            resumed=bool(self.checkpoint and self.checkpoint.completed and resume),
+            dry_run=dry_run,
+            started_at=started_at.isoformat(),
+            finished_at=timezone.now().isoformat(),
+            posters=posters,
+            sources={
+                source_client.source.name: source_client.stats()
+                for source_client in clients
+            },
+        )
 
-    def _fetch_page(self, session: requests.Session, url: str) -> Optional[BeautifulSoup]:
-        """Fetch a page and return parsed BeautifulSoup, or None on error."""
-        try:
-            resp = session.get(url, timeout=15)
-            resp.raise_for_status()
-            return BeautifulSoup(resp.text, "lxml")
-        except requests.RequestException as e:
-            self.stderr.write(f"    HTTP error fetching {url}: {e}")
-            return None
-
-    def _scrape_listing(
-        self, session: requests.Session, listing_url: str
-    ) -> list[str]:
-        """Extract event detail page URLs from a listing page."""
-        soup = self._fetch_page(session, listing_url)
-        if soup is None:
-            return []
+        if not dry_run:
+            self._save_run(report, started_at)
+        if kwargs["report"]:
+            with open(kwargs["report"], "w", encoding="utf-8") as fh:
+                json.dump(report, fh, indent=2)
+            self.stdout.write(f"Run report written to {kwargs['report']}")
+        if bench:
+            self._report_bench(report)
 
-        event_links: list[str] = []
+    def _make_client(
+        self,
+        source: EventSource,
+        delay: Optional[float],
+        retries: int,
+        record_dir: Optional[str],
+        replay_dir: Optional[str],
+    ) -> SourceClient:
+        """A source's own HTTP client, rate-limited to the source's pace."""
+        client = HttpClient(
+            headers=source.headers,
+            retry=RetryPolicy(max_retries=retries),
+            min_interval=source.min_interval if delay is None else delay,
+        )
+        source_client = SourceClient(source, client, log=self.stdout.write, warn=self.stderr.write)
+        if record_dir:
+            source_client.archive = record_session(client.session, record_dir)
+        elif replay_dir:
+            source_client.archive = replay_session(client.session, replay_dir)
+        return source_client
+
+    def _mirror_posters(
+        self,
+        source: EventSource,
+        retries: int,
+        record_dir: Optional[str],
+        replay_dir: Optional[str],
+        workers: int,
+    ) -> dict[str, Any]:
+        """Mirror the posters of this run's events that have no local copy yet."""
+        links = sorted(self.saved_links)
+        events: list[tuple[int, str]] = []
+        for i in range(0, len(links), 500):
+            events.extend(
+                Event.objects.filter(link__in=links[i : i + 500], poster__isnull=True)
+                .exclude(image="")
+                .values_list("id", "image")
+            )
+        if not events:
+            return {}
 
-        for a_tag in soup.find_all("a", href=True):
-            href = a_tag["href"]
+        # Image hosts are CDNs, not the crawled site: no per-request delay
+        client = HttpClient(headers=source.headers, retry=RetryPolicy(max_retries=retries))
+        if record_dir:
+            record_session(client.session, record_dir)
+        elif replay_dir:
+            replay_session(client.session, replay_dir)
 
-            if re.match(r"^(/almaty/event/[\w-]+)$", href):
-                full_url = f"{BASE_URL}{href}"
-                if full_url not in event_links:
-                    event_links.append(full_url)
+        started = time.perf_counter()
+        try:
+            stats = mirror_posters(events, client, workers=workers)
+        finally:
+            client.close()
+        elapsed = time.perf_counter() - started
 
-            elif re.match(r"^https?://sxodim\.com/almaty/event/[\w-]+$", href):
-                if href not in event_links:
-                    event_links.append(href)
+        self.stdout.write(
+            f"Posters: {stats.mirrored} mirrored, {stats.reused} reused, "
+            f"{stats.failed} failed in {elapsed:.1f} s"
+        )
+        return {**stats.as_dict(), "seconds": round(elapsed, 3)}
+
+    def _limit_reached(self, limit: int) -> bool:
+        return limit > 0 and self.counts["processed"] >= limit
+
+    def _run_stream(self, clients: list[SourceClient], limit: int, max_pages: int) -> None:
+        """Scrape every source concurrently, saving events as they arrive."""
+        if self._limit_reached(limit):
+            return
+
+        checkpoint = self.checkpoint
+        engine = IngestionEngine(
+            clients,
+            max_pages,
+            # Links discovered before an interruption come first
+            pending=checkpoint.remaining() if checkpoint else None,
+            seen=set(checkpoint.discovered) if checkpoint else None,
+            listings_done=checkpoint.listings_done if checkpoint else None,
+        )
+        items = engine.run()
+        try:
+            for item in items:
+                if isinstance(item, ScrapedEvent):
+                    if checkpoint is not None:
+                        checkpoint.discover(item.url, item.source, item.category)
+                    self._process_event(item.url, item.data)
+                    if self.counts["processed"] % self.batch_size == 0:
+                        self._save_checkpoint()
+                    if self._limit_reached(limit) or self._time_is_up():
+                        break
+                elif isinstance(item, ListingDone):
+                    if checkpoint is not None:
+                        checkpoint.listings_done.add(item.url)
+                elif item.error is not None:
+                    # Only this source stops; the others carry on
+                    self.aborted = True
+                    self.counts["errors"] += 1
+                    self.stderr.write(
+                        self.style.ERROR(f"Aborting {item.source}: {item.error}")
+                    )
+        finally:
+            items.close()
 
-        return event_links
+    def _run_worker(
+        self,
+        clients: list[SourceClient],
+        options: dict[str, Any],
+        limit: int,
+        max_pages: int,
+    ) -> None:
+        """Drain the shared crawl frontier until no claimable URL is left."""
+        owner = options["worker_id"] or f"{socket.gethostname()}:{os.getpid()}"
+        self.worker_name = owner
+        lease_seconds = options["lease_seconds"]
+        by_source = {source_client.source.name: source_client for source_client in clients}
+        self.stdout.write(f"Worker {owner} draining the crawl frontier")
+
+        while not self._limit_reached(limit):
+            if self._time_is_up():
+                break
+            batch = frontier.claim(owner, self.batch_size, lease_seconds, sources=list(by_source))
+            if not batch:
+                # Other workers may still enqueue pages from their listings
+                if not frontier.has_leased(sources=list(by_source)):
+                    break
+                time.sleep(1)
+                continue
+
+            done: list[int] = []
+            failed: list[int] = []
+            renewed_at = time.monotonic()
+            try:
+                for item in batch:
+                    if self._limit_reached(limit):
+                        break
+                    if self._time_is_up():
+                        break
+                    if time.monotonic() - renewed_at > lease_seconds / 2:
+                        frontier.renew(owner, [row.id for row in batch], lease_seconds)
+                        renewed_at = time.monotonic()
+
+                    source_client = by_source[item.source]
+                    if item.kind == CrawlURL.Kind.LISTING:
+                        ok = self._process_listing_page(source_client, item, max_pages)
+                    else:
+                        ok = self._process_event(
+                            item.url, source_client.scrape_event(item.url, item.category)
+                        )
+                    (done if ok else failed).append(item.id)
+            finally:
+                # Events must be written before their URLs are marked done
+                self._flush_pending()
+                frontier.complete(owner, done)
+                frontier.fail(owner, failed, options["max_attempts"])
+                frontier.release(
+                    owner,
+                    [row.id for row in batch if row.id not in done and row.id not in failed],
+                )
 
-    def _scrape_event_detail(
+    def _process_listing_page(
         self,
-        session: requests.Session,
-        event_url: str,
-        category: int,
-    ) -> Optional[dict[str, Any]]:
-        """Scrape an individual event detail page."""
-        soup = self._fetch_page(session, event_url)
+        source_client: SourceClient,
+        item: CrawlURL,
+        max_pages: int,
+    ) -> bool:
+        """Enqueue a frontier listing page's event links and its next page."""
+        source = source_client.source
+        soup = source_client.fetch_page(item.url)
         if soup is None:
-            return None
-
-        title = self._extract_title(soup)
-        if not title:
-            self.stderr.write(f"    No title found for {event_url}")
-            return None
-
-        image = self._extract_image(soup)
-        event_date = self._extract_date(soup)
-        start_time = self._extract_time(soup)
-        cost = self._extract_cost(soup)
-        address = self._extract_address(soup)
-        description = self._extract_description(soup, title)
-
-        return {
-            "image": image or "",
-            "date": event_date,  # important: do not auto-substitute today's date
-            "start_time": start_time or dtime(19, 0),
-            "duration": 120,
-            "artist": title,
-            "cost": cost,
-            "currency": "KZT",
-            "category": category,
-            "address": address or "Алматы",
-            "link": event_url,
-            "name_ru": title,
-            "description_ru": description or f"Мероприятие в Алматы. {title}.",
-        }
+            self.counts["errors"] += 1
+            return False
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
-        """Extract event title from the page."""
-        h1 = soup.find("h1")
-        if h1:
-            text = h1.get_text(strip=True)
-            if text:
-                return text
-
-        og_title = soup.find("meta", property="og:title")
-        if og_title and og_title.get("content"):
-            return og_title["content"].strip()
-
-        title_tag = soup.find("title")
-        if title_tag:
-            text = title_tag.get_text(strip=True)
-            text = re.sub(r"\s*\|\s*Давай Сходим!?\s*$", "", text)
-            text = re.sub(r"\s*-\s*купить билеты.*$", "", text)
-            if text:
-                return text.strip()
-
-        return ""
-
-    def _extract_image(self, soup: BeautifulSoup) -> str:
-        """Extract the main event image URL."""
-        og_img = soup.find("meta", property="og:image")
-        if og_img and og_img.get("content"):
-            return og_img["content"]
-
-        for img in soup.find_all("img"):
-            src = img.get("src", "") or img.get("data-src", "")
-            if src and ("uploads/posts" in src or "optimized" in src):
-                if not src.startswith("http"):
-                    src = f"{BASE_URL}{src}"
-                return src
-
-        return ""
-
-    def _extract_date(self, soup: BeautifulSoup) -> Optional[date]:
-        """Extract event date from the page."""
-        text = soup.get_text(" ", strip=True)
-        current_year = timezone.localdate().year
-
-        months_ru = {
-            "января": 1, "февраля": 2, "марта": 3, "апреля": 4,
-            "мая": 5, "июня": 6, "июля": 7, "августа": 8,
-            "сентября": 9, "октября": 10, "ноября": 11, "декабря": 12,
-            "январь": 1, "февраль": 2, "март": 3, "апрель": 4,
-            "май": 5, "июнь": 6, "июль": 7, "август": 8,
-            "сентябрь": 9, "октябрь": 10, "ноябрь": 11, "декабрь": 12,
-        }
+        links = source.scrape_listing(soup)
+        new_count = frontier.enqueue(source.name, links, CrawlURL.Kind.DETAIL, item.category)
+        self.stdout.write(
+            f"  Listing {item.url}: {len(links)} event links, {new_count} new"
+        )
 
-        # Pattern: "20 февраля" or "20 февраля 2026"
-        for month_name, month_num in months_ru.items():
-            pattern = rf"(\d{{1,2}})\s+{re.escape(month_name)}(?:\s+(\d{{4}}))?"
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-
-            for match in matches:
-                day = int(match.group(1))
-                year = int(match.group(2)) if match.group(2) else current_year
-                try:
-                    candidate = date(year, month_num, day)
-
-                    # If year is omitted and parsed date is too far in the past,
-                    # assume next year for seasonal listings around year boundaries.
-                    if match.group(2) is None and candidate < timezone.localdate():
-                        try:
-                            candidate = date(current_year + 1, month_num, day)
-                        except ValueError:
-                            pass
-
-                    return candidate
-                except ValueError:
-                    continue
-
-        # Pattern: DD.MM.YYYY or DD.MM
-        match = re.search(r"\b(\d{1,2})\.(\d{1,2})(?:\.(\d{4}))?\b", text)
-        if match:
-            day = int(match.group(1))
-            month = int(match.group(2))
-            year = int(match.group(3)) if match.group(3) else current_year
-            try:
-                candidate = date(year, month, day)
-                if match.group(3) is None and candidate < timezone.localdate():
-                    try:
-                        candidate = date(current_year + 1, month, day)
-                    except ValueError:
-                        pass
-                return candidate
-            except ValueError:
-                pass
-
-        return None
-
-    def _extract_time(self, soup: BeautifulSoup) -> Optional[dtime]:
-        """Extract event start time from the page."""
-        text = soup.get_text(" ", strip=True)
-
-        match = re.search(r"(?:в|начало|время|старт)\s*:?\s*(\d{1,2})[:\.](\d{2})", text)
-        if match:
-            hour = int(match.group(1))
-            minute = int(match.group(2))
-            if 0 <= hour < 24 and 0 <= minute < 60:
-                return dtime(hour, minute)
-
-        times = re.findall(r"\b(\d{1,2})[:\.](\d{2})\b", text)
-        for h_str, m_str in times:
-            h, m = int(h_str), int(m_str)
-            if 10 <= h <= 23 and 0 <= m < 60:
-                return dtime(h, m)
-
-        return None
-
-    def _extract_cost(self, soup: BeautifulSoup) -> int:
-        """Extract ticket price from the page."""
-        text = soup.get_text(" ", strip=True)
-
-        patterns = [
-            r"(?:от|from|цена|стоимость|price)\s*:?\s*([\d\s]+)\s*(?:₸|тг|тенге|KZT|kzt)",
-            r"([\d\s]+)\s*(?:₸|тг|тенге|KZT|kzt)",
-            r"(?:от|from)\s+([\d\s]+)\b",
-        ]
+        if new_count and item.page < max_pages:
+            listing_url = urlunsplit(urlsplit(item.url)._replace(query="", fragment=""))
+            next_url = source.next_page_url(soup, listing_url, item.page + 1)
+            if next_url:
+                frontier.enqueue(
+                    source.name,
+                    [next_url],
+                    CrawlURL.Kind.LISTING,
+                    item.category,
+                    page=item.page + 1,
+                )
+        return True
 
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                price_str = match.group(1).replace(" ", "").strip()
-                try:
-                    price = int(price_str)
-                    if 100 <= price <= 500000:
-                        return price
-                except ValueError:
-                    continue
-
-        return 0
-
-    def _extract_address(self, soup: BeautifulSoup) -> str:
-        """Extract venue / address from the page."""
-        text = soup.get_text("\n", strip=True)
-
-        patterns = [
-            r"(?:Место|Адрес|Площадка|Venue|Орын)\s*:?\s*(.+?)(?:\n|$)",
-            r"(?:ул\.|пр\.|проспект|улица|Достык|Гоголя)[^,\n]{3,60}",
-        ]
+    def _process_event(self, event_url: str, event_data: Optional[dict[str, Any]]) -> bool:
+        """
+        Buffer a scraped event for saving.
+        Returns False if the page could not be fetched or parsed.
+        """
+        self.counts["processed"] += 1
+        if event_data is None:
+            self.counts["errors"] += 1
+            return False
+
+        try:
+            event_date = event_data.get("date")
 
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                addr = match.group(1) if match.lastindex else match.group(0)
-                addr = addr.strip()
-                if len(addr) > 5:
-                    return addr[:200]
+            if event_date is None:
+                self.counts["skipped_no_date"] += 1
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"  [SKIPPED: NO DATE] {event_data['artist']} | {event_url}"
+                    )
+                )
+                self._mark_completed([event_url])
+                return True
+
+            if self.future_only and event_date < self.today:
+                self.counts["skipped_past"] += 1
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"  [SKIPPED: PAST] {event_data['artist']} | {event_date}"
+                    )
+                )
+                self._mark_completed([event_url])
+                return True
+
+            if self.dry_run:
+                self.stdout.write(
+                    f"  [DRY RUN] {event_data['artist']} | "
+                    f"{event_data['date']} | {event_data['cost']} KZT"
+                )
+            else:
+                self.pending.append(event_data)
+                if len(self.pending) >= self.batch_size:
+                    self._flush_pending()
+
+        except Exception as e:
+            self.counts["errors"] += 1
+            self.stderr.write(
+                self.style.ERROR(f"  Error processing {event_url}: {e}")
+            )
+            return False
+
+        return True
 
-        return ""
+    def _time_is_up(self) -> bool:
+        """Whether --max-runtime has run out; remembered for the final report."""
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.out_of_time = True
+        return self.out_of_time
 
-    def _extract_description(self, soup: BeautifulSoup, title: str) -> str:
-        """Extract event description from the page."""
-        og_desc = soup.find("meta", property="og:description")
-        if og_desc and og_desc.get("content"):
-            desc = og_desc["content"].strip()
-            if len(desc) > 20:
-                return desc
+    def _mark_completed(self, links: list[str]) -> None:
+        if self.checkpoint is not None:
+            self.checkpoint.complete(links)
 
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        if meta_desc and meta_desc.get("content"):
-            desc = meta_desc["content"].strip()
-            if len(desc) > 20:
-                return desc
+    def _save_checkpoint(self) -> None:
+        if self.checkpoint is not None:
+            self.checkpoint.save()
+
+    def _report_bench(self, report: dict[str, Any]) -> None:
+        fetch_ms = report["fetch_ms"]
+        statuses = ", ".join(f"{status}: {n}" for status, n in report["statuses"].items())
+        self.stdout.write(
+            self.style.NOTICE(
+                f"\nBenchmark: {report['pages']} pages in {report['elapsed_seconds']:.2f} s "
+                f"({report['pages_per_second']:.1f} pages/sec, "
+                f"{report['bytes'] / 1024:.0f} KiB)\n"
+                f"  Fetch: p50 {fetch_ms['p50']:.2f} ms, p90 {fetch_ms['p90']:.2f} ms, "
+                f"p99 {fetch_ms['p99']:.2f} ms\n"
+                f"  Parse: {report['parse_ms_per_page']:.2f} ms/page\n"
+                f"  DB:    {report['db_seconds'] * 1000:.1f} ms total\n"
+                f"  HTTP:  {statuses or '-'}"
+            )
+        )
+        if len(report["sources"]) > 1:
+            for name, stats in report["sources"].items():
+                self.stdout.write(
+                    f"  {name}: {stats['pages']} pages, fetch p50 "
+                    f"{stats['fetch_ms']['p50']:.2f} ms, {stats['scraped']} scraped, "
+                    f"{stats['failed']} failed"
+                )
 
-        return ""
+    def _save_run(self, report: dict[str, Any], started_at: Any) -> None:
+        events = report["events"]
+        CrawlRun.objects.create(
+            started_at=started_at,
+            finished_at=timezone.now(),
+            mode=report["mode"],
+            outcome=report["outcome"],
+            worker=report["worker"],
+            pages=report["pages"],
+            bytes=report["bytes"],
+            pages_per_second=report["pages_per_second"],
+            fetch_p50_ms=report["fetch_ms"]["p50"],
+            fetch_p99_ms=report["fetch_ms"]["p99"],
+            parse_ms_per_page=report["parse_ms_per_page"],
+            db_seconds=report["db_seconds"],
+            created=events["created"],
+            updated=events["updated"],
+            unchanged=events["unchanged"],
+            skipped=events["skipped_past"] + events["skipped_no_date"],
+            errors=events["errors"],
+            report=report,
+        )
 
     # ------------------------------------------------------------------
     # Database helpers
     # ------------------------------------------------------------------
 
-    def _deactivate_past_events(self, today: date) -> int:
-        queryset = Event.objects.filter(date__lt=today, deleted_at__isnull=True)
-        count = queryset.count()
-        queryset.update(deleted_at=timezone.now())
-        return count
-
-    @transaction.atomic
-    def _save_event(self, data: dict[str, Any]) -> bool:
+    def _flush_pending(self) -> None:
+        if self.pending:
+            created, updated, unchanged = self._flush_events(self.pending)
+            self.counts["created"] += created
+            self.counts["updated"] += updated
+            self.counts["unchanged"] += unchanged
+            self._mark_completed([data["link"] for data in self.pending])
+            self.saved_links.update(data["link"] for data in self.pending)
+            self.pending = []
+        self._save_checkpoint()
+
+    def _flush_events(self, batch: list[dict[str, Any]]) -> tuple[int, int, int]:
         """
-        Save or update an Event and its translations.
-        Returns True if created, False if updated.
+        Write a buffered batch and report each event.
+        Returns (created, updated, unchanged) counts.
         """
-        event, created = Event.objects.update_or_create(
-            link=data["link"],
-            defaults={
-                "image": data["image"],
-                "date": data["date"],
-                "start_time": data["start_time"],
-                "duration": data["duration"],
-                "artist": data["artist"],
-                "cost": data["cost"],
-                "currency": data["currency"],
-                "category": data["category"],
-                "address": data["address"],
-                "updated_at": timezone.now(),
-                "deleted_at": None,
-            },
+        # A link may only appear once per INSERT ... ON CONFLICT statement,
+        # and each event is counted once; the last scrape of a link wins
+        batch = list({data["link"]: data for data in batch}.values())
+        started = time.perf_counter()
+        created_links, unchanged_links = self._save_events(batch)
+        # The same show listed under another slug or site becomes one event
+        self.counts["duplicates"] += dedupe_events(
+            Event.objects.filter(
+                link__in=[data["link"] for data in batch if data["link"] not in unchanged_links]
+            ).values_list("id", flat=True)
         )
+        self.metrics.db_seconds += time.perf_counter() - started
+        for data in batch:
+            if data["link"] in created_links:
+                self.stdout.write(f"  [CREATED] {data['artist']}")
+            elif data["link"] in unchanged_links:
+                self.stdout.write(f"  [UNCHANGED] {data['artist']}")
+            else:
+                self.stdout.write(f"  [UPDATED] {data['artist']}")
+        unchanged = sum(1 for data in batch if data["link"] in unchanged_links)
+        return len(created_links), len(batch) - len(created_links) - unchanged, unchanged
 
-        name_ru = data["name_ru"]
-        desc_ru = data["description_ru"]
-
-        translations = [
-            {
-                "language_id": LANG_EN,
-                "name": name_ru,
-                "description": desc_ru,
-            },
-            {
-                "language_id": LANG_RU,
-                "name": name_ru,
-                "description": desc_ru,
-            },
-            {
-                "language_id": LANG_KZ,
-                "name": name_ru,
-                "description": desc_ru,
-            },
+    def _save_events(self, batch: list[dict[str, Any]]) -> tuple[set[str], set[str]]:
+        """
+        Upsert a batch of Events and their translations, keyed by link
+        (each link at most once). Events identical to the stored row are
+        not written at all.
+        Returns the sets of links that were created and left unchanged.
+        """
+        links = [data["link"] for data in batch]
+
+        # Read outside the transaction: on SQLite a transaction that reads
+        # first cannot upgrade to a write lock while another process writes
+        existing = {
+            row[0]: row[1:]
+            for row in Event.all_objects.filter(link__in=links).values_list(
+                "link", *EVENT_COMPARE_FIELDS, "deleted_at"
+            )
+        }
+        stored_texts = {
+            link: (name, description)
+            for link, name, description in EventTranslation.objects.filter(
+                event__link__in=existing, language_id=LANG_RU
+            ).values_list("event__link", "name", "description")
+        }
+        unchanged = {
+            data["link"]
+            for data in batch
+            if existing.get(data["link"])
+            == (*(data[field] for field in EVENT_COMPARE_FIELDS), None)
+            and stored_texts.get(data["link"]) == (data["name_ru"], data["description_ru"])
+        }
+        batch = [data for data in batch if data["link"] not in unchanged]
+        created = {link for link in links if link not in existing}
+        if not batch:
+            return created, unchanged
+
+        # A new poster URL drops the mirrored copy of the old one
+        replaced_images = [
+            data["link"]
+            for data in batch
+            if data["link"] in existing and existing[data["link"]][0] != data["image"]
         ]
 
-        for tr in translations:
-            EventTranslation.objects.update_or_create(
-                event=event,
-                language_id=tr["language_id"],
-                defaults={
-                    "name": tr["name"],
-                    "description": tr["description"],
-                },
+        with transaction.atomic():
+            if replaced_images:
+                Event.all_objects.filter(link__in=replaced_images).update(poster=None)
+            bulk_upsert(
+                Event,
+                (
+                    {
+                        **{field: data[field] for field in EVENT_COMPARE_FIELDS},
+                        "link": data["link"],
+                        "deleted_at": None,
+                    }
+                    for data in batch
+                ),
+                unique_fields=["link"],
+                update_fields=EVENT_UPDATE_FIELDS,
+            )
+
+            event_ids = dict(
+                Event.all_objects.filter(
+                    link__in=[data["link"] for data in batch]
+                ).values_list("link", "id")
+            )
+
+            bulk_upsert(
+                EventTranslation,
+                (
+                    {
+                        "event_id": event_ids[data["link"]],
+                        "language_id": language_id,
+                        "name": data["name_ru"],
+                        "description": data["description_ru"],
+                    }
+                    for data in batch
+                    for language_id in (LANG_EN, LANG_RU, LANG_KZ)
+                ),
+                unique_fields=["event_id", "language_id"],
+                update_fields=["name", "description"],
             )
 
-        return created
-        
\ No newline at end of file
+        return created, unchanged
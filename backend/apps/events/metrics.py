@@ -0,0 +1,78 @@
+"""
+Per-stage measurements of a ``fetch_events`` run, reported as JSON and
+stored in the CrawlRun table.
+"""
+
+import math
+from collections import Counter
+from typing import Any, Optional
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of unsorted values (0.0 for no values)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+class CrawlMetrics:
+    """Fetch, parse and DB measurements collected while crawling."""
+
+    def __init__(self) -> None:
+        self.pages = 0
+        self.bytes = 0
+        # Final status per request after retries; "error" if no response came
+        self.statuses: Counter[str] = Counter()
+        self.fetch_seconds: list[float] = []
+        self.parse_seconds = 0.0
+        self.db_seconds = 0.0
+
+    def record_fetch(self, seconds: float, status: Optional[int], size: int) -> None:
+        self.fetch_seconds.append(seconds)
+        self.statuses[str(status) if status is not None else "error"] += 1
+        self.bytes += size
+        if status is not None and status < 400:
+            self.pages += 1
+
+    def merge(self, other: "CrawlMetrics") -> None:
+        """Add another collector's measurements, e.g. one per source."""
+        self.pages += other.pages
+        self.bytes += other.bytes
+        self.statuses.update(other.statuses)
+        self.fetch_seconds.extend(other.fetch_seconds)
+        self.parse_seconds += other.parse_seconds
+        self.db_seconds += other.db_seconds
+
+    def fetch_ms(self) -> dict[str, float]:
+        return {
+            "p50": round(percentile(self.fetch_seconds, 0.50) * 1000, 2),
+            "p90": round(percentile(self.fetch_seconds, 0.90) * 1000, 2),
+            "p99": round(percentile(self.fetch_seconds, 0.99) * 1000, 2),
+            "max": round(max(self.fetch_seconds, default=0.0) * 1000, 2),
+        }
+
+    def parse_ms_per_page(self) -> float:
+        return round(self.parse_seconds * 1000 / self.pages, 2) if self.pages else 0.0
+
+    def summary(self) -> dict[str, Any]:
+        """Fetch and parse figures, as reported per source."""
+        return {
+            "pages": self.pages,
+            "bytes": self.bytes,
+            "statuses": dict(sorted(self.statuses.items())),
+            "fetch_ms": self.fetch_ms(),
+            "parse_ms_per_page": self.parse_ms_per_page(),
+        }
+
+    def report(self, elapsed: float, events: dict[str, int], **extra: Any) -> dict[str, Any]:
+        """The run report: ``extra`` adds run details such as mode and outcome."""
+        return {
+            **extra,
+            "elapsed_seconds": round(elapsed, 3),
+            **self.summary(),
+            "pages_per_second": round(self.pages / elapsed, 2) if elapsed else 0.0,
+            "db_seconds": round(self.db_seconds, 3),
+            "events": events,
+        }
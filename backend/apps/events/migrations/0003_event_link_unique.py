@@ -0,0 +1,68 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:00
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def merge_duplicate_links(apps, schema_editor):
+    """
+    Collapse Events sharing the same link into the most recently updated one.
+
+    Translations and calendar entries of the dropped rows are moved onto the
+    kept Event unless it already has one for the same language / user.
+    """
+    Event = apps.get_model('events', 'Event')
+    EventTranslation = apps.get_model('events', 'EventTranslation')
+    CalendarEvent = apps.get_model('events', 'CalendarEvent')
+
+    duplicated_links = (
+        Event.objects.values('link')
+        .annotate(total=Count('id'))
+        .filter(total__gt=1)
+        .values_list('link', flat=True)
+    )
+
+    for link in list(duplicated_links):
+        events = list(Event.objects.filter(link=link).order_by('-updated_at', '-id'))
+        keeper, extras = events[0], events[1:]
+        extra_ids = [event.id for event in extras]
+
+        languages = set(
+            EventTranslation.objects.filter(event=keeper).values_list('language_id', flat=True)
+        )
+        for translation in EventTranslation.objects.filter(event_id__in=extra_ids).order_by('id'):
+            if translation.language_id not in languages:
+                translation.event = keeper
+                translation.save(update_fields=['event'])
+                languages.add(translation.language_id)
+
+        users = set(
+            CalendarEvent.objects.filter(event=keeper).values_list('user_id', flat=True)
+        )
+        for entry in CalendarEvent.objects.filter(event_id__in=extra_ids).order_by('id'):
+            if entry.user_id not in users:
+                entry.event = keeper
+                entry.save(update_fields=['event'])
+                users.add(entry.user_id)
+
+        if keeper.deleted_at is not None and any(event.deleted_at is None for event in extras):
+            keeper.deleted_at = None
+            keeper.save(update_fields=['deleted_at'])
+
+        Event.objects.filter(id__in=extra_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_links, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='event',
+            name='link',
+            field=models.TextField(unique=True),
+        ),
+    ]
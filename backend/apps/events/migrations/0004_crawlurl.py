@@ -0,0 +1,35 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_event_link_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CrawlURL',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('url', models.TextField(unique=True)),
+                ('kind', models.IntegerField(choices=[(0, 'Listing'), (1, 'Detail')])),
+                ('category', models.IntegerField(choices=[(0, 'Category 0'), (1, 'Category 1'), (2, 'Category 2'), (3, 'Category 3')])),
+                ('page', models.PositiveIntegerField(default=1)),
+                ('state', models.IntegerField(choices=[(0, 'Pending'), (1, 'Leased'), (2, 'Done'), (3, 'Failed')], default=0)),
+                ('lease_owner', models.CharField(blank=True, default='', max_length=128)),
+                ('lease_expires_at', models.DateTimeField(blank=True, null=True)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_fetched_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Crawl URL',
+                'verbose_name_plural': 'Crawl URLs',
+                'db_table': 'events_crawlurl',
+                'indexes': [models.Index(fields=['state', 'lease_expires_at'], name='idx_crawlurl_state_lease')],
+            },
+        ),
+    ]
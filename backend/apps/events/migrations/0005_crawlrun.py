@@ -0,0 +1,44 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_crawlurl'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CrawlRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('started_at', models.DateTimeField()),
+                ('finished_at', models.DateTimeField()),
+                ('mode', models.CharField(choices=[('stream', 'Stream'), ('worker', 'Worker')], max_length=16)),
+                ('outcome', models.CharField(choices=[('completed', 'Completed'), ('max_runtime', 'Stopped by --max-runtime'), ('circuit_open', 'Aborted: site unavailable')], max_length=16)),
+                ('worker', models.CharField(blank=True, default='', max_length=128)),
+                ('pages', models.PositiveIntegerField(default=0)),
+                ('bytes', models.PositiveBigIntegerField(default=0)),
+                ('pages_per_second', models.FloatField(default=0)),
+                ('fetch_p50_ms', models.FloatField(default=0)),
+                ('fetch_p99_ms', models.FloatField(default=0)),
+                ('parse_ms_per_page', models.FloatField(default=0)),
+                ('db_seconds', models.FloatField(default=0)),
+                ('created', models.PositiveIntegerField(default=0)),
+                ('updated', models.PositiveIntegerField(default=0)),
+                ('unchanged', models.PositiveIntegerField(default=0)),
+                ('skipped', models.PositiveIntegerField(default=0)),
+                ('errors', models.PositiveIntegerField(default=0)),
+                ('report', models.JSONField(default=dict)),
+            ],
+            options={
+                'verbose_name': 'Crawl run',
+                'verbose_name_plural': 'Crawl runs',
+                'db_table': 'events_crawlrun',
+                'ordering': ['-started_at'],
+                'indexes': [models.Index(fields=['started_at'], name='idx_crawlrun_started_at')],
+            },
+        ),
+    ]
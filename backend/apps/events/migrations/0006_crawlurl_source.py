@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_crawlrun'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='crawlurl',
+            name='source',
+            field=models.CharField(default='sxodim', max_length=32),
+        ),
+    ]
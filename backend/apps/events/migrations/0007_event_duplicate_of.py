@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0006_crawlurl_source'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='duplicate_of',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='duplicates', to='events.event'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations
+
+from apps.abstracts.db import postgres_only
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0008_posterimage'),
+    ]
+
+    operations = [
+        postgres_only(
+            [
+                'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+                'CREATE INDEX IF NOT EXISTS idx_event_artist_trgm '
+                'ON events_event USING gin (artist gin_trgm_ops)',
+                'CREATE INDEX IF NOT EXISTS idx_eventtranslation_name_trgm '
+                'ON events_eventtranslation USING gin (name gin_trgm_ops)',
+            ],
+            [
+                'DROP INDEX IF EXISTS idx_eventtranslation_name_trgm',
+                'DROP INDEX IF EXISTS idx_event_artist_trgm',
+            ],
+        ),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:47
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_alive_partial_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedEvent',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('image', models.TextField()),
+                ('date', models.DateField()),
+                ('start_time', models.TimeField()),
+                ('duration', models.PositiveIntegerField()),
+                ('artist', models.TextField()),
+                ('cost', models.PositiveIntegerField(default=0)),
+                ('currency', models.TextField(default='KZT')),
+                ('category', models.IntegerField(choices=[(0, 'Category 0'), (1, 'Category 1'), (2, 'Category 2'), (3, 'Category 3')])),
+                ('address', models.TextField()),
+                ('link', models.TextField()),
+                ('duplicate_of_id', models.BigIntegerField(blank=True, null=True)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('deleted_at', models.DateTimeField(blank=True, null=True)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('poster', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='archived_events', to='events.posterimage')),
+            ],
+            options={
+                'verbose_name': 'Archived event',
+                'verbose_name_plural': 'Archived events',
+                'db_table': 'events_archivedevent',
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedCalendarEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.IntegerField(choices=[(0, 'Status 0'), (1, 'Status 1')])),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_calendar_events', to=settings.AUTH_USER_MODEL)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='calendar_entries', to='events.archivedevent')),
+            ],
+            options={
+                'verbose_name': 'Archived calendar event',
+                'verbose_name_plural': 'Archived calendar events',
+                'db_table': 'events_archivedcalendarevent',
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedEventTranslation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language_id', models.IntegerField(choices=[(0, 'Language 0'), (1, 'Language 1'), (2, 'Language 2'), (3, 'Language 3')])),
+                ('name', models.TextField()),
+                ('description', models.TextField()),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='translations', to='events.archivedevent')),
+            ],
+            options={
+                'verbose_name': 'Archived event translation',
+                'verbose_name_plural': 'Archived event translations',
+                'db_table': 'events_archivedeventtranslation',
+            },
+        ),
+        migrations.AddIndex(
+            model_name='archivedevent',
+            index=models.Index(fields=['date'], name='idx_archivedevent_date'),
+        ),
+        migrations.AddIndex(
+            model_name='archivedcalendarevent',
+            index=models.Index(fields=['event'], name='idx_archivedcalendar_event'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='archivedcalendarevent',
+            unique_together={('user', 'event')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='archivedeventtranslation',
+            unique_together={('event', 'language_id')},
+        ),
+    ]
@@ -5,6 +5,31 @@ from django.db import models
 from apps.abstracts.models import AbstractBaseModel
 
 
+class PosterImage(models.Model):
+    """
+    A mirrored event poster, stored once per distinct content under
+    MEDIA_ROOT with immutable hashed file names, plus WebP thumbnails.
+    """
+
+    sha256 = models.CharField(max_length=64, unique=True)
+    # Original file, relative to MEDIA_ROOT
+    file = models.CharField(max_length=255)
+    width = models.PositiveIntegerField()
+    height = models.PositiveIntegerField()
+    bytes = models.PositiveIntegerField()
+    # {"<width>": "<path relative to MEDIA_ROOT>"} of WebP thumbnails
+    variants = models.JSONField(default=dict)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'events_posterimage'
+        verbose_name = 'Poster Image'
+        verbose_name_plural = 'Poster Images'
+
+    def __str__(self) -> str:
+        return f"{self.sha256[:12]} ({self.width}x{self.height})"
+
+
 class Event(AbstractBaseModel):
     """An event happening in Almaty."""
 
@@ -25,12 +50,33 @@ class Event(AbstractBaseModel):
     currency = models.TextField(default='KZT')
     category = models.IntegerField(choices=Category.choices)
     address = models.TextField()
-    link = models.TextField()
+    link = models.TextField(unique=True)
+    # Set when the same event was found under another link
+    duplicate_of = models.ForeignKey(
+        'self',
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='duplicates',
+    )
+    # Local copy of ``image``, set by the poster mirroring stage
+    poster = models.ForeignKey(
+        PosterImage,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='events',
+    )
 
     class Meta:
         db_table = 'events_event'
         indexes = [
-            models.Index(fields=['deleted_at'], name='idx_event_deleted_at'),
+            # Partial: every listing query skips soft-deleted rows
+            models.Index(
+                fields=['date', 'start_time'],
+                condition=models.Q(deleted_at__isnull=True),
+                name='idx_event_alive_date',
+            ),
         ]
         verbose_name = 'Event'
         verbose_name_plural = 'Events'
@@ -101,3 +147,177 @@ class CalendarEvent(models.Model):
 
     def __str__(self) -> str:
         return f"User {self.user_id} → Event {self.event_id} (status={self.status})"
+
+
+class CrawlURL(models.Model):
+    """A page in the shared crawl frontier of fetch_events workers."""
+
+    class Kind(models.IntegerChoices):
+        LISTING = 0, 'Listing'
+        DETAIL = 1, 'Detail'
+
+    class State(models.IntegerChoices):
+        PENDING = 0, 'Pending'
+        LEASED = 1, 'Leased'
+        DONE = 2, 'Done'
+        FAILED = 3, 'Failed'
+
+    url = models.TextField(unique=True)
+    source = models.CharField(max_length=32, default='sxodim')
+    kind = models.IntegerField(choices=Kind.choices)
+    category = models.IntegerField(choices=Event.Category.choices)
+    page = models.PositiveIntegerField(default=1)
+    state = models.IntegerField(choices=State.choices, default=State.PENDING)
+    lease_owner = models.CharField(max_length=128, blank=True, default='')
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    last_fetched_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'events_crawlurl'
+        indexes = [
+            models.Index(fields=['state', 'lease_expires_at'], name='idx_crawlurl_state_lease'),
+        ]
+        verbose_name = 'Crawl URL'
+        verbose_name_plural = 'Crawl URLs'
+
+    def __str__(self) -> str:
+        return self.url
+
+
+class CrawlRun(models.Model):
+    """Metrics of one fetch_events run, to spot throughput regressions."""
+
+    class Mode(models.TextChoices):
+        STREAM = 'stream', 'Stream'
+        WORKER = 'worker', 'Worker'
+
+    class Outcome(models.TextChoices):
+        COMPLETED = 'completed', 'Completed'
+        MAX_RUNTIME = 'max_runtime', 'Stopped by --max-runtime'
+        CIRCUIT_OPEN = 'circuit_open', 'Aborted: site unavailable'
+
+    started_at = models.DateTimeField()
+    finished_at = models.DateTimeField()
+    mode = models.CharField(max_length=16, choices=Mode.choices)
+    outcome = models.CharField(max_length=16, choices=Outcome.choices)
+    worker = models.CharField(max_length=128, blank=True, default='')
+    pages = models.PositiveIntegerField(default=0)
+    bytes = models.PositiveBigIntegerField(default=0)
+    pages_per_second = models.FloatField(default=0)
+    fetch_p50_ms = models.FloatField(default=0)
+    fetch_p99_ms = models.FloatField(default=0)
+    parse_ms_per_page = models.FloatField(default=0)
+    db_seconds = models.FloatField(default=0)
+    created = models.PositiveIntegerField(default=0)
+    updated = models.PositiveIntegerField(default=0)
+    unchanged = models.PositiveIntegerField(default=0)
+    skipped = models.PositiveIntegerField(default=0)
+    errors = models.PositiveIntegerField(default=0)
+    report = models.JSONField(default=dict)
+
+    class Meta:
+        db_table = 'events_crawlrun'
+        ordering = ['-started_at']
+        indexes = [
+            models.Index(fields=['started_at'], name='idx_crawlrun_started_at'),
+        ]
+        verbose_name = 'Crawl run'
+        verbose_name_plural = 'Crawl runs'
+
+    def __str__(self) -> str:
+        return f"Crawl run #{self.pk} ({self.started_at:%Y-%m-%d %H:%M})"
+
+
+class ArchivedEvent(models.Model):
+    """
+    Cold copy of a past or long soft-deleted Event, moved out of the
+    live table by ``archive_events``. Keeps the original id.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    image = models.TextField()
+    poster = models.ForeignKey(
+        PosterImage,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='archived_events',
+    )
+    date = models.DateField()
+    start_time = models.TimeField()
+    duration = models.PositiveIntegerField()
+    artist = models.TextField()
+    cost = models.PositiveIntegerField(default=0)
+    currency = models.TextField(default='KZT')
+    category = models.IntegerField(choices=Event.Category.choices)
+    address = models.TextField()
+    link = models.TextField()
+    # Plain id: the canonical event may be live or archived
+    duplicate_of_id = models.BigIntegerField(null=True, blank=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    deleted_at = models.DateTimeField(null=True, blank=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'events_archivedevent'
+        indexes = [
+            models.Index(fields=['date'], name='idx_archivedevent_date'),
+        ]
+        verbose_name = 'Archived event'
+        verbose_name_plural = 'Archived events'
+
+    def __str__(self) -> str:
+        return f"Archived event #{self.pk}"
+
+
+class ArchivedEventTranslation(models.Model):
+    """Translation of an ArchivedEvent."""
+
+    event = models.ForeignKey(
+        ArchivedEvent,
+        on_delete=models.CASCADE,
+        related_name='translations',
+    )
+    language_id = models.IntegerField(choices=EventTranslation.Language.choices)
+    name = models.TextField()
+    description = models.TextField()
+
+    class Meta:
+        db_table = 'events_archivedeventtranslation'
+        unique_together = [('event', 'language_id')]
+        verbose_name = 'Archived event translation'
+        verbose_name_plural = 'Archived event translations'
+
+    def __str__(self) -> str:
+        return f"{self.name} (lang={self.language_id})"
+
+
+class ArchivedCalendarEvent(models.Model):
+    """A user's calendar entry for an event that has been archived."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='archived_calendar_events',
+    )
+    event = models.ForeignKey(
+        ArchivedEvent,
+        on_delete=models.CASCADE,
+        related_name='calendar_entries',
+    )
+    status = models.IntegerField(choices=CalendarEvent.Status.choices)
+
+    class Meta:
+        db_table = 'events_archivedcalendarevent'
+        unique_together = [('user', 'event')]
+        indexes = [
+            models.Index(fields=['event'], name='idx_archivedcalendar_event'),
+        ]
+        verbose_name = 'Archived calendar event'
+        verbose_name_plural = 'Archived calendar events'
+
+    def __str__(self) -> str:
+        return f"User {self.user_id} → Archived event {self.event_id} (status={self.status})"
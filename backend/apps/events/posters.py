@@ -0,0 +1,166 @@
+"""
+Poster mirroring stage of ingestion.
+
+Scraped events carry the remote ``og:image`` URL of their poster. This
+stage downloads posters concurrently, stores each distinct image once
+under MEDIA_ROOT/posters (named by the SHA-256 of its content, so files
+never change and can be cached forever) and renders WebP thumbnails at
+POSTER_WIDTHS. Downloading and Pillow work happen on worker threads;
+all database writes stay on the calling thread.
+"""
+
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
+
+import requests
+
+from apps.abstracts.http import HttpClient
+from apps.abstracts.images import (
+    FORMAT_SUFFIXES,
+    content_hash,
+    hashed_path,
+    load_image,
+    webp_variants,
+    write_immutable,
+)
+from apps.events.models import Event, PosterImage
+
+logger = logging.getLogger(__name__)
+
+POSTER_DIR = "posters"
+POSTER_WIDTHS = (320, 640, 1024)
+# Larger downloads are dropped rather than mirrored
+MAX_POSTER_BYTES = 15 * 1024 * 1024
+DEFAULT_WORKERS = 4
+
+
+@dataclass
+class MirroredPoster:
+    """A poster stored on disk, not yet recorded in the database."""
+
+    sha256: str
+    file: str
+    width: int
+    height: int
+    bytes: int
+    variants: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class MirrorStats:
+    mirrored: int = 0  # new PosterImage rows
+    reused: int = 0  # events linked to an already stored image
+    failed: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return {"mirrored": self.mirrored, "reused": self.reused, "failed": self.failed}
+
+
+def download(client: HttpClient, url: str, **kwargs: Any) -> bytes:
+    """
+    Poster bytes, refusing anything that is not a reasonably sized image.
+    ``kwargs`` go to the request (e.g. ``allow_redirects=False``).
+    """
+    response = client.get(url, stream=True, **kwargs)
+    try:
+        response.raise_for_status()
+        if response.is_redirect:
+            raise ValueError(f"Redirected to {response.headers.get('Location')!r}")
+        content_type = response.headers.get("Content-Type", "")
+        if content_type and not content_type.startswith("image/"):
+            raise ValueError(f"Not an image: {content_type}")
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(64 * 1024):
+            size += len(chunk)
+            if size > MAX_POSTER_BYTES:
+                raise ValueError(f"Poster larger than {MAX_POSTER_BYTES} bytes")
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        response.close()
+
+
+def store_poster(data: bytes, widths: Iterable[int] = POSTER_WIDTHS) -> MirroredPoster:
+    """Write the original and its WebP thumbnails under MEDIA_ROOT (thread-safe)."""
+    image = load_image(data)
+    digest = content_hash(data)
+    original = hashed_path(POSTER_DIR, digest, FORMAT_SUFFIXES[image.format])
+    write_immutable(original, data)
+
+    variants: dict[str, str] = {}
+    for width, webp in webp_variants(image, widths).items():
+        path = hashed_path(POSTER_DIR, digest, f"-w{width}.webp")
+        write_immutable(path, webp)
+        variants[str(width)] = path
+
+    return MirroredPoster(
+        sha256=digest,
+        file=original,
+        width=image.width,
+        height=image.height,
+        bytes=len(data),
+        variants=variants,
+    )
+
+
+def mirror_posters(
+    events: Iterable[tuple[int, str]],
+    client: HttpClient,
+    workers: int = DEFAULT_WORKERS,
+) -> MirrorStats:
+    """
+    Link events, given as (id, image URL) pairs, to a mirrored copy of
+    their poster. Each remote URL is fetched at most once; events sharing a URL, or
+    whose URL was already mirrored for another event, reuse it.
+    """
+    stats = MirrorStats()
+    pending: dict[str, list[int]] = {}
+    for event_id, url in events:
+        if url.startswith(("http://", "https://")):
+            pending.setdefault(url, []).append(event_id)
+    if not pending:
+        return stats
+
+    # URLs mirrored for other events in earlier runs
+    known = dict(
+        Event.all_objects.filter(image__in=list(pending), poster__isnull=False)
+        .values_list("image", "poster_id")
+        .distinct()
+    )
+    for url, poster_id in known.items():
+        stats.reused += Event.objects.filter(id__in=pending.pop(url)).update(poster_id=poster_id)
+
+    def fetch(url: str) -> tuple[str, Optional[MirroredPoster]]:
+        try:
+            return url, store_poster(download(client, url))
+        except (requests.RequestException, ValueError, OSError) as e:
+            logger.warning("Poster %s not mirrored: %s", url, e)
+            return url, None
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for url, mirrored in pool.map(fetch, list(pending)):
+            if mirrored is None:
+                stats.failed += 1
+                continue
+            poster, created = PosterImage.objects.get_or_create(
+                sha256=mirrored.sha256,
+                defaults={
+                    "file": mirrored.file,
+                    "width": mirrored.width,
+                    "height": mirrored.height,
+                    "bytes": mirrored.bytes,
+                    "variants": mirrored.variants,
+                },
+            )
+            linked = Event.objects.filter(id__in=pending[url]).update(poster=poster)
+            if created:
+                stats.mirrored += 1
+                linked -= 1
+            stats.reused += linked
+
+    return stats
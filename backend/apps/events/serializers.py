@@ -1,6 +1,18 @@
+from django.conf import settings
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
-from apps.events.models import Event, EventTranslation, CalendarEvent
+from apps.abstracts.images import media_url
+from apps.events.imageproxy import is_proxyable, proxy_url
+from apps.events.models import (
+    ArchivedCalendarEvent,
+    ArchivedEvent,
+    ArchivedEventTranslation,
+    CalendarEvent,
+    Event,
+    EventTranslation,
+    PosterImage,
+)
 
 
 class EventTranslationSerializer(serializers.ModelSerializer):
@@ -16,20 +28,57 @@ class EventTranslationSerializer(serializers.ModelSerializer):
         }
 
 
+class PosterImageSerializer(serializers.ModelSerializer):
+    """Locally mirrored poster: original file plus WebP thumbnails."""
+
+    original = serializers.SerializerMethodField(help_text='URL of the mirrored original image.')
+    variants = serializers.SerializerMethodField(
+        help_text='WebP thumbnail URLs keyed by width in pixels, e.g. {"320": "…", "640": "…"}.'
+    )
+
+    class Meta:
+        model = PosterImage
+        fields = ['original', 'width', 'height', 'variants']
+        extra_kwargs = {
+            'width': {'help_text': 'Original width in pixels.'},
+            'height': {'help_text': 'Original height in pixels.'},
+        }
+
+    def _url(self, path: str) -> str:
+        request = self.context.get('request')
+        url = media_url(path)
+        return request.build_absolute_uri(url) if request else url
+
+    def get_original(self, obj: PosterImage) -> str:
+        return self._url(obj.file)
+
+    @extend_schema_field({'type': 'object', 'additionalProperties': {'type': 'string'}})
+    def get_variants(self, obj: PosterImage) -> dict[str, str]:
+        return {width: self._url(path) for width, path in obj.variants.items()}
+
+
 class EventSerializer(serializers.ModelSerializer):
     """Serializer for Event with nested translations."""
 
     translations = EventTranslationSerializer(many=True, read_only=True)
+    poster = PosterImageSerializer(
+        read_only=True,
+        allow_null=True,
+        help_text='Local copy of the poster (null until mirrored; fall back to `image_srcset`).',
+    )
+    image_srcset = serializers.SerializerMethodField(
+        help_text='srcset of the remote poster resized through the image proxy ("" if none).'
+    )
 
     class Meta:
         model = Event
         fields = [
-            'id', 'image', 'date', 'start_time', 'duration',
+            'id', 'image', 'poster', 'image_srcset', 'date', 'start_time', 'duration',
             'artist', 'cost', 'currency', 'category', 'address',
             'link', 'created_at', 'updated_at', 'translations',
         ]
         extra_kwargs = {
-            'image': {'help_text': 'URL or path to the event poster image.'},
+            'image': {'help_text': 'Original (remote) URL of the event poster image.'},
             'date': {'help_text': 'Event date (YYYY-MM-DD).'},
             'start_time': {'help_text': 'Event start time (HH:MM:SS).'},
             'duration': {'help_text': 'Duration in minutes (≥ 1).'},
@@ -42,6 +91,17 @@ class EventSerializer(serializers.ModelSerializer):
         }
 
 
+    def get_image_srcset(self, obj: Event) -> str:
+        if not is_proxyable(obj.image):
+            return ''
+        request = self.context.get('request')
+        entries = []
+        for width in settings.IMAGE_PROXY_WIDTHS:
+            url = proxy_url(obj.pk, obj.image, width)
+            entries.append(f"{request.build_absolute_uri(url) if request else url} {width}w")
+        return ', '.join(entries)
+
+
 class CalendarEventSerializer(serializers.ModelSerializer):
     """Serializer for user calendar entries."""
 
@@ -51,6 +111,59 @@ class CalendarEventSerializer(serializers.ModelSerializer):
         read_only_fields = ['user']
         extra_kwargs = {
             'user': {'help_text': 'Owner user ID (auto-set from token, read-only).'},
-            'event': {'help_text': 'ID of the saved event.'},
+            # Past events are soft-deleted but stay on users' calendars
+            'event': {'help_text': 'ID of the saved event.', 'queryset': Event.all_objects.all()},
+            'status': {'help_text': 'Calendar status (0=saved, 1=attending).'},
+        }
+
+
+class ArchivedEventTranslationSerializer(serializers.ModelSerializer):
+    """Nested serializer for archived event translations."""
+
+    class Meta:
+        model = ArchivedEventTranslation
+        fields = ['language_id', 'name', 'description']
+        extra_kwargs = {
+            'language_id': {'help_text': 'Language identifier (0=en, 1=ru, 2=kz, 3=tr).'},
+            'name': {'help_text': 'Translated event name.'},
+            'description': {'help_text': 'Translated event description.'},
+        }
+
+
+class ArchivedEventSerializer(serializers.ModelSerializer):
+    """Serializer for an archived (past) event with nested translations."""
+
+    translations = ArchivedEventTranslationSerializer(many=True, read_only=True)
+    poster = PosterImageSerializer(read_only=True, allow_null=True, help_text='Local copy of the poster, if mirrored.')
+
+    class Meta:
+        model = ArchivedEvent
+        fields = [
+            'id', 'image', 'poster', 'date', 'start_time', 'duration',
+            'artist', 'cost', 'currency', 'category', 'address', 'link', 'translations',
+        ]
+        extra_kwargs = {
+            'image': {'help_text': 'Original (remote) URL of the event poster image.'},
+            'date': {'help_text': 'Event date (YYYY-MM-DD).'},
+            'start_time': {'help_text': 'Event start time (HH:MM:SS).'},
+            'duration': {'help_text': 'Duration in minutes (≥ 1).'},
+            'artist': {'help_text': 'Performing artist or organiser name.'},
+            'cost': {'help_text': 'Ticket price (0 = free).'},
+            'currency': {'help_text': 'Price currency code, e.g. KZT.'},
+            'category': {'help_text': 'Event category (0=Concerts, 1=Exhibitions, 2=Sport, 3=Festivals).'},
+            'address': {'help_text': 'Venue address.'},
+            'link': {'help_text': 'External link for tickets or details.'},
+        }
+
+
+class ArchivedCalendarEventSerializer(serializers.ModelSerializer):
+    """A calendar entry for an archived event, with the event inlined."""
+
+    event = ArchivedEventSerializer(read_only=True)
+
+    class Meta:
+        model = ArchivedCalendarEvent
+        fields = ['id', 'event', 'status']
+        extra_kwargs = {
             'status': {'help_text': 'Calendar status (0=saved, 1=attending).'},
         }
@@ -0,0 +1,14 @@
+from apps.events.sources.base import EventSource, ListingPageError
+from apps.events.sources.sxodim import SxodimSource
+
+# Sources fetch_events can ingest from, by name
+SOURCES: dict[str, type[EventSource]] = {
+    SxodimSource.name: SxodimSource,
+}
+
+
+def get_source(name: str) -> EventSource:
+    return SOURCES[name]()
+
+
+__all__ = ["EventSource", "ListingPageError", "SOURCES", "SxodimSource", "get_source"]
@@ -0,0 +1,96 @@
+"""
+Source-adapter interface for the event ingestion engine.
+"""
+
+from __future__ import annotations
+
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Iterator, Optional
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+# Fetches and parses a page; None when it could not be fetched
+FetchPage = Callable[[str], Optional[BeautifulSoup]]
+
+
+class ListingPageError(Exception):
+    """A listing page could not be fetched, so the listing is incomplete."""
+
+
+class EventSource(ABC):
+    """
+    A ticketing site events are ingested from.
+
+    An adapter only knows where a site's listings are and how to read its
+    pages. Fetching, rate limiting, retries, concurrency and batched
+    writes are shared by every source (see apps.events.ingestion).
+    Adapters must implement the abstract methods; one that misses any
+    fails when it is instantiated, not halfway through a crawl.
+    """
+
+    # Unique short name, stored with frontier URLs and in run reports
+    name = ""
+    base_url = ""
+    headers: dict[str, str] = {}
+    # Default minimum delay between requests to the site, in seconds
+    min_interval = 1.0
+
+    @abstractmethod
+    def listings(self) -> list[tuple[str, int]]:
+        """(listing URL, Event.Category) pairs a crawl starts from."""
+
+    @abstractmethod
+    def map_category(self, slug: str) -> int:
+        """Event.Category of a site-specific listing or category slug."""
+
+    @abstractmethod
+    def scrape_listing(self, soup: BeautifulSoup) -> list[str]:
+        """Event detail page URLs on a listing page, in page order."""
+
+    @abstractmethod
+    def parse_event(self, html: str, url: str, category: int) -> Optional[dict[str, Any]]:
+        """
+        Build the event record from a detail page, or None if the page
+        is not a usable event. Records carry the Event columns plus
+        ``name_ru`` and ``description_ru``.
+        """
+
+    def next_page_url(self, soup: BeautifulSoup, listing_url: str, page: int) -> Optional[str]:
+        """Resolve the URL of the given listing page number, or None on the last page."""
+        rel_next = soup.find(["a", "link"], rel="next", href=True)
+        if rel_next:
+            return urljoin(listing_url, rel_next["href"])
+
+        for a_tag in soup.find_all("a", href=True):
+            if re.search(rf"[?&]page={page}(?:&|$)", a_tag["href"]):
+                return urljoin(listing_url, a_tag["href"])
+        return None
+
+    def iter_listing(self, fetch_page: FetchPage, listing_url: str, max_pages: int) -> Iterator[str]:
+        """
+        Follow a listing's pagination and yield event URLs as they appear.
+        Stops when a page brings no new links or after max_pages pages;
+        raises ListingPageError when a page cannot be fetched.
+        """
+        seen: set[str] = set()
+        page_url: Optional[str] = listing_url
+
+        for page in range(1, max_pages + 1):
+            if page_url is None:
+                return
+
+            soup = fetch_page(page_url)
+            if soup is None:
+                raise ListingPageError(f"Cannot fetch listing page {page_url}")
+
+            new_links = [link for link in self.scrape_listing(soup) if link not in seen]
+            if not new_links:
+                return
+
+            for link in new_links:
+                seen.add(link)
+                yield link
+
+            page_url = self.next_page_url(soup, listing_url, page + 1)
@@ -0,0 +1,109 @@
+"""
+sxodim.com: the Almaty event listings the project started with.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import time as dtime
+from typing import Any, Optional
+
+from bs4 import BeautifulSoup
+
+from apps.events.extraction import extract_event_page
+from apps.events.sources.base import EventSource
+
+BASE_URL = "https://sxodim.com"
+ALMATY_URL = f"{BASE_URL}/almaty"
+
+# Category mapping: sxodim URL slug -> Event.Category int
+CATEGORY_MAP: dict[str, int] = {
+    "kontserty": 1,                   # concerts
+    "koncerty-v-everjazz": 1,         # EverJazz concerts
+    "concerty-dvorec-respubliki": 1,  # Palace of Republic concerts
+    "vystavki": 2,                    # exhibitions
+    "screening": 2,                   # movie screenings
+    "standup": 1,                     # stand-up shows
+    "vecherinki": 1,                  # parties
+    "teatr": 2,                       # theatre
+    "razvlecheniya": 3,               # entertainment
+    "detskie-meropriyatiya": 3,       # kids events
+}
+
+LISTING_SLUGS = [
+    "kontserty",
+    "koncerty-v-everjazz",
+    "concerty-dvorec-respubliki",
+    "vystavki",
+    "standup",
+    "vecherinki",
+]
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept-Language": "ru-RU,ru;q=0.9,en;q=0.8",
+}
+
+_EVENT_PATH_RE = re.compile(r"^(/almaty/event/[\w-]+)$")
+_EVENT_URL_RE = re.compile(r"^https?://sxodim\.com/almaty/event/[\w-]+$")
+
+
+class SxodimSource(EventSource):
+    name = "sxodim"
+    base_url = BASE_URL
+    headers = HEADERS
+    min_interval = 1.0
+
+    def listings(self) -> list[tuple[str, int]]:
+        return [
+            (f"{ALMATY_URL}/events/{slug}", self.map_category(slug))
+            for slug in LISTING_SLUGS
+        ]
+
+    def map_category(self, slug: str) -> int:
+        return CATEGORY_MAP.get(slug, 1)
+
+    def scrape_listing(self, soup: BeautifulSoup) -> list[str]:
+        event_links: list[str] = []
+
+        for a_tag in soup.find_all("a", href=True):
+            href = a_tag["href"]
+
+            if _EVENT_PATH_RE.match(href):
+                full_url = f"{BASE_URL}{href}"
+                if full_url not in event_links:
+                    event_links.append(full_url)
+
+            elif _EVENT_URL_RE.match(href):
+                if href not in event_links:
+                    event_links.append(href)
+
+        return event_links
+
+    def next_page_url(self, soup: BeautifulSoup, listing_url: str, page: int) -> Optional[str]:
+        # Listings without pagination links still answer ?page=N
+        return super().next_page_url(soup, listing_url, page) or f"{listing_url}?page={page}"
+
+    def parse_event(self, html: str, url: str, category: int) -> Optional[dict[str, Any]]:
+        details = extract_event_page(html, BASE_URL)
+        title = details.title
+        if not title:
+            return None
+
+        return {
+            "image": details.image,
+            "date": details.date,  # important: do not auto-substitute today's date
+            "start_time": details.start_time or dtime(19, 0),
+            "duration": 120,
+            "artist": title,
+            "cost": details.cost,
+            "currency": "KZT",
+            "category": category,
+            "address": details.address or "Алматы",
+            "link": url,
+            "name_ru": title,
+            "description_ru": details.description or f"Мероприятие в Алматы. {title}.",
+        }
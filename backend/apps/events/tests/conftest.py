@@ -0,0 +1,29 @@
+from datetime import date, time
+from typing import Any, Callable
+
+import pytest
+
+from apps.events.models import Event
+
+
+@pytest.fixture
+def make_event(db: Any) -> Callable[..., Event]:
+    """Create an Event; keyword arguments override the defaults."""
+    counter = iter(range(1, 1_000_000))
+
+    def make(**fields: Any) -> Event:
+        number = next(counter)
+        values = {
+            "image": f"https://example.com/poster-{number}.jpg",
+            "date": date(2026, 11, 1),
+            "start_time": time(19, 0),
+            "duration": 120,
+            "artist": "Artist",
+            "category": Event.Category.CATEGORY_0,
+            "address": "Abay Opera House",
+            "link": f"https://example.com/event/{number}",
+        }
+        values.update(fields)
+        return Event.objects.create(**values)
+
+    return make
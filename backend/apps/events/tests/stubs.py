@@ -0,0 +1,84 @@
+"""
+In-memory stand-ins for a ticketing site: an EventSource over a dict of
+pages and an HttpClient that serves them without touching the network.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Iterable, Optional
+
+import requests
+from bs4 import BeautifulSoup
+
+from apps.abstracts.http import CircuitOpenError
+from apps.events.sources import EventSource
+
+
+def listing_page(links: Iterable[str], next_url: Optional[str] = None) -> str:
+    anchors = "".join(f'<a class="event" href="{link}">event</a>' for link in links)
+    pager = f'<a rel="next" href="{next_url}">next</a>' if next_url else ""
+    return f"<html><body>{anchors}{pager}</body></html>"
+
+
+def event_page(title: str) -> str:
+    return f"<html><body><h1>{title}</h1></body></html>"
+
+
+class StubSource(EventSource):
+    """A site whose listings are given up front; events are pages with an <h1>."""
+
+    min_interval = 0.0
+
+    def __init__(self, name: str, listings: list[tuple[str, int]]) -> None:
+        self.name = name
+        self._listings = listings
+
+    def listings(self) -> list[tuple[str, int]]:
+        return self._listings
+
+    def map_category(self, slug: str) -> int:
+        return 0
+
+    def scrape_listing(self, soup: BeautifulSoup) -> list[str]:
+        return [a["href"] for a in soup.select("a.event")]
+
+    def parse_event(self, html: str, url: str, category: int) -> Optional[dict[str, Any]]:
+        h1 = BeautifulSoup(html, "lxml").find("h1")
+        if h1 is None:
+            return None
+        return {"link": url, "category": category, "name_ru": h1.get_text(strip=True)}
+
+
+class StubClient:
+    """
+    Serves ``pages`` by URL (404 for anything else). URLs in ``errors``
+    raise a connection error, URLs in ``circuit_open`` raise
+    CircuitOpenError as an open breaker would.
+    """
+
+    def __init__(
+        self,
+        pages: dict[str, str],
+        errors: Iterable[str] = (),
+        circuit_open: Iterable[str] = (),
+    ) -> None:
+        self.pages = pages
+        self.errors = set(errors)
+        self.circuit_open = set(circuit_open)
+        self.requested: list[str] = []
+        self._lock = threading.Lock()
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        with self._lock:
+            self.requested.append(url)
+        if url in self.circuit_open:
+            raise CircuitOpenError(f"Circuit open for {url}")
+        if url in self.errors:
+            raise requests.ConnectionError(f"Connection refused: {url}")
+        response = requests.Response()
+        response.url = url
+        response.status_code = 200 if url in self.pages else 404
+        response._content = self.pages.get(url, "not found").encode("utf-8")
+        response.encoding = "utf-8"
+        return response
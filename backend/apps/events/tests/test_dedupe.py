@@ -0,0 +1,55 @@
+from datetime import date, timedelta
+
+from django.utils import timezone
+
+from apps.events.archiving import archivable_events, archive_chunk
+from apps.events.dedupe import Candidate, dedupe_events, find_duplicates
+from apps.events.models import ArchivedEvent, Event
+
+DAY = date(2026, 11, 1)
+
+
+def test_find_duplicates_merges_similar_titles_at_the_same_venue():
+    candidates = [
+        Candidate.from_row(2, DAY, "ул. Абая, 1, Алматы", "Jazz Night!"),
+        Candidate.from_row(1, DAY, "Абая 1", "Jazz night"),
+        Candidate.from_row(3, DAY, "Абая 1", "Stand Up"),
+        Candidate.from_row(4, DAY, "Достык 5", "Jazz Night"),
+    ]
+
+    duplicates, _ = find_duplicates(candidates)
+
+    assert duplicates == {2: 1}
+
+
+def test_find_duplicates_skips_events_without_a_venue():
+    candidates = [
+        Candidate.from_row(1, DAY, "", "Jazz Night"),
+        Candidate.from_row(2, DAY, "Алматы, Казахстан", "Jazz Night"),
+    ]
+
+    assert find_duplicates(candidates) == ({}, 0)
+
+
+def test_dedupe_events_leaves_events_without_address_alone(make_event):
+    events = [make_event(artist="Jazz Night", address="") for _ in range(2)]
+
+    assert dedupe_events([event.id for event in events]) == 0
+    assert not Event.all_objects.filter(duplicate_of__isnull=False).exists()
+
+
+def test_duplicates_are_archived_with_their_canonical_event(make_event):
+    canonical = make_event(artist="Jazz Night")
+    duplicate = make_event(artist="Jazz Night")
+    assert dedupe_events([duplicate.id]) == 1
+    canonical.soft_delete()
+    Event.all_objects.filter(id=canonical.id).update(
+        deleted_at=timezone.now() - timedelta(days=100)
+    )
+
+    assert list(archivable_events(30).values_list("id", flat=True)) == [canonical.id]
+    stats = archive_chunk([canonical.id])
+
+    assert stats.events == 2
+    assert not Event.all_objects.exists()
+    assert ArchivedEvent.objects.get(id=duplicate.id).duplicate_of_id == canonical.id
@@ -0,0 +1,138 @@
+import json
+import os
+from datetime import date, time
+
+import pytest
+from bs4 import BeautifulSoup
+from django.utils import timezone
+
+from apps.abstracts.archive import HttpArchive
+from apps.events.extraction import extract_event_details, extract_event_page
+from apps.events.management.commands.bench_extraction import _legacy_extract
+
+BASE_URL = "https://sxodim.com"
+CORPUS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "corpus", "sxodim_sample")
+
+# slug: (title, date, start_time, cost, address)
+CORPUS_EVENTS = {
+    "vecherinka-retro": (
+        "Ретро-вечеринка 80-х", date(2025, 1, 15), time(22, 0), 4000,
+        "Bar 1985, ул. Кабанбай батыра, 85",
+    ),
+    "dvorec-respubliki-gala": (
+        "Гала-концерт во Дворце Республики", date(2026, 12, 12), time(19, 0), 5000,
+        "Дворец Республики, пр. Достык, 56",
+    ),
+    "kontserty-orkestr": (
+        "Симфонический оркестр: Чайковский", date(2027, 3, 3), time(19, 0), 7500,
+        "Казахская государственная филармония, ул. Калдаякова, 35",
+    ),
+    "everjazz-quartet": (
+        "EverJazz Quartet", date(2026, 12, 5), time(19, 30), 12000,
+        "EverJazz, ул. Гоголя, 39",
+    ),
+    "vystavka-kasteev-grafika": (
+        "Выставка «Графика степи»", date(2026, 12, 1), time(10, 0), 1500,
+        "Музей им. Кастеева, мкр. Коктем-3, 22/1",
+    ),
+    "standup-open-mic": (
+        "Stand Up: Open Mic", date(2026, 11, 20), time(21, 0), 0,
+        "Stand Up Club Almaty, ул. Панфилова, 98",
+    ),
+    "koncert-ginger-night": (
+        "Ginger Night: живой концерт", date(2026, 11, 27), time(20, 0), 9000,
+        "Ginger, пр. Достык, 132Б",
+    ),
+    "koncert-bez-daty": ("Концерт: дата уточняется", None, None, 0, ""),
+}
+
+
+@pytest.fixture(autouse=True)
+def almaty(settings, monkeypatch):
+    settings.TIME_ZONE = "Asia/Almaty"
+    # Dates without a year roll forward relative to today
+    monkeypatch.setattr(timezone, "localdate", lambda *args, **kwargs: date(2026, 10, 19))
+
+
+def corpus_pages():
+    for entry in HttpArchive(CORPUS).entries():
+        if "/event/" in entry["url"]:
+            yield entry["url"].rsplit("/", 1)[1], entry["body"].decode("utf-8")
+
+
+def page(head="", body=""):
+    return f"<html><head>{head}</head><body>{body}</body></html>"
+
+
+def ld_event(**fields):
+    event = {"@context": "https://schema.org", "@type": "Event", **fields}
+    return f'<script type="application/ld+json">{json.dumps(event)}</script>'
+
+
+def test_corpus_covers_every_expected_event():
+    assert {slug for slug, _ in corpus_pages()} == set(CORPUS_EVENTS)
+
+
+@pytest.mark.parametrize("slug, html", list(corpus_pages()))
+def test_corpus_event_pages(slug, html):
+    details = extract_event_page(html, BASE_URL)
+
+    assert (
+        details.title, details.date, details.start_time, details.cost, details.address
+    ) == CORPUS_EVENTS[slug]
+
+
+@pytest.mark.parametrize("slug, html", list(corpus_pages()))
+def test_corpus_matches_legacy_extractors(slug, html):
+    soup = BeautifulSoup(html, "lxml")
+
+    assert extract_event_details(soup, BASE_URL) == _legacy_extract(soup)
+
+
+def test_fallback_keeps_h1_title_over_og_title():
+    html = page(
+        head='<meta property="og:title" content="Jazz Night | Давай Сходим!">'
+        '<meta property="event:start_time" content="2026-11-27T20:00">',
+        body="<h1>Jazz Night</h1><p>Стоимость: 3000 тг</p>",
+    )
+
+    details = extract_event_page(html, BASE_URL)
+
+    assert details.title == "Jazz Night"
+    assert (details.date, details.start_time, details.cost) == (date(2026, 11, 27), time(20, 0), 3000)
+
+
+def test_structured_fast_path_keeps_h1_title_over_ld_name():
+    html = page(
+        head=ld_event(
+            name="JAZZ NIGHT — билеты",
+            startDate="2026-11-27T20:00",
+            image="https://sxodim.com/poster.jpg",
+            offers={"price": "3000"},
+            location={"name": "Ginger", "address": "пр. Достык, 132Б"},
+        ),
+        body="<h1>Jazz Night</h1>",
+    )
+
+    details = extract_event_page(html, BASE_URL)
+
+    assert details.title == "Jazz Night"
+    assert details.address == "Ginger, пр. Достык, 132Б"
+
+
+@pytest.mark.parametrize(
+    "start, expected_date, expected_time",
+    [
+        ("2026-11-27T20:00", date(2026, 11, 27), time(20, 0)),
+        ("2026-11-27T20:00:00+05:00", date(2026, 11, 27), time(20, 0)),
+        ("2026-11-27T15:00:00Z", date(2026, 11, 27), time(20, 0)),
+        # 21:00 UTC is already the next morning in Almaty
+        ("2026-11-27T21:00:00Z", date(2026, 11, 28), time(2, 0)),
+    ],
+)
+def test_structured_start_is_local_wall_clock_time(start, expected_date, expected_time):
+    html = page(head=ld_event(name="Jazz Night", startDate=start), body="<h1>Jazz Night</h1>")
+
+    details = extract_event_page(html, BASE_URL)
+
+    assert (details.date, details.start_time) == (expected_date, expected_time)
@@ -0,0 +1,85 @@
+from datetime import date, time
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from apps.events.management.commands.fetch_events import Command
+from apps.events.metrics import CrawlMetrics
+from apps.events.models import CrawlRun, Event, EventTranslation
+from apps.events.tests.test_extraction import CORPUS
+
+pytestmark = pytest.mark.django_db
+
+LINK = "https://example.com/event/1"
+
+
+def record(link=LINK, title="Jazz Night", cost=0):
+    return {
+        "image": "https://example.com/poster.jpg",
+        "date": date(2026, 11, 1),
+        "start_time": time(19, 0),
+        "duration": 120,
+        "artist": title,
+        "cost": cost,
+        "currency": "KZT",
+        "category": Event.Category.CATEGORY_0,
+        "address": "Abay Opera House",
+        "link": link,
+        "name_ru": title,
+        "description_ru": "",
+    }
+
+
+def replay_corpus(tmp_path):
+    call_command(
+        "fetch_events",
+        source=["sxodim"],
+        replay=CORPUS,
+        skip_posters=True,
+        checkpoint=str(tmp_path / "checkpoint.json"),
+        stdout=StringIO(),
+    )
+
+
+@pytest.fixture
+def command():
+    command = Command(stdout=StringIO())
+    command.metrics = CrawlMetrics()
+    command.counts = {"duplicates": 0}
+    return command
+
+
+def test_flush_counts_a_link_scraped_twice_once(command):
+    batch = [record(cost=1000), record(link="https://example.com/event/2"), record(cost=2000)]
+
+    assert command._flush_events(batch) == (2, 0, 0)
+    assert Event.objects.get(link=LINK).cost == 2000
+    assert command.stdout.getvalue().count("[CREATED]") == 2
+
+
+def test_flush_counts_updates_of_a_repeated_link_once(command):
+    command._flush_events([record()])
+
+    assert command._flush_events([record(cost=1000), record(cost=2000)]) == (0, 1, 0)
+    assert command._flush_events([record(cost=1000), record(cost=2000)]) == (0, 0, 1)
+    assert Event.objects.get().cost == 2000
+    assert EventTranslation.objects.count() == 3
+
+
+def test_run_is_recorded_with_counters_and_timings(tmp_path):
+    replay_corpus(tmp_path)
+    replay_corpus(tmp_path)
+
+    first, second = CrawlRun.objects.order_by("started_at")
+    # 13 listing pages and 8 event pages, one of them without a date
+    assert (first.mode, first.outcome, first.pages) == ("stream", "completed", 21)
+    assert (first.created, first.updated, first.unchanged, first.skipped, first.errors) == (7, 0, 0, 1, 0)
+    assert (second.created, second.unchanged, second.skipped) == (0, 7, 1)
+    assert first.report["events"]["created"] == 7
+    assert first.bytes > 0
+    assert first.finished_at >= first.started_at
+    assert first.pages_per_second > 0
+    assert 0 < first.fetch_p50_ms <= first.fetch_p99_ms
+    assert first.parse_ms_per_page > 0
+    assert first.db_seconds > 0
@@ -0,0 +1,172 @@
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import textwrap
+from datetime import timedelta
+
+import pytest
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from apps.events import frontier
+from apps.events.models import CrawlURL
+
+pytestmark = pytest.mark.django_db
+
+A = "https://a.example"
+
+# Claims batches from the database file given on the command line until
+# the frontier is empty, after the test says go; prints the ids it got
+CLAIMER = textwrap.dedent(
+    """
+    import json, sys
+    import django
+    import settings.env.local as local
+
+    local.DATABASES["default"]["NAME"] = sys.argv[1]
+    django.setup()
+    from apps.events import frontier
+
+    print("ready", flush=True)
+    sys.stdin.readline()
+    claimed = []
+    while True:
+        batch = frontier.claim(sys.argv[2], 3, 60)
+        if not batch:
+            break
+        claimed += [row.id for row in batch]
+        frontier.complete(sys.argv[2], [row.id for row in batch])
+    print(json.dumps(claimed), flush=True)
+    """
+)
+
+
+def enqueue(count):
+    frontier.enqueue("a", [f"{A}/e/{n}" for n in range(count)], CrawlURL.Kind.DETAIL, 0)
+    return list(CrawlURL.objects.order_by("id").values_list("id", flat=True))
+
+
+def expire(ids):
+    CrawlURL.objects.filter(id__in=ids).update(lease_expires_at=timezone.now() - timedelta(seconds=1))
+
+
+def test_claims_do_not_overlap_and_respect_the_limit():
+    ids = enqueue(5)
+
+    first = frontier.claim("w1", 3, 60)
+    second = frontier.claim("w2", 3, 60)
+
+    assert [row.id for row in first] == ids[:3]
+    assert [row.id for row in second] == ids[3:]
+    assert frontier.claim("w3", 3, 60) == []
+    assert all(row.attempts == 1 for row in first + second)
+
+
+def test_expired_leases_are_reclaimed():
+    ids = enqueue(2)
+    frontier.claim("crashed", 10, 60)
+    assert frontier.claim("w2", 10, 60) == []
+
+    expire(ids)
+    reclaimed = frontier.claim("w2", 10, 60)
+
+    assert [row.id for row in reclaimed] == ids
+    assert {row.lease_owner for row in reclaimed} == {"w2"}
+    assert all(row.attempts == 2 for row in reclaimed)
+    # The crashed worker's late writes no longer count
+    assert frontier.complete("crashed", ids) == 0
+    assert frontier.complete("w2", ids) == 2
+
+
+def test_renew_only_extends_the_callers_own_leases():
+    ids = enqueue(2)
+    frontier.claim("w1", 1, 60)
+    frontier.claim("w2", 1, 60)
+    before = dict(CrawlURL.objects.values_list("id", "lease_expires_at"))
+
+    assert frontier.renew("w2", ids, 600) == 1
+    assert frontier.renew("w3", ids, 600) == 0
+
+    after = dict(CrawlURL.objects.values_list("id", "lease_expires_at"))
+    assert after[ids[0]] == before[ids[0]]
+    assert after[ids[1]] > before[ids[1]]
+
+
+def test_fail_backs_off_and_then_gives_up():
+    [url_id] = enqueue(1)
+
+    for attempt in (1, 2):
+        [row] = frontier.claim("w1", 1, 60)
+        assert row.attempts == attempt
+        started = timezone.now()
+        assert frontier.fail("w1", [url_id], max_attempts=3, backoff_seconds=10) == 1
+        row.refresh_from_db()
+        # Not claimable until the back-off, which doubles, has passed
+        assert row.lease_owner == ""
+        assert row.lease_expires_at - started >= timedelta(seconds=10 * attempt)
+        assert frontier.claim("w1", 1, 60) == []
+        assert frontier.has_leased()
+        expire([url_id])
+
+    frontier.claim("w1", 1, 60)
+    assert frontier.fail("w1", [url_id], max_attempts=3, backoff_seconds=10) == 0
+    row = CrawlURL.objects.get()
+    assert (row.state, row.attempts) == (CrawlURL.State.FAILED, 3)
+    assert frontier.claim("w1", 1, 60) == []
+    assert not frontier.has_leased()
+
+
+def test_release_hands_back_rows_without_counting_the_attempt():
+    ids = enqueue(2)
+    frontier.claim("w1", 2, 60)
+
+    assert frontier.release("w1", ids) == 2
+
+    assert [row.attempts for row in frontier.claim("w2", 2, 60)] == [1, 1]
+
+
+@pytest.mark.skipif(
+    settings.DATABASES["default"]["ENGINE"] != "django.db.backends.sqlite3",
+    reason="Concurrent claims through separate SQLite processes",
+)
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_processes_never_claim_the_same_url(tmp_path):
+    ids = enqueue(60)
+    path = str(tmp_path / "frontier.sqlite3")
+    # A file copy of the test database, schema and frontier included
+    connection.ensure_connection()
+    with sqlite3.connect(path) as target:
+        connection.connection.backup(target)
+
+    script = tmp_path / "claimer.py"
+    script.write_text(CLAIMER)
+    env = {**os.environ, "PYTHONPATH": str(settings.BASE_DIR)}
+    workers = [
+        subprocess.Popen(
+            [sys.executable, str(script), path, f"w{n}"],
+            cwd=settings.BASE_DIR,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        for n in range(4)
+    ]
+    for worker in workers:
+        assert worker.stdout.readline().strip() == "ready"
+    # Start them together, so their claims contend for the write lock
+    for worker in workers:
+        worker.stdin.write("go\n")
+        worker.stdin.flush()
+    claimed = []
+    for worker in workers:
+        output, _ = worker.communicate(timeout=60)
+        assert worker.returncode == 0
+        claimed.append(json.loads(output))
+
+    every_claim = [url_id for worker_ids in claimed for url_id in worker_ids]
+    assert sorted(every_claim) == ids
+    assert sum(1 for worker_ids in claimed if worker_ids) > 1
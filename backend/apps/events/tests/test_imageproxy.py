@@ -0,0 +1,133 @@
+import io
+import os
+from datetime import date
+
+import pytest
+import requests
+from PIL import Image
+
+from apps.events import imageproxy
+
+IMAGE_URL = "https://sxodim.com/uploads/posts/poster.jpg"
+
+
+def _jpeg(width: int = 800, height: int = 450) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 40, 40)).save(buffer, "JPEG")
+    return buffer.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def image_cache(settings, tmp_path):
+    settings.IMAGE_PROXY_CACHE_DIR = str(tmp_path / "image_cache")
+    settings.IMAGE_PROXY_ALLOWED_HOSTS = ("sxodim.com",)
+    imageproxy.get_cache.cache_clear()
+    yield
+    imageproxy.get_cache.cache_clear()
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Fake upstream: records the URLs fetched and serves a JPEG."""
+    fetched = []
+
+    def download(client, url, **kwargs):
+        fetched.append(url)
+        assert kwargs.get("allow_redirects") is False
+        return _jpeg()
+
+    monkeypatch.setattr(imageproxy, "download", download)
+    return fetched
+
+
+def image_url(event, width):
+    return f"/api/v1/events/events/{event.pk}/image/?w={width}"
+
+
+def test_rejects_width_not_in_settings(client, make_event, upstream):
+    event = make_event(image=IMAGE_URL)
+
+    response = client.get(image_url(event, 500))
+
+    assert response.status_code == 400
+    assert upstream == []
+
+
+def test_serves_webp_and_answers_matching_etag_with_304(client, make_event, upstream):
+    event = make_event(image=IMAGE_URL)
+
+    response = client.get(image_url(event, 320))
+    assert response.status_code == 200
+    assert response["Content-Type"] == "image/webp"
+    assert Image.open(io.BytesIO(b"".join(response.streaming_content))).width == 320
+
+    etag = response["ETag"]
+    response = client.get(image_url(event, 320), HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+    assert upstream == [IMAGE_URL]
+
+
+def test_serves_posters_of_soft_deleted_past_events(client, make_event, upstream):
+    event = make_event(image=IMAGE_URL, date=date(2020, 1, 1))
+    event.soft_delete()
+
+    response = client.get(image_url(event, 320))
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "image/webp"
+
+
+def test_upstream_failure_is_a_generic_502(client, make_event, monkeypatch):
+    event = make_event(image=IMAGE_URL)
+
+    def download(client, url, **kwargs):
+        raise requests.ConnectionError("connect to 10.0.0.5 refused")
+
+    monkeypatch.setattr(imageproxy, "download", download)
+    response = client.get(image_url(event, 320))
+
+    assert response.status_code == 502
+    assert response.json() == {"detail": "Image unavailable."}
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "http://127.0.0.1/admin/",
+        "http://169.254.169.254/latest/meta-data/",
+        "https://sxodim.com.evil.example/poster.jpg",
+        "file:///etc/passwd",
+    ],
+)
+def test_hosts_outside_the_allowlist_are_never_fetched(client, make_event, upstream, url):
+    event = make_event(image=url)
+
+    response = client.get(image_url(event, 320))
+
+    assert response.status_code == 404
+    assert upstream == []
+
+
+def test_allowlist_includes_subdomains():
+    assert imageproxy.is_proxyable("https://cdn.sxodim.com/a.jpg")
+    assert not imageproxy.is_proxyable("https://notsxodim.com/a.jpg")
+
+
+def test_file_evicted_before_open_is_produced_again(upstream, monkeypatch):
+    cache = imageproxy.get_cache()
+    get_or_create = cache.get_or_create
+    evicted = []
+
+    def evicting_get_or_create(key, produce):
+        path = get_or_create(key, produce)
+        if key.startswith("w") and not evicted:
+            # Another worker's eviction wins the race once
+            evicted.append(path)
+            os.remove(path)
+        return path
+
+    monkeypatch.setattr(cache, "get_or_create", evicting_get_or_create)
+    with imageproxy.open_resized_image(IMAGE_URL, 320) as fh:
+        assert Image.open(fh).width == 320
+    assert evicted
@@ -0,0 +1,157 @@
+import pytest
+
+from apps.events.ingestion import (
+    IngestionEngine,
+    ListingDone,
+    ScrapedEvent,
+    SourceClient,
+    SourceFinished,
+)
+from apps.events.sources import EventSource
+from apps.events.tests.stubs import StubClient, StubSource, event_page, listing_page
+
+A = "https://a.example"
+B = "https://b.example"
+
+
+def make_client(source, pages, **kwargs):
+    return SourceClient(source, StubClient(pages, **kwargs), log=lambda message: None)
+
+
+def run(engine):
+    items = list(engine.run())
+    events = [item for item in items if isinstance(item, ScrapedEvent)]
+    done = [item.url for item in items if isinstance(item, ListingDone)]
+    finished = {item.source: item.error for item in items if isinstance(item, SourceFinished)}
+    return events, done, finished
+
+
+def test_incomplete_source_fails_when_created():
+    class Incomplete(EventSource):
+        name = "incomplete"
+
+        def listings(self):
+            return []
+
+    with pytest.raises(TypeError, match="abstract"):
+        Incomplete()
+
+
+def test_crawls_every_source_and_scrapes_each_link_once():
+    source_a = StubSource("a", [(f"{A}/concerts", 1), (f"{A}/shows", 2)])
+    pages_a = {
+        f"{A}/concerts": listing_page([f"{A}/e/1", f"{A}/e/2"], next_url=f"{A}/concerts?page=2"),
+        f"{A}/concerts?page=2": listing_page([f"{A}/e/3"]),
+        # /e/2 is on both listings
+        f"{A}/shows": listing_page([f"{A}/e/2", f"{A}/e/4"]),
+        **{f"{A}/e/{n}": event_page(f"A{n}") for n in range(1, 5)},
+    }
+    source_b = StubSource("b", [(f"{B}/all", 3)])
+    pages_b = {
+        f"{B}/all": listing_page([f"{B}/e/1"]),
+        f"{B}/e/1": event_page("B1"),
+    }
+    clients = [make_client(source_a, pages_a), make_client(source_b, pages_b)]
+
+    events, done, finished = run(IngestionEngine(clients, max_pages=5))
+
+    assert sorted(event.url for event in events) == [
+        f"{A}/e/1", f"{A}/e/2", f"{A}/e/3", f"{A}/e/4", f"{B}/e/1"
+    ]
+    assert all(event.data is not None for event in events)
+    # The first listing to show a link decides its category
+    assert {event.url: event.category for event in events}[f"{A}/e/2"] == 1
+    assert sorted(done) == [f"{A}/concerts", f"{A}/shows", f"{B}/all"]
+    assert finished == {"a": None, "b": None}
+    assert clients[0].scraped == 4 and clients[0].failed == 0
+
+
+def test_resumes_from_pending_seen_and_finished_listings():
+    source = StubSource("a", [(f"{A}/concerts", 1), (f"{A}/shows", 2)])
+    pages = {
+        f"{A}/concerts": listing_page([f"{A}/e/1", f"{A}/e/2"]),
+        f"{A}/shows": listing_page([f"{A}/e/3"]),
+        **{f"{A}/e/{n}": event_page(f"A{n}") for n in range(1, 5)},
+    }
+    client = make_client(source, pages)
+    engine = IngestionEngine(
+        [client],
+        max_pages=5,
+        pending={"a": [(f"{A}/e/4", 2)]},
+        seen={f"{A}/e/1"},
+        listings_done={f"{A}/shows"},
+    )
+
+    events, done, _ = run(engine)
+
+    # Pending links come first; seen links and finished listings are skipped
+    assert [event.url for event in events] == [f"{A}/e/4", f"{A}/e/2"]
+    assert done == [f"{A}/concerts"]
+    assert f"{A}/shows" not in client.client.requested
+
+
+def test_unparseable_page_is_reported_as_failed():
+    source = StubSource("a", [(f"{A}/concerts", 1)])
+    pages = {
+        f"{A}/concerts": listing_page([f"{A}/e/1", f"{A}/e/missing"]),
+        f"{A}/e/1": "<html><body>no title</body></html>",
+    }
+    client = make_client(source, pages)
+
+    events, _, _ = run(IngestionEngine([client], max_pages=5))
+
+    assert [event.data for event in events] == [None, None]
+    assert client.failed == 2 and client.scraped == 0
+
+
+def test_listing_with_a_failed_page_is_not_done():
+    source = StubSource("a", [(f"{A}/concerts", 1), (f"{A}/shows", 2)])
+    pages = {
+        f"{A}/concerts": listing_page([f"{A}/e/1"], next_url=f"{A}/concerts?page=2"),
+        f"{A}/shows": listing_page([f"{A}/e/2"], next_url=f"{A}/shows?page=2"),
+        f"{A}/shows?page=2": listing_page([f"{A}/e/2"]),
+        **{f"{A}/e/{n}": event_page(f"A{n}") for n in range(1, 3)},
+    }
+    client = make_client(source, pages, errors=[f"{A}/concerts?page=2"])
+
+    events, done, finished = run(IngestionEngine([client], max_pages=5))
+
+    # Links found before the failure are still scraped; a page without
+    # new links ends the other listing normally
+    assert [event.url for event in events] == [f"{A}/e/1", f"{A}/e/2"]
+    assert done == [f"{A}/shows"]
+    assert finished == {"a": None}
+
+
+def test_open_circuit_aborts_only_that_source():
+    source_a = StubSource("a", [(f"{A}/concerts", 1)])
+    pages_a = {f"{A}/concerts": listing_page([f"{A}/e/1"])}
+    source_b = StubSource("b", [(f"{B}/all", 3)])
+    pages_b = {f"{B}/all": listing_page([f"{B}/e/1"]), f"{B}/e/1": event_page("B1")}
+    clients = [
+        make_client(source_a, pages_a, circuit_open=[f"{A}/e/1"]),
+        make_client(source_b, pages_b),
+    ]
+
+    events, done, finished = run(IngestionEngine(clients, max_pages=5))
+
+    assert clients[0].aborted
+    assert finished["b"] is None and finished["a"] is not None
+    assert [event.url for event in events] == [f"{B}/e/1"]
+    assert done == [f"{B}/all"]
+
+
+def test_consumer_stopping_early_stops_the_threads():
+    links = [f"{A}/e/{n}" for n in range(100)]
+    source = StubSource("a", [(f"{A}/concerts", 1)])
+    pages = {f"{A}/concerts": listing_page(links), **{link: event_page(link) for link in links}}
+    client = make_client(source, pages)
+    engine = IngestionEngine([client], max_pages=5, queue_size=1)
+
+    items = engine.run()
+    first = next(items)
+    items.close()  # joins the source threads
+
+    assert isinstance(first, ScrapedEvent)
+    # The bounded queue kept the producer from running ahead of the consumer
+    assert client.scraped < len(links)
@@ -0,0 +1,32 @@
+import pytest
+from django.core.exceptions import ValidationError
+
+from apps.events.models import Event
+
+
+def test_default_manager_sees_soft_deleted_rows(make_event):
+    event = make_event()
+    event.soft_delete()
+
+    assert Event._default_manager.filter(pk=event.pk).exists()
+    assert not Event.objects.filter(pk=event.pk).exists()
+    assert Event.all_objects.dead().get() == event
+
+
+def test_unique_validation_sees_soft_deleted_rows(make_event):
+    event = make_event()
+    event.soft_delete()
+
+    duplicate = Event(link=event.link)
+    with pytest.raises(ValidationError) as excinfo:
+        duplicate.validate_unique()
+    assert "link" in excinfo.value.message_dict
+
+
+def test_bulk_soft_delete_and_restore(make_event):
+    events = [make_event() for _ in range(3)]
+
+    assert Event.objects.filter(pk__in=[e.pk for e in events[:2]]).soft_delete() == 2
+    assert Event.objects.count() == 1
+    assert Event.all_objects.restore() == 2
+    assert Event.objects.count() == 3
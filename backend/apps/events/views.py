@@ -1,9 +1,17 @@
-from datetime import date
+import logging
 
+import requests
+from django.conf import settings
+from django.http import FileResponse, HttpResponseNotModified
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import viewsets
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.negotiation import BaseContentNegotiation
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.response import Response
 from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
@@ -12,8 +20,40 @@ from drf_spectacular.utils import (
     OpenApiExample,
 )
 
-from apps.events.models import Event, CalendarEvent
-from apps.events.serializers import EventSerializer, CalendarEventSerializer
+from apps.abstracts.routing import ReplicaReadMixin
+from apps.abstracts.search import search
+from apps.events.imageproxy import image_version, is_proxyable, open_resized_image
+from apps.events.models import ArchivedCalendarEvent, Event, CalendarEvent
+from apps.events.serializers import (
+    ArchivedCalendarEventSerializer,
+    CalendarEventSerializer,
+    EventSerializer,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AnyAcceptNegotiation(BaseContentNegotiation):
+    """Serve the endpoint's own media type whatever the client accepts (e.g. image/webp)."""
+
+    def select_parser(self, request, parsers):
+        return parsers[0]
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        return renderers[0], renderers[0].media_type
+
+
+def listed_events():
+    """Events the listing shows: upcoming, not deleted and not merged duplicates."""
+    return (
+        Event.objects.filter(
+            duplicate_of__isnull=True,
+            date__gte=timezone.localdate(),
+        )
+        .select_related('poster')
+        .prefetch_related('translations')
+        .order_by('date', 'start_time')
+    )
 
 
 class EventPagination(PageNumberPagination):
@@ -27,8 +67,9 @@ class EventPagination(PageNumberPagination):
         summary='List upcoming events',
         description=(
             'Returns a paginated list of upcoming events in Almaty '
-            '(date ≥ today, not soft-deleted), ordered chronologically. '
-            'Supports filtering by `category` query parameter.'
+            '(date ≥ today, not soft-deleted, one entry per show even if listed '
+            'under several links), ordered chronologically. '
+            'Supports filtering by `category` and searching by name or artist with `search`.'
         ),
         parameters=[
             OpenApiParameter(
@@ -38,6 +79,13 @@ class EventPagination(PageNumberPagination):
                 description='Filter by event category (0–3).',
                 required=False,
             ),
+            OpenApiParameter(
+                name='search',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Match event names (any language) and artists; typo-tolerant on PostgreSQL.',
+                required=False,
+            ),
             OpenApiParameter(
                 name='page',
                 type=int,
@@ -53,8 +101,8 @@ class EventPagination(PageNumberPagination):
         description='Returns full details of a single event, including all translations.',
     ),
 )
-class EventViewSet(viewsets.ReadOnlyModelViewSet):
-    """Read-only viewset for events (excludes soft-deleted and past)."""
+class EventViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
+    """Read-only viewset for events (excludes soft-deleted, merged duplicates and past)."""
 
     serializer_class = EventSerializer
     permission_classes = [AllowAny]
@@ -63,11 +111,85 @@ class EventViewSet(viewsets.ReadOnlyModelViewSet):
     filterset_fields = ['category']
 
     def get_queryset(self):
-        return (
-            Event.objects.filter(deleted_at__isnull=True, date__gte=date.today())
-            .prefetch_related('translations')
-            .order_by('date', 'start_time')
-        )
+        queryset = listed_events()
+        # No action outside a request (schema generation)
+        if getattr(self, 'action', None) == 'list':
+            query = self.request.query_params.get('search', '')
+            queryset = search(queryset, query, ['translations__name', 'artist'])
+        return queryset
+
+    @extend_schema(
+        tags=['Events'],
+        summary='Event poster through the image proxy',
+        description=(
+            'Returns the event\'s remote poster resized to a whitelisted width as WebP, '
+            'served from a local cache instead of the ticketing site. URLs from the '
+            '`image_srcset` field carry a version (`v`) and are cacheable forever.'
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='w',
+                type=int,
+                location=OpenApiParameter.QUERY,
+                description=f'Width in pixels, one of {", ".join(map(str, settings.IMAGE_PROXY_WIDTHS))}.',
+                required=True,
+            ),
+            OpenApiParameter(
+                name='v',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Image version from `image_srcset`.',
+                required=False,
+            ),
+        ],
+        responses={
+            (200, 'image/webp'): OpenApiResponse(description='Resized poster.'),
+            400: OpenApiResponse(description='Width is not one of the allowed values.'),
+            404: OpenApiResponse(description='Event not found or it has no remote image.'),
+            502: OpenApiResponse(description='The remote image could not be fetched.'),
+        },
+    )
+    @action(
+        detail=True,
+        methods=['get'],
+        url_path='image',
+        url_name='image',
+        content_negotiation_class=AnyAcceptNegotiation,
+    )
+    def image(self, request, pk=None):
+        # Also past events, which the deactivate job soft-deletes: they may
+        # still be on a user's calendar
+        event = get_object_or_404(Event.all_objects, pk=pk)
+        if not is_proxyable(event.image):
+            return Response({'detail': 'Event has no remote image.'}, status=status.HTTP_404_NOT_FOUND)
+        try:
+            width = int(request.query_params.get('w', ''))
+        except ValueError:
+            width = 0
+        if width not in settings.IMAGE_PROXY_WIDTHS:
+            return Response(
+                {'detail': f'w must be one of {list(settings.IMAGE_PROXY_WIDTHS)}.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        version = image_version(event.image)
+        etag = f'"{version}-{width}"'
+        if request.headers.get('If-None-Match') == etag:
+            return HttpResponseNotModified(headers={'ETag': etag})
+        try:
+            image = open_resized_image(event.image, width)
+        except (requests.RequestException, ValueError, OSError):
+            logger.warning('Image proxy failed for event %s (%s)', event.pk, event.image, exc_info=True)
+            return Response({'detail': 'Image unavailable.'}, status=status.HTTP_502_BAD_GATEWAY)
+
+        response = FileResponse(image, content_type='image/webp')
+        response['ETag'] = etag
+        # A versioned URL always names the same bytes; an unversioned one follows the event
+        if request.query_params.get('v') == version:
+            response['Cache-Control'] = 'public, max-age=31536000, immutable'
+        else:
+            response['Cache-Control'] = 'public, max-age=86400'
+        return response
 
 
 @extend_schema_view(
@@ -150,3 +272,32 @@ class CalendarEventViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
+
+    @extend_schema(
+        tags=['Calendar'],
+        summary='Calendar history',
+        description=(
+            'Paginated calendar entries for events that have been archived '
+            '(long past or removed), newest first, with the event details inlined.'
+        ),
+        responses={
+            200: ArchivedCalendarEventSerializer(many=True),
+            401: OpenApiResponse(description='Authentication credentials were not provided or are invalid.'),
+        },
+    )
+    @action(
+        detail=False,
+        methods=['get'],
+        url_path='history',
+        serializer_class=ArchivedCalendarEventSerializer,
+        pagination_class=EventPagination,
+    )
+    def history(self, request):
+        queryset = (
+            ArchivedCalendarEvent.objects.filter(user=request.user)
+            .select_related('event__poster')
+            .prefetch_related('event__translations')
+            .order_by('-event__date', '-event__start_time')
+        )
+        page = self.paginate_queryset(queryset)
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
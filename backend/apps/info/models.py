@@ -1,7 +1,9 @@
 from django.db import models
 
+from apps.abstracts.models import ImageVariantsMixin
 
-class Souvenir(models.Model):
+
+class Souvenir(ImageVariantsMixin):
     """A souvenir shop/item."""
 
     name = models.TextField()
@@ -18,9 +20,12 @@ class Souvenir(models.Model):
         return self.name
 
 
-class App(models.Model):
+class App(ImageVariantsMixin):
     """An app/service listing."""
 
+    # Shown as icons
+    IMAGE_WIDTHS = (128, 256)
+
     name = models.TextField()
     image = models.TextField()
     description = models.TextField()
@@ -34,9 +39,12 @@ class App(models.Model):
         return self.name
 
 
-class Advertisement(models.Model):
+class Advertisement(ImageVariantsMixin):
     """An advertisement/banner."""
 
+    # Full-width banners
+    IMAGE_WIDTHS = (640, 1280, 1920)
+
     image = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -1,14 +1,17 @@
 from rest_framework import serializers
 
+from apps.abstracts.serializers import ImageSetField
 from apps.info.models import Souvenir, App, Advertisement, AdvertisementTranslation
 
 
 class SouvenirSerializer(serializers.ModelSerializer):
     """Serializer for souvenir shops/items."""
 
+    image_set = ImageSetField(help_text='Responsive variants of `image` (null until built).')
+
     class Meta:
         model = Souvenir
-        fields = ['id', 'name', 'address', 'link', 'image']
+        fields = ['id', 'name', 'address', 'link', 'image', 'image_set']
         extra_kwargs = {
             'name': {'help_text': 'Souvenir shop or item name.'},
             'address': {'help_text': 'Shop address.'},
@@ -20,9 +23,11 @@ class SouvenirSerializer(serializers.ModelSerializer):
 class AppSerializer(serializers.ModelSerializer):
     """Serializer for useful mobile apps and services."""
 
+    image_set = ImageSetField(help_text='Responsive variants of `image` (null until built).')
+
     class Meta:
         model = App
-        fields = ['id', 'name', 'image', 'description']
+        fields = ['id', 'name', 'image', 'image_set', 'description']
         extra_kwargs = {
             'name': {'help_text': 'Application name.'},
             'image': {'help_text': 'App icon/image URL or path.'},
@@ -47,11 +52,12 @@ class AdvertisementSerializer(serializers.ModelSerializer):
     """Serializer for advertisements with nested translations."""
 
     translations = AdvertisementTranslationSerializer(many=True, read_only=True)
+    image_set = ImageSetField(help_text='Responsive variants of `image` (null until built).')
 
     class Meta:
         model = Advertisement
         fields = [
-            'id', 'image', 'created_at', 'updated_at',
+            'id', 'image', 'image_set', 'created_at', 'updated_at',
             'is_active', 'priority', 'translations',
         ]
         extra_kwargs = {
@@ -2,6 +2,7 @@ from rest_framework import viewsets
 from rest_framework.permissions import AllowAny
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
+from apps.abstracts.routing import ReplicaReadMixin
 from apps.info.models import Souvenir, App, Advertisement
 from apps.info.serializers import (
     SouvenirSerializer,
@@ -22,7 +23,7 @@ from apps.info.serializers import (
         description='Returns full details of a single souvenir entry.',
     ),
 )
-class SouvenirViewSet(viewsets.ReadOnlyModelViewSet):
+class SouvenirViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """Read-only viewset for souvenir shops and items."""
 
     queryset = Souvenir.objects.all()
@@ -42,7 +43,7 @@ class SouvenirViewSet(viewsets.ReadOnlyModelViewSet):
         description='Returns full details of a single app/service listing.',
     ),
 )
-class AppViewSet(viewsets.ReadOnlyModelViewSet):
+class AppViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """Read-only viewset for useful mobile apps and services."""
 
     queryset = App.objects.all()
@@ -65,7 +66,7 @@ class AppViewSet(viewsets.ReadOnlyModelViewSet):
         description='Returns full details of a single advertisement, including translations.',
     ),
 )
-class AdvertisementViewSet(viewsets.ReadOnlyModelViewSet):
+class AdvertisementViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """Read-only viewset for active promotional advertisements."""
 
     serializer_class = AdvertisementSerializer
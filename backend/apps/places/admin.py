@@ -1,6 +1,7 @@
 from django.contrib import admin
 from unfold.admin import ModelAdmin, TabularInline
 
+from apps.abstracts.admin import SoftDeleteAdminMixin
 from apps.places.models import Place, PlaceTranslation
 
 
@@ -10,9 +11,9 @@ class PlaceTranslationInline(TabularInline):
 
 
 @admin.register(Place)
-class PlaceAdmin(ModelAdmin):
-    list_display = ('id', 'category', 'address', 'created_at')
-    list_filter = ('category',)
+class PlaceAdmin(SoftDeleteAdminMixin, ModelAdmin):
+    list_display = ('id', 'category', 'address', 'created_at', 'deleted_at')
+    list_filter = ('category', ('deleted_at', admin.EmptyFieldListFilter))
     search_fields = ('address',)
     inlines = [PlaceTranslationInline]
 
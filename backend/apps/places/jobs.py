@@ -0,0 +1,13 @@
+"""
+Periodic place jobs run by ``python manage.py run_scheduler``.
+"""
+
+from apps.abstracts.scheduler import register
+from apps.places.serializers import PlaceSerializer
+from apps.places.views import listed_places
+
+
+@register("warm_place_cache", interval=30 * 60, jitter=60, lease_seconds=10 * 60)
+def warm_place_cache() -> None:
+    """Run the (unpaginated) places list query so the map loads from warm DB pages."""
+    PlaceSerializer(listed_places(), many=True).data
@@ -0,0 +1,26 @@
+from django.db import migrations
+
+from apps.abstracts.db import postgres_only
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0002_image_variants'),
+    ]
+
+    operations = [
+        postgres_only(
+            [
+                'CREATE EXTENSION IF NOT EXISTS pg_trgm',
+                'CREATE INDEX IF NOT EXISTS idx_place_address_trgm '
+                'ON places_place USING gin (address gin_trgm_ops)',
+                'CREATE INDEX IF NOT EXISTS idx_placetranslation_name_trgm '
+                'ON places_placetranslation USING gin (name gin_trgm_ops)',
+            ],
+            [
+                'DROP INDEX IF EXISTS idx_placetranslation_name_trgm',
+                'DROP INDEX IF EXISTS idx_place_address_trgm',
+            ],
+        ),
+    ]
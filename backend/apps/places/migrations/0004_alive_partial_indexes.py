@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0003_trigram_search'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='place',
+            name='idx_place_deleted_at',
+        ),
+        migrations.AddIndex(
+            model_name='place',
+            index=models.Index(condition=models.Q(('deleted_at__isnull', True)), fields=['category'], name='idx_place_alive_category'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:57
+
+import django.db.models.manager
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('places', '0004_alive_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterModelManagers(
+            name='place',
+            managers=[
+                ('all_objects', django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
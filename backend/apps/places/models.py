@@ -1,10 +1,10 @@
 from django.db import models
 from django.core.validators import MinValueValidator
 
-from apps.abstracts.models import AbstractBaseModel
+from apps.abstracts.models import AbstractBaseModel, ImageVariantsMixin
 
 
-class Place(AbstractBaseModel):
+class Place(ImageVariantsMixin, AbstractBaseModel):
     """A place/attraction in Almaty."""
 
     class Category(models.IntegerChoices):
@@ -23,7 +23,11 @@ class Place(AbstractBaseModel):
     class Meta:
         db_table = 'places_place'
         indexes = [
-            models.Index(fields=['deleted_at'], name='idx_place_deleted_at'),
+            models.Index(
+                fields=['category'],
+                condition=models.Q(deleted_at__isnull=True),
+                name='idx_place_alive_category',
+            ),
         ]
         verbose_name = 'Place'
         verbose_name_plural = 'Places'
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 
+from apps.abstracts.serializers import ImageSetField
 from apps.places.models import Place, PlaceTranslation
 
 
@@ -21,11 +22,12 @@ class PlaceSerializer(serializers.ModelSerializer):
     """Serializer for Place with nested translations and geo-coordinates."""
 
     translations = PlaceTranslationSerializer(many=True, read_only=True)
+    image_set = ImageSetField(help_text='Responsive variants of `image` (null until built).')
 
     class Meta:
         model = Place
         fields = [
-            'id', 'image', 'category', 'address', 'link',
+            'id', 'image', 'image_set', 'category', 'address', 'link',
             'lat', 'lng',
             'created_at', 'updated_at', 'translations',
         ]
@@ -3,17 +3,25 @@ from rest_framework import viewsets
 from rest_framework.permissions import AllowAny
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 
+from apps.abstracts.routing import ReplicaReadMixin
+from apps.abstracts.search import search
 from apps.places.models import Place
 from apps.places.serializers import PlaceSerializer
 
 
+def listed_places():
+    """Places the map and list show: everything not soft-deleted."""
+    # Ordered, so pages of the paginated list do not overlap
+    return Place.objects.prefetch_related('translations').order_by('id')
+
+
 @extend_schema_view(
     list=extend_schema(
         tags=['Places'],
         summary='List places and attractions',
         description=(
             'Returns all places/attractions in Almaty (excluding soft-deleted). '
-            'Supports filtering by `category` query parameter.'
+            'Supports filtering by `category` and searching by name or address with `search`.'
         ),
         parameters=[
             OpenApiParameter(
@@ -23,6 +31,13 @@ from apps.places.serializers import PlaceSerializer
                 description='Filter by place category (0–3).',
                 required=False,
             ),
+            OpenApiParameter(
+                name='search',
+                type=str,
+                location=OpenApiParameter.QUERY,
+                description='Match place names (any language) and addresses; typo-tolerant on PostgreSQL.',
+                required=False,
+            ),
         ],
     ),
     retrieve=extend_schema(
@@ -31,7 +46,7 @@ from apps.places.serializers import PlaceSerializer
         description='Returns full details of a single place, including translations and coordinates.',
     ),
 )
-class PlaceViewSet(viewsets.ReadOnlyModelViewSet):
+class PlaceViewSet(ReplicaReadMixin, viewsets.ReadOnlyModelViewSet):
     """Read-only viewset for places (excludes soft-deleted)."""
 
     serializer_class = PlaceSerializer
@@ -40,4 +55,9 @@ class PlaceViewSet(viewsets.ReadOnlyModelViewSet):
     filterset_fields = ['category']
 
     def get_queryset(self):
-        return Place.objects.filter(deleted_at__isnull=True).prefetch_related('translations')
+        queryset = listed_places()
+        # No action outside a request (schema generation)
+        if getattr(self, 'action', None) == 'list':
+            query = self.request.query_params.get('search', '')
+            queryset = search(queryset, query, ['translations__name', 'address'])
+        return queryset
@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+"""
+Generate a large, realistic synthetic dataset for load and scale testing:
+users, places and events with translations in every language, and
+calendar entries. Output is deterministic for a given --seed
+(event dates are relative to today), and each row depends only on its
+index, so a larger run extends a smaller one with the same seed.
+
+Synthetic rows are recognised by SYNTHETIC_HOST in their link (events,
+places) or email (users), never by id: re-running updates the rows of an
+earlier run instead of adding more, and --purge removes exactly those
+rows, whatever ids real rows created in between were given.
+
+Usage:
+    python manage.py generate_synthetic --events 100000 --places 10000 --users 50000 --calendar 1000000
+    python manage.py generate_synthetic --events 1000 --seed 7
+    python manage.py generate_synthetic --purge
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from datetime import date, time as dtime, timedelta
+from typing import Any, Iterator
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.abstracts.bulk import UpsertStats, bulk_upsert
+from apps.events.models import ArchivedEvent, CalendarEvent, Event, EventTranslation
+from apps.places.models import Place, PlaceTranslation
+from apps.users.models import CustomUser
+
+SYNTHETIC_HOST = "synthetic.almatour.kz"
+SYNTHETIC_LINK = f"https://{SYNTHETIC_HOST}/"
+SYNTHETIC_EMAIL = f"@{SYNTHETIC_HOST}"
+SYNTHETIC_PASSWORD = "SyntheticPass123"
+
+# Almaty city limits, roughly
+LAT_RANGE = (43.14, 43.36)
+LNG_RANGE = (76.78, 77.10)
+
+# (lat, lng, weight) of busy districts; places and venues cluster around them
+HOTSPOTS = [
+    (43.2380, 76.9455, 5),  # Abay / Dostyk, city centre
+    (43.2567, 76.9286, 3),  # Zhibek Zholy / Arbat
+    (43.2621, 76.9532, 3),  # Panfilov Park, Green Bazaar
+    (43.2330, 76.9566, 2),  # Kok-Tobe foothills
+    (43.2185, 76.9280, 2),  # Al-Farabi / Esentai
+    (43.2022, 76.8920, 1),  # Mega Alma-Ata
+    (43.2360, 76.9100, 2),  # Auezov theatre / Sayakhat
+    (43.2510, 76.8850, 1),  # Sairan
+    (43.2720, 76.9400, 1),  # Tastak / Ainabulak
+    (43.1570, 77.0590, 1),  # Medeu
+]
+
+# Language ids as used across the API: 0=en, 1=ru, 2=kz, 3=tr
+LANGUAGES = (0, 1, 2, 3)
+
+EVENT_WORDS = {
+    0: (("Jazz", "Rock", "Stand-up", "Theatre", "Art", "Folk", "Electronic", "Classical"),
+        ("Night", "Evening", "Festival", "Show", "Concert", "Marathon", "Party", "Week")),
+    1: (("Джазовый", "Рок", "Стендап", "Театральный", "Арт", "Фолк", "Электронный", "Классический"),
+        ("вечер", "концерт", "фестиваль", "шоу", "марафон", "спектакль", "лекторий", "квартирник")),
+    2: (("Джаз", "Рок", "Стендап", "Театр", "Өнер", "Фольклор", "Электрондық", "Классикалық"),
+        ("кеші", "концерті", "фестивалі", "шоуы", "марафоны", "қойылымы", "апталығы", "кездесуі")),
+    3: (("Caz", "Rock", "Stand-up", "Tiyatro", "Sanat", "Halk", "Elektronik", "Klasik"),
+        ("Gecesi", "Akşamı", "Festivali", "Gösterisi", "Konseri", "Maratonu", "Partisi", "Haftası")),
+}
+
+PLACE_WORDS = {
+    0: (("Museum", "Park", "Gallery", "Square", "Cathedral", "Bazaar", "Theatre", "Viewpoint"),
+        ("of Arts", "of History", "Central", "Botanical", "Old Town", "Mountain", "Riverside", "Golden")),
+    1: (("Музей", "Парк", "Галерея", "Площадь", "Собор", "Базар", "Театр", "Смотровая"),
+        ("искусств", "истории", "Центральный", "Ботанический", "Старый город", "Горный", "У реки", "Золотой")),
+    2: (("Мұражайы", "Саябағы", "Галереясы", "Алаңы", "Соборы", "Базары", "Театры", "Көрікті жер"),
+        ("Өнер", "Тарих", "Орталық", "Ботаникалық", "Ескі қала", "Тау", "Өзен жағасы", "Алтын")),
+    3: (("Müzesi", "Parkı", "Galerisi", "Meydanı", "Katedrali", "Pazarı", "Tiyatrosu", "Seyir Noktası"),
+        ("Sanat", "Tarih", "Merkez", "Botanik", "Eski Şehir", "Dağ", "Nehir Kenarı", "Altın")),
+}
+
+DESCRIPTIONS = {
+    0: "A synthetic listing generated for load testing.",
+    1: "Синтетическая запись для нагрузочного тестирования.",
+    2: "Жүктемелік тестілеуге арналған синтетикалық жазба.",
+    3: "Yük testi için oluşturulmuş sentetik kayıt.",
+}
+
+TIMETABLES = {
+    0: "Daily 10:00–20:00",
+    1: "Ежедневно 10:00–20:00",
+    2: "Күн сайын 10:00–20:00",
+    3: "Her gün 10:00–20:00",
+}
+
+STREETS = (
+    "пр. Абая", "пр. Достык", "ул. Панфилова", "ул. Жибек Жолы", "пр. Аль-Фараби",
+    "ул. Кабанбай батыра", "ул. Толе би", "пр. Сейфуллина", "ул. Гоголя", "ул. Фурманова",
+)
+
+
+class Command(BaseCommand):
+    help = "Generate a deterministic synthetic dataset for load and scale testing"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--events", type=int, default=0, help="Events to generate")
+        parser.add_argument("--places", type=int, default=0, help="Places to generate")
+        parser.add_argument("--users", type=int, default=0, help="Users to generate")
+        parser.add_argument(
+            "--calendar",
+            type=int,
+            default=0,
+            help="Calendar entries to generate (at most users x events)",
+        )
+        parser.add_argument("--seed", type=int, default=1, help="Random seed (default: 1)")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=2000,
+            help="Rows per INSERT (default: 2000)",
+        )
+        parser.add_argument(
+            "--purge",
+            action="store_true",
+            help="Delete all previously generated synthetic rows and exit",
+        )
+
+    def handle(self, *args: Any, **kwargs: Any) -> None:
+        if kwargs["purge"]:
+            self._purge()
+            return
+
+        counts = {name: kwargs[name] for name in ("events", "places", "users", "calendar")}
+        if any(n < 0 for n in counts.values()):
+            raise CommandError("Counts must not be negative")
+        if counts["calendar"] > counts["users"] * counts["events"]:
+            raise CommandError("--calendar cannot exceed --users x --events")
+
+        self.seed = kwargs["seed"]
+        self.batch_size = max(kwargs["batch_size"], 1)
+        self.today = timezone.localdate()
+
+        steps = [
+            ("places", self._places, PlaceTranslation, self._place_translations),
+            ("events", self._events, EventTranslation, self._event_translations),
+        ]
+        started = timezone.now()
+        stats: list[UpsertStats] = []
+        ids: dict[str, dict[str, int]] = {}
+        if counts["users"]:
+            stat, ids["users"] = self._upsert_marked(CustomUser, self._users(counts["users"]), "email")
+            stats.append(stat)
+        for name, rows, translation_model, translations in steps:
+            if counts[name]:
+                model = Place if name == "places" else Event
+                stat, ids[name] = self._upsert_marked(model, rows(counts[name]), "link")
+                stats.append(stat)
+                key = ["place_id" if name == "places" else "event_id", "language_id"]
+                stats.append(
+                    self._upsert(translation_model, translations(counts[name], ids[name]), key)
+                )
+        if counts["calendar"]:
+            stats.append(
+                self._upsert(
+                    CalendarEvent,
+                    self._calendar(
+                        counts["calendar"], counts["users"], counts["events"],
+                        ids["users"], ids["events"],
+                    ),
+                    ["user_id", "event_id"],
+                )
+            )
+
+        for item in stats:
+            self.stdout.write(f"  {item}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Done! {sum(item.rows for item in stats)} synthetic rows "
+                f"(seed {self.seed}) in {(timezone.now() - started).total_seconds():.1f} sec"
+            )
+        )
+
+    def _upsert(self, model: Any, rows: Iterator[dict[str, Any]], key: list[str]) -> UpsertStats:
+        # One transaction per table: on SQLite this avoids a journal sync per chunk
+        with transaction.atomic():
+            return bulk_upsert(model, rows, unique_fields=key, batch_size=self.batch_size)
+
+    def _upsert_marked(
+        self,
+        model: Any,
+        rows: Iterator[dict[str, Any]],
+        marker: str,
+    ) -> tuple[UpsertStats, dict[str, int]]:
+        """
+        Upsert rows matched on their ``marker`` column (synthetic link or
+        email), not on id: rows of an earlier run keep their ids, new ones
+        get the next free id. Returns the stats and {marker: id}.
+        """
+        existing = synthetic_ids(model)
+        stats = self._upsert(
+            model,
+            ({**row, "id": existing[row[marker]]} if row[marker] in existing else row for row in rows),
+            ["id"],
+        )
+        return stats, synthetic_ids(model)
+
+    def _rng(self, stream: str) -> random.Random:
+        """Independent generator per table, so changing one count leaves the rest as is."""
+        return random.Random(f"{self.seed}:{stream}")
+
+    # ------------------------------------------------------------------
+    # Row generators
+    # ------------------------------------------------------------------
+
+    def _users(self, n: int) -> Iterator[dict[str, Any]]:
+        # Hashing is deliberately slow; every synthetic user shares one hash
+        password = make_password(SYNTHETIC_PASSWORD, salt=f"synthetic{self.seed}")
+        joined = timezone.now() - timedelta(days=365)
+        rng = self._rng("users")
+        for i in range(n):
+            yield {
+                "username": f"synthetic{i}",
+                "email": _user_email(i),
+                "phone": f"+7799{i:07d}",
+                "password": password,
+                "is_active": True,
+                "date_joined": joined + timedelta(minutes=rng.randrange(365 * 24 * 60)),
+            }
+
+    def _places(self, n: int) -> Iterator[dict[str, Any]]:
+        rng = self._rng("places")
+        for i in range(n):
+            lat, lng = self._point(rng)
+            yield {
+                "image": f"https://picsum.photos/seed/place{i}/800/600",
+                "category": rng.randrange(4),
+                "address": self._address(rng),
+                "link": _place_link(i),
+                "lat": lat,
+                "lng": lng,
+                "deleted_at": None,
+            }
+
+    def _place_translations(self, n: int, ids: dict[str, int]) -> Iterator[dict[str, Any]]:
+        rng = self._rng("place_names")
+        for i in range(n):
+            kind, qualifier = rng.randrange(8), rng.randrange(8)
+            for language_id in LANGUAGES:
+                nouns, adjectives = PLACE_WORDS[language_id]
+                yield {
+                    "place_id": ids[_place_link(i)],
+                    "language_id": language_id,
+                    "name": f"{adjectives[qualifier]} {nouns[kind]} #{i}",
+                    "timetable": TIMETABLES[language_id],
+                    "description": DESCRIPTIONS[language_id],
+                }
+
+    def _events(self, n: int) -> Iterator[dict[str, Any]]:
+        rng = self._rng("events")
+        for i in range(n):
+            event_date = self._event_date(rng)
+            evening = rng.random() < 0.75
+            yield {
+                "image": f"https://picsum.photos/seed/event{i}/545/305",
+                "date": event_date,
+                "start_time": dtime(rng.choice((18, 19, 19, 20, 20, 21)) if evening else rng.randint(10, 16),
+                                    rng.choice((0, 0, 30))),
+                "duration": rng.choice((60, 90, 90, 120, 120, 150, 180)),
+                # random() rather than randrange(): draws the same bits whatever --events is
+                "artist": f"Synthetic Artist {int(rng.random() * max(n // 20, 1))}",
+                "cost": 0 if rng.random() < 0.15 else int(rng.lognormvariate(8.7, 0.6)) // 500 * 500,
+                "currency": "KZT",
+                "category": rng.randrange(4),
+                "address": self._address(rng),
+                "link": _event_link(i),
+                "deleted_at": None,
+            }
+
+    def _event_translations(self, n: int, ids: dict[str, int]) -> Iterator[dict[str, Any]]:
+        rng = self._rng("event_names")
+        for i in range(n):
+            genre, kind = rng.randrange(8), rng.randrange(8)
+            for language_id in LANGUAGES:
+                genres, kinds = EVENT_WORDS[language_id]
+                yield {
+                    "event_id": ids[_event_link(i)],
+                    "language_id": language_id,
+                    "name": f"{genres[genre]} {kinds[kind]} #{i}",
+                    "description": DESCRIPTIONS[language_id],
+                }
+
+    def _calendar(
+        self,
+        n: int,
+        users: int,
+        events: int,
+        user_ids: dict[str, int],
+        event_ids: dict[str, int],
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Unique (user, event) pairs: user k % users saves their (k // users)-th
+        event, counted from a random per-user offset, so no pair repeats.
+        """
+        rng = self._rng("calendar")
+        offsets = [rng.randrange(events) for _ in range(users)]
+        for k in range(n):
+            user, nth = k % users, k // users
+            yield {
+                "user_id": user_ids[_user_email(user)],
+                "event_id": event_ids[_event_link((offsets[user] + nth) % events)],
+                "status": 1 if rng.random() < 0.6 else 0,
+            }
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _point(self, rng: random.Random) -> tuple[float, float]:
+        """A point near a weighted hotspot, clamped to the city limits."""
+        lat, lng, _ = rng.choices(HOTSPOTS, weights=[w for *_, w in HOTSPOTS])[0]
+        # About 1.5 km standard deviation
+        lat = min(max(rng.gauss(lat, 0.0135), LAT_RANGE[0]), LAT_RANGE[1])
+        lng = min(max(rng.gauss(lng, 0.0135 / math.cos(math.radians(lat))), LNG_RANGE[0]), LNG_RANGE[1])
+        return round(lat, 6), round(lng, 6)
+
+    def _address(self, rng: random.Random) -> str:
+        return f"{rng.choice(STREETS)}, {rng.randint(1, 250)}"
+
+    def _event_date(self, rng: random.Random) -> date:
+        """
+        Mostly the coming weeks, thinning out over a year, with Friday and
+        Saturday nights overrepresented; about 10% already in the past.
+        """
+        if rng.random() < 0.1:
+            return self.today - timedelta(days=rng.randint(1, 180))
+        day = self.today + timedelta(days=min(int(rng.expovariate(1 / 30)), 365))
+        if day.weekday() < 4 and rng.random() < 0.4:
+            day += timedelta(days=4 - day.weekday() + rng.randrange(2))
+        return day
+
+    def _purge(self) -> None:
+        """Delete synthetic rows, dependents first, in chunks of ids to keep deletes small."""
+        step = 10_000
+        deleted = 0
+        with transaction.atomic():
+            deleted += CalendarEvent.objects.filter(
+                Q(user__email__endswith=SYNTHETIC_EMAIL) | Q(event__link__startswith=SYNTHETIC_LINK)
+            ).delete()[0]
+            deleted += EventTranslation.objects.filter(event__link__startswith=SYNTHETIC_LINK).delete()[0]
+            deleted += PlaceTranslation.objects.filter(place__link__startswith=SYNTHETIC_LINK).delete()[0]
+            # Archived synthetic events go with their translations and calendar entries
+            for model in (ArchivedEvent, Event, Place, CustomUser):
+                ids = sorted(synthetic_ids(model).values())
+                for start in range(0, len(ids), step):
+                    deleted += model._base_manager.filter(id__in=ids[start:start + step]).delete()[0]
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} synthetic rows"))
+
+
+def _user_email(index: int) -> str:
+    return f"user{index}{SYNTHETIC_EMAIL}"
+
+
+def _place_link(index: int) -> str:
+    return f"{SYNTHETIC_LINK}place/{index}"
+
+
+def _event_link(index: int) -> str:
+    return f"{SYNTHETIC_LINK}event/{index}"
+
+
+def synthetic_ids(model: Any) -> dict[str, int]:
+    """{link or email: id} of the model's synthetic rows, soft-deleted ones included."""
+    if model is CustomUser:
+        marker, lookup = "email", Q(email__endswith=SYNTHETIC_EMAIL)
+    else:
+        marker, lookup = "link", Q(link__startswith=SYNTHETIC_LINK)
+    return dict(model._base_manager.filter(lookup).values_list(marker, "id"))
@@ -0,0 +1,71 @@
+from datetime import date, time
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from apps.events.models import CalendarEvent, Event, EventTranslation
+from apps.places.models import Place
+from apps.users.models import CustomUser
+
+pytestmark = pytest.mark.django_db
+
+COUNTS = {"events": 20, "places": 5, "users": 4, "calendar": 30}
+
+
+def generate(**counts):
+    call_command("generate_synthetic", stdout=StringIO(), **{**COUNTS, **counts})
+
+
+def create_real_event():
+    event = Event.objects.create(
+        image="https://example.com/poster.jpg",
+        date=date(2026, 11, 1),
+        start_time=time(19, 0),
+        duration=120,
+        artist="Real Artist",
+        category=Event.Category.CATEGORY_0,
+        address="Abay Opera House",
+        link="https://example.com/event/real",
+    )
+    EventTranslation.objects.create(event=event, language_id=0, name="Real", description="")
+    return event
+
+
+def test_rerun_updates_synthetic_rows_only(django_user_model):
+    generate()
+    real = create_real_event()
+    user = django_user_model.objects.create_user(
+        email="real@example.com", username="real", phone="+77011234567", password="x"
+    )
+    CalendarEvent.objects.create(user=user, event=real, status=1)
+
+    generate()
+    generate(events=40, users=8, calendar=0)
+
+    assert Event.objects.count() == 41
+    assert CustomUser.objects.count() == 9
+    assert EventTranslation.objects.count() == 40 * 4 + 1
+    assert CalendarEvent.objects.count() == 31
+    real.refresh_from_db()
+    assert (real.artist, real.link) == ("Real Artist", "https://example.com/event/real")
+    assert EventTranslation.objects.get(event=real).name == "Real"
+
+
+def test_purge_keeps_real_rows_created_after_a_run(django_user_model):
+    generate()
+    # Real rows now get ids after the synthetic ones
+    real = create_real_event()
+    user = django_user_model.objects.create_user(
+        email="real@example.com", username="real", phone="+77011234567", password="x"
+    )
+    CalendarEvent.objects.create(user=user, event=real, status=1)
+    assert real.id > Event.objects.exclude(pk=real.pk).order_by("-id").first().id
+
+    call_command("generate_synthetic", purge=True, stdout=StringIO())
+
+    assert list(Event.all_objects.all()) == [real]
+    assert EventTranslation.objects.get().event == real
+    assert list(CustomUser.objects.all()) == [user]
+    assert CalendarEvent.objects.get().event == real
+    assert not Place.all_objects.exists()
@@ -6,6 +6,9 @@ mkdir -p /app/data
 echo "Running migrations..."
 python manage.py migrate --noinput
 
+# Start the SQLite read replica (if enabled) from the migrated schema
+python manage.py refresh_replica --if-enabled
+
 echo "Collecting static files..."
 python manage.py collectstatic --noinput
 
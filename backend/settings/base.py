@@ -2,6 +2,9 @@
 
 import os
 
+# Django modules
+from django.core.exceptions import ImproperlyConfigured
+
 # Project modules
 from settings.conf import *
 
@@ -58,6 +61,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "apps.abstracts.routing.ReplicaRoutingMiddleware",
 ]
 
 TEMPLATES = [
@@ -83,11 +87,125 @@ AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
 ]
 
+# ----------------------------------------------
+# Database
+#
+# Pragmas applied to every new SQLite connection (apps.abstracts.db).
+# WAL lets the API keep reading while the scraper writes; busy_timeout
+# makes writers queue for the lock instead of failing at once.
+SQLITE_PRAGMAS = {
+    # Only takes effect on a new database file, so it comes before the
+    # journal mode; lets db_maintenance return free pages in small steps
+    "auto_vacuum": config("SQLITE_AUTO_VACUUM", default="INCREMENTAL"),
+    "journal_mode": config("SQLITE_JOURNAL_MODE", default="WAL"),
+    "synchronous": config("SQLITE_SYNCHRONOUS", default="NORMAL"),
+    "busy_timeout": config("SQLITE_BUSY_TIMEOUT_MS", default=5000, cast=int),
+    "mmap_size": config("SQLITE_MMAP_SIZE", default=256 * 1024 * 1024, cast=int),
+    # Negative: KiB rather than pages, so 64 MiB per connection
+    "cache_size": config("SQLITE_CACHE_SIZE", default=-64 * 1024, cast=int),
+    "temp_store": config("SQLITE_TEMP_STORE", default="MEMORY"),
+}
+SQLITE_OPTIONS = {
+    # Take the write lock when a transaction starts, so a read-then-write
+    # transaction waits for busy_timeout instead of failing with
+    # "database is locked" when another writer got there first
+    "transaction_mode": "IMMEDIATE",
+}
+# Seconds a connection is reused across requests (0 = per request)
+DB_CONN_MAX_AGE = config("DB_CONN_MAX_AGE", default=600, cast=int)
+
+# "sqlite" (single file, one writer) or "postgres"
+DB_ENGINE_OPTIONS = ("sqlite", "postgres")
+DB_ENGINE = config("DB_ENGINE", default="sqlite")
+if DB_ENGINE not in DB_ENGINE_OPTIONS:
+    raise ImproperlyConfigured(
+        f"DB_ENGINE must be one of {', '.join(DB_ENGINE_OPTIONS)}, got {DB_ENGINE!r}"
+    )
+# psycopg connection pool per process instead of one persistent
+# connection; worth it with threaded workers (max_size 0 = disabled)
+DB_POOL_MIN_SIZE = config("DB_POOL_MIN_SIZE", default=2, cast=int)
+DB_POOL_MAX_SIZE = config("DB_POOL_MAX_SIZE", default=0, cast=int)
+
+if DB_ENGINE == "postgres":
+    # Trigram lookups for search (apps.abstracts.search)
+    INSTALLED_APPS.append("django.contrib.postgres")
+
+
+# Read replica for the public read-only API (apps.abstracts.routing):
+# a PostgreSQL standby at POSTGRES_REPLICA_HOST or, with SQLite, a copy
+# of the database file refreshed by the refresh_replica job
+REPLICA_DB = "replica"
+POSTGRES_REPLICA_HOST = config("POSTGRES_REPLICA_HOST", default="")
+SQLITE_REPLICA = config("SQLITE_REPLICA", default=False, cast=bool)
+SQLITE_REPLICA_REFRESH_SECONDS = config("SQLITE_REPLICA_REFRESH_SECONDS", default=60, cast=int)
+# Seconds a client's reads stay on the primary after it wrote something,
+# so it sees its own changes despite replica lag
+REPLICA_PIN_SECONDS = config("REPLICA_PIN_SECONDS", default=15, cast=int)
+DATABASE_ROUTERS = ["apps.abstracts.routing.ReplicaRouter"]
+
+
+def database_settings(sqlite_path: str) -> dict:
+    """DATABASES for the configured DB_ENGINE, with the replica if enabled."""
+    if DB_ENGINE == "sqlite":
+        default = {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": sqlite_path,
+            "OPTIONS": SQLITE_OPTIONS,
+            "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+            "CONN_HEALTH_CHECKS": True,
+        }
+        if not SQLITE_REPLICA:
+            return {"default": default}
+        root, ext = os.path.splitext(sqlite_path)
+        replica = {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": f"file:{root}.replica{ext}?mode=ro",
+            "OPTIONS": {"uri": True},
+            # The copy is replaced on refresh; a new connection per request sees it
+            "CONN_MAX_AGE": 0,
+            "TEST": {"MIRROR": "default"},
+        }
+        return {"default": default, REPLICA_DB: replica}
+
+    options = {}
+    if DB_POOL_MAX_SIZE:
+        options["pool"] = {
+            "min_size": DB_POOL_MIN_SIZE,
+            "max_size": DB_POOL_MAX_SIZE,
+            "timeout": 10,
+        }
+    default = {
+        "ENGINE": "django.db.backends.postgresql",
+        "NAME": config("POSTGRES_DB", default="almatour"),
+        "USER": config("POSTGRES_USER", default="almatour"),
+        "PASSWORD": config("POSTGRES_PASSWORD", default=""),
+        "HOST": config("POSTGRES_HOST", default="localhost"),
+        "PORT": config("POSTGRES_PORT", default=5432, cast=int),
+        "OPTIONS": options,
+        # The pool manages connection lifetime itself
+        "CONN_MAX_AGE": 0 if DB_POOL_MAX_SIZE else DB_CONN_MAX_AGE,
+        "CONN_HEALTH_CHECKS": True,
+    }
+    if not POSTGRES_REPLICA_HOST:
+        return {"default": default}
+    replica = {
+        **default,
+        "HOST": POSTGRES_REPLICA_HOST,
+        "PORT": config("POSTGRES_REPLICA_PORT", default=default["PORT"], cast=int),
+        "TEST": {"MIRROR": "default"},
+    }
+    return {"default": default, REPLICA_DB: replica}
+
+# Events this many days past (or soft-deleted) move to the archive tables
+EVENT_ARCHIVE_AFTER_DAYS = config("EVENT_ARCHIVE_AFTER_DAYS", default=30, cast=int)
+
 # ----------------------------------------------
 # Internationalization
 #
 LANGUAGE_CODE = "en-us"
-TIME_ZONE = "UTC"
+# Events, "today" and the scheduler's cron times are Almaty wall-clock
+# time; datetimes are still stored in UTC (USE_TZ)
+TIME_ZONE = config("TIME_ZONE", default="Asia/Almaty")
 USE_I18N = True
 USE_TZ = True
 
@@ -99,6 +217,18 @@ STATIC_ROOT = os.path.join(BASE_DIR, "static")
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
+# Event image proxy: resized copies of remote posters, LRU-evicted
+IMAGE_PROXY_CACHE_DIR = os.path.join(BASE_DIR, "data", "image_cache")
+IMAGE_PROXY_CACHE_BYTES = config("IMAGE_PROXY_CACHE_BYTES", default=512 * 1024 * 1024, cast=int)
+IMAGE_PROXY_WIDTHS = (320, 640, 1024)
+# Hosts the proxy may fetch from (subdomains included); anything else in
+# scraped data is refused, so it cannot make the server call internal URLs
+IMAGE_PROXY_ALLOWED_HOSTS = tuple(
+    host.strip().lower()
+    for host in config("IMAGE_PROXY_ALLOWED_HOSTS", default="sxodim.com").split(",")
+    if host.strip()
+)
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 AUTH_USER_MODEL = "users.CustomUser"
@@ -135,7 +265,12 @@ UNFOLD = {
                 "items": [
                     {"model": "events.Event"},
                     {"model": "events.EventTranslation"},
+                    {"model": "events.PosterImage"},
                     {"model": "events.CalendarEvent"},
+                    {"model": "events.ArchivedEvent"},
+                    {"model": "events.ArchivedCalendarEvent"},
+                    {"model": "events.CrawlURL"},
+                    {"model": "events.CrawlRun"},
                 ],
             },
             {
@@ -148,6 +283,13 @@ UNFOLD = {
                     {"model": "info.AdvertisementTranslation"},
                 ],
             },
+            {
+                "label": "Scheduler",
+                "icon": "schedule",
+                "items": [
+                    {"model": "abstracts.JobLease"},
+                ],
+            },
         ]
     },
 }
@@ -9,9 +9,4 @@ from settings.base import *
 DEBUG = True
 ALLOWED_HOSTS = ['localhost', '127.0.0.1']
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': os.path.join(BASE_DIR, "db.sqlite3"),
-    }
-}
+DATABASES = database_settings(os.path.join(BASE_DIR, "db.sqlite3"))
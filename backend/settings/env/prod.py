@@ -12,12 +12,7 @@ ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='localhost').split(',')
 
 SECRET_KEY = config('SECRET_KEY', default=SECRET_KEY)
 
-DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': os.path.join(BASE_DIR, 'data', 'db.sqlite3'),
-    }
-}
+DATABASES = database_settings(os.path.join(BASE_DIR, 'data', 'db.sqlite3'))
 
 # Trust the X-Forwarded-Proto header from nginx
 SECURE_PROXY_SSL_HEADER = ('HTTP_X_FORWARDED_PROTO', 'https')